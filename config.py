@@ -61,12 +61,53 @@ JOB_SEARCH_KEYWORDS = [
     "stage java",
 ]
 
+# Keyword budget scheduling (splits a global budget by each keyword's historical yield of new jobs)
+KEYWORD_SCHEDULING = True  # Allocate job/time budgets per keyword from history instead of the same effort for all
+KEYWORD_HISTORY_PATH = 'data/keyword_yield.json'  # Per-keyword new vs duplicate yield history
+GLOBAL_JOB_BUDGET = 0  # New jobs per run across all keywords (0 means unlimited)
+GLOBAL_TIME_BUDGET_MINUTES = 0  # Scraping time per run across all keywords (0 means unlimited)
+KEYWORD_YIELD_PRIOR = 5.0  # Expected new jobs for a keyword with no history
+KEYWORD_YIELD_ALPHA = 0.3  # Weight of the latest run in the smoothed yield
+KEYWORD_DEAD_MIN_RUNS = 3  # Runs before a keyword can be considered dead
+KEYWORD_DEAD_THRESHOLD = 0.5  # Smoothed new jobs per run below which a keyword only gets a probe
+KEYWORD_PROBE_MAX_JOBS = 2  # Job limit of a probe run
+KEYWORD_PROBE_MAX_SCROLLS = 1  # Scroll attempts of a probe run
+
 # LinkedIn Configuration
 STOP_AFTER_EXISTING_POSTS = 5  # Stop after finding this many consecutive existing posts
+DECODE_ACTIVITY_TIMESTAMPS = True  # Take the exact post time from the activity ID instead of reading and parsing the relative time ("3d")
+LINKEDIN_EARLY_STOP = True  # Read the new posts' IDs first and stop before extracting once STOP_AFTER_EXISTING_POSTS consecutive ones were saved in earlier runs
+BATCHED_POST_EXTRACTION = True  # Read all visible LinkedIn posts' fields with a single page evaluate instead of per-element queries
+LINKEDIN_NETWORK_CAPTURE_MODE = False  # Build saved posts from the Voyager API responses the page loads (full content, no "see more"), falling back to the DOM per field (entity field paths not yet verified against live responses)
+LINKEDIN_CAPTURE_URL_PATTERNS = ['/voyager/api/graphql', '/voyager/api/search/dash/clusters']  # Response URLs parsed for saved posts
+# Key paths of post fields inside a saved-post entity of a Voyager response (unverified - check them against a recorded live response before enabling LINKEDIN_NETWORK_CAPTURE_MODE)
+LINKEDIN_VOYAGER_ENTITY_FIELDS = {
+    'person_name': ['title', 'text'],
+    'person_link': ['actorNavigationUrl'],
+    'heading': ['primarySubtitle', 'text'],
+    'posted_time': ['secondarySubtitle', 'text'],
+    'post_content': ['summary', 'text'],
+}
+LINKEDIN_VOYAGER_URN_FIELDS = ['trackingUrn', 'entityUrn', 'navigationUrl']  # Entity keys searched for the post's activity URN
+LINKEDIN_ID_BATCH_SIZE = 10  # New post IDs written to the post database in one insert (the rest are flushed when the run ends)
 # General Scraper Configuration
 MAX_SCROLL_ATTEMPTS = 3
+INCREMENTAL_SCROLL_PROCESSING = True  # After each scroll, only visit job/post cards loaded since the previous pass
+CHECKPOINT_PATH = 'data/google_jobs/run_checkpoint.json'  # Progress of the current multi-keyword run, used by --resume
+SESSION_DEDUP_MAX_ENTRIES = 50000  # Postings remembered across keywords within one run (oldest evicted first)
+KEYWORD_CONCURRENCY = 1  # Number of pages scraping different Google Jobs keywords at the same time (1 = sequential)
+HASH_STORE_PERSISTENT = True  # Keep one WAL connection open for the job hash store instead of reconnecting per lookup
+HASH_STORE_COMMIT_EVERY = 20  # Job hash writes grouped into one commit (also committed after every scroll pass)
+HASH_STORE_BLOOM_FP_RATE = 0.01  # False-positive rate of the in-memory Bloom filter in front of the job hash store (0 = disabled)
+HASH_STORE_PERSIST_BLOOM = True  # Save the Bloom filter next to the hash database so startup doesn't rescan the table
+HASH_STORE_EXPIRY_DAYS = 30  # Job hashes and near-duplicate signatures are forgotten this many days (up to one month more) after they were last seen/saved
+NEAR_DUPLICATE_DETECTION = True  # Skip jobs whose title/company/description are near-identical to an already saved job at the same location (reworded or syndicated reposts)
+NEAR_DUPLICATE_THRESHOLD = 0.7  # Minimum estimated Jaccard similarity of description word pairs for a near duplicate
+NEAR_DUPLICATE_MIN_TOKENS = 30  # Descriptions shorter than this (in words) are not compared
+NEAR_DUPLICATE_DB_PATH = 'data/job_minhashes.db'  # Own database file, so its writes never wait on the job hash store's open group-commit transaction
 SCROLL_DELAY = 2  # seconds
 BATCH_SIZE = 5  # Initial batch size (will be adjusted dynamically)
+JSONL_FSYNC_EVERY = 10  # fsync the append-only output file every N records (each record is flushed to the OS immediately)
 
 # LinkedIn-specific CSS selectors - UPDATED based on actual HTML structure
 LINKEDIN_POST_CONTAINER_SELECTOR = 'div.scaffold-finite-scroll__content ul[role="list"] > li' # Each post item
@@ -96,6 +137,20 @@ SHOW_MORE_BUTTON_SELECTOR = 'div[jsname="G7vtgf"] div[role="button"]'
 ACTIVE_JOB_PANEL_SELECTOR = 'div.BIB1wf[style*="display: block"]'
 PLATFORM_LINKS_SELECTOR = '.nNzjpf-cS4Vcb-PvZLI-wxkYzf .yVRmze-s2gQvd a'
 
+# Google Jobs extraction mode
+BATCHED_CARD_EXTRACTION = True  # Read all visible cards' fields with a single page.evaluate call instead of per-element queries
+NETWORK_CAPTURE_MODE = False  # Build job details from the Google Jobs data responses instead of clicking each card (falls back to the DOM path; payload field paths not yet verified against live responses)
+GOOGLE_JOBS_CAPTURE_URL_PATTERNS = ['/batchexecute']  # Response URLs parsed for job records
+# Index paths of job fields inside a batchexecute job record (unverified - check them against a recorded live payload before enabling NETWORK_CAPTURE_MODE)
+GOOGLE_JOBS_PAYLOAD_FIELDS = {
+    'title': [0],
+    'company': [1],
+    'location': [2],
+    'apply_links': [3],
+    'description': [19],
+}
+GOOGLE_JOBS_PAYLOAD_LINK_FIELDS = {'href': [0], 'text': [1]}  # Index paths inside each apply link entry
+
 
 # n8n Configuration (from environment variables with testing mode support)
 # Google Jobs Scraper URLs
@@ -123,8 +178,61 @@ GOOGLE_DRIVE_FOLDER_ID = os.getenv('GOOGLE_DRIVE_FOLDER_ID', '')  # Your Drive f
 GOOGLE_DRIVE_CREDENTIALS_PATH = os.getenv('GOOGLE_DRIVE_CREDENTIALS_PATH', '')  # Downloaded from Google Cloud Console
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+# Browser reuse
+BROWSER_PERSISTENT_CONTEXT = True  # Keep one persistent Chromium profile per scraper open across menu runs
+BROWSER_USER_DATA_DIR = 'data/browser_profiles'  # One user-data directory per profile (google, linkedin)
+
+# Resource blocking (context.route filter applied to both scrapers' browser contexts)
+# Any route disables Playwright's HTTP cache for the whole context, so with BROWSER_PERSISTENT_CONTEXT
+# the profile's cached scripts and stylesheets are fetched again; turn blocking off to keep that cache
+BLOCK_RESOURCES = True  # Abort requests for resources the scrapers never read
+BLOCKED_RESOURCE_TYPES = ['image', 'media', 'font']
+BLOCKED_URL_PATTERNS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'px.ads.linkedin.com',
+    'snap.licdn.com',
+    'linkedin.com/li/track',
+    'connect.facebook.net',
+]
+# Never blocked, whatever the rules above say: CAPTCHA and anti-bot challenge resources
+ALLOWED_URL_PATTERNS = [
+    '/recaptcha/',
+    'google.com/sorry',
+    'linkedin.com/checkpoint',
+    'challenges.cloudflare.com',
+    'arkoselabs.com',
+]
+
 # Human-like timing configurations
 SLEEP_SHORT = (1.0, 2.5)      # Quick actions (clicks)
 SLEEP_MEDIUM = (2.0, 4.0)     # Reading content, waiting for panels
 SLEEP_LONG = (3.5, 6.0)       # Waiting for page loads, scrolling
-SLEEP_SCROLL = (1.5, 3.0)     # Scrolling delay
\ No newline at end of file
+SLEEP_SCROLL = (1.5, 3.0)     # Scrolling delay
+
+# Adaptive pacing of the SLEEP_* ranges (AIMD), shared by all pages of a run
+PACING_PROFILE = 'adaptive'  # 'adaptive' scales the ranges with the site's health, 'fixed' always uses them as configured
+PACING_MIN_SCALE = 0.5  # Fastest pace: half the configured delays
+PACING_MAX_SCALE = 8.0  # Slowest pace while backing off
+PACING_DECREASE_STEP = 0.05  # Scale removed after each healthy page/panel load
+PACING_BACKOFF_FACTOR = 2.0  # Scale multiplier after a slow load, empty panel, CAPTCHA page or HTTP 429
+PACING_BACKOFF_COOLDOWN = 10.0  # Seconds after a backoff during which more throttling signals don't back off again
+PACING_SLOW_LOAD_SECONDS = 5.0  # Page/panel loads slower than this count as throttling
+PACING_CAPTCHA_URL_PATTERNS = [
+    'google.com/sorry',
+    'linkedin.com/checkpoint',
+    'challenges.cloudflare.com',
+]
+
+# Job details panel readiness (replaces the fixed SLEEP_MEDIUM wait after clicking a job)
+PANEL_READY_EVENT_DRIVEN = True  # Wait for the panel to show the clicked job instead of sleeping SLEEP_MEDIUM
+PANEL_READY_FLOOR = (0.6, 1.2)  # Minimum human-like wait after the click, even if the panel is ready sooner
+PANEL_READY_TIMEOUT = 8.0  # Hard limit in seconds before reading the panel anyway
+
+# LinkedIn "see more" expansion (replaces the click + SLEEP_SHORT per post)
+BATCHED_SEE_MORE_EXPANSION = True  # After each scroll, click every "see more" of the new posts in one page evaluate and wait once
+SEE_MORE_SETTLE_FLOOR = (0.3, 0.8)  # Minimum human-like wait after the clicks
+SEE_MORE_SETTLE_TIMEOUT = 5.0  # Hard limit in seconds before extracting anyway (posts still collapsed are expanded one by one)
+LINKEDIN_SLEEP_BETWEEN_POSTS = False  # Optional SLEEP_SHORT pacing between posts; expansion no longer depends on it (checked by test/see_more_expansion_check.py on a stub DOM, not yet on live LinkedIn; set True if posts come out truncated)
\ No newline at end of file
@@ -0,0 +1,217 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from config import (
+    GOOGLE_JOBS_CAPTURE_URL_PATTERNS,
+    GOOGLE_JOBS_PAYLOAD_FIELDS,
+    GOOGLE_JOBS_PAYLOAD_LINK_FIELDS,
+)
+
+# Set up logging for the response capture module
+logger = logging.getLogger(__name__)
+
+# Prefix Google puts in front of batchexecute responses to prevent JSON hijacking
+XSSI_PREFIX = ")]}'"
+
+# How deep to search decoded payloads for job records
+MAX_RECORD_DEPTH = 12
+
+
+def get_path(node: Any, path: List[int]) -> Any:
+    """
+    Follow a list of indexes into nested payload lists.
+
+    Args:
+        node: Decoded payload node
+        path: Indexes to follow
+
+    Returns:
+        Any: The value at the path, or None if the path does not exist
+    """
+    for index in path:
+        if not isinstance(node, list) or index >= len(node):
+            return None
+        node = node[index]
+    return node
+
+
+def make_job_key(title: str, company: str, location: str) -> str:
+    """Build the key used to match payload records with job cards (the same role is often posted in several cities)."""
+    return '|'.join(' '.join(value.split()).lower() for value in (title, company, location))
+
+
+def decode_batchexecute(text: str) -> List[Any]:
+    """
+    Decode the inner RPC payloads of a batchexecute response.
+
+    The response is the XSSI prefix followed by length-prefixed chunks, each a JSON
+    array of envelopes like ["wrb.fr", "<rpc id>", "<payload as JSON string>", ...].
+
+    Args:
+        text: Raw response body
+
+    Returns:
+        List: Decoded inner payloads
+    """
+    if text.startswith(XSSI_PREFIX):
+        text = text[len(XSSI_PREFIX):]
+
+    payloads = []
+    for line in text.splitlines():
+        line = line.strip()
+        # Skip blank lines and the chunk length lines
+        if not line or line.isdigit():
+            continue
+        try:
+            chunk = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+        for envelope in chunk if isinstance(chunk, list) else []:
+            if not (isinstance(envelope, list) and len(envelope) > 2 and envelope[0] == 'wrb.fr'):
+                continue
+            if not isinstance(envelope[2], str):
+                continue
+            try:
+                payloads.append(json.loads(envelope[2]))
+            except json.JSONDecodeError as e:
+                logger.debug(f"Could not decode payload of RPC '{envelope[1]}': {e}")
+
+    return payloads
+
+
+def parse_job_record(node: Any) -> Optional[Dict]:
+    """
+    Map one payload list to job fields using GOOGLE_JOBS_PAYLOAD_FIELDS.
+
+    Args:
+        node: Candidate payload list
+
+    Returns:
+        Dict or None: Job fields, or None if the node is not a job record
+    """
+    fields = {name: get_path(node, path) for name, path in GOOGLE_JOBS_PAYLOAD_FIELDS.items()}
+
+    title = fields.get('title')
+    company = fields.get('company')
+    description = fields.get('description')
+    if not all(isinstance(value, str) and value.strip() for value in (title, company, description)):
+        return None
+
+    platform_links = []
+    for link in fields.get('apply_links') or []:
+        href = get_path(link, GOOGLE_JOBS_PAYLOAD_LINK_FIELDS['href'])
+        text = get_path(link, GOOGLE_JOBS_PAYLOAD_LINK_FIELDS['text'])
+        if isinstance(href, str) and href:
+            platform_links.append({
+                'text': text.strip() if isinstance(text, str) else '',
+                'href': href
+            })
+
+    location = fields.get('location')
+    return {
+        'title': title.strip(),
+        'company': company.strip(),
+        'location': location.strip() if isinstance(location, str) else '',
+        'description': ' '.join(description.split()),
+        'platform_links': platform_links
+    }
+
+
+def find_job_records(node: Any, depth: int = 0) -> List[Dict]:
+    """
+    Walk a decoded payload and collect every node that maps to a job record.
+
+    Args:
+        node: Decoded payload node
+        depth: Current recursion depth
+
+    Returns:
+        List[Dict]: Job records found under this node
+    """
+    if not isinstance(node, list) or depth > MAX_RECORD_DEPTH:
+        return []
+
+    record = parse_job_record(node)
+    if record:
+        return [record]
+
+    records = []
+    for child in node:
+        records.extend(find_job_records(child, depth + 1))
+    return records
+
+
+def parse_jobs_payload(text: str) -> List[Dict]:
+    """
+    Parse job records from a raw Google Jobs batchexecute response body.
+
+    Args:
+        text: Raw response body
+
+    Returns:
+        List[Dict]: Job records with title, company, location, description and platform_links
+    """
+    records = []
+    for payload in decode_batchexecute(text):
+        records.extend(find_job_records(payload))
+    return records
+
+
+class GoogleJobsResponseCapture:
+    """Collects job records from the Google Jobs data responses a page loads while scrolling."""
+
+    def __init__(self):
+        self.records: Dict[str, Dict] = {}
+        self.responses_parsed = 0
+        self.parse_failures = 0
+        self.hits = 0
+        self.misses = 0
+
+    def attach(self, page):
+        """Start listening to the page's responses."""
+        page.on("response", self._on_response)
+
+    def detach(self, page):
+        """Stop listening to the page's responses."""
+        try:
+            page.remove_listener("response", self._on_response)
+        except Exception as e:
+            logger.debug(f"Error detaching response capture: {e}")
+
+    async def _on_response(self, response):
+        """Parse matching responses and index their job records."""
+        if not any(pattern in response.url for pattern in GOOGLE_JOBS_CAPTURE_URL_PATTERNS):
+            return
+
+        try:
+            records = parse_jobs_payload(await response.text())
+        except Exception as e:
+            self.parse_failures += 1
+            logger.debug(f"Could not parse Google Jobs response {response.url}: {e}")
+            return
+
+        self.responses_parsed += 1
+        for record in records:
+            self.records[make_job_key(record['title'], record['company'], record['location'])] = record
+
+        if records:
+            logger.debug(f"Captured {len(records)} job records from network response ({len(self.records)} indexed)")
+
+    def lookup(self, basic_info: Dict) -> Optional[Dict]:
+        """
+        Find the captured record for a job card.
+
+        Args:
+            basic_info: Basic job information extracted from the card
+
+        Returns:
+            Dict or None: Captured record, or None if the card must use the DOM path
+        """
+        record = self.records.get(make_job_key(basic_info['title'], basic_info['company'], basic_info['location']))
+        if record:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return record
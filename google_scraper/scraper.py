@@ -6,9 +6,17 @@ import logging
 import os
 import random 
 import signal
-from typing import Dict, Optional, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 # from job_hash_store import JobHashStore
 from utility.job_hash_store import JobHashStore
+from utility.jsonl_writer import get_writer, finalize_output, read_jsonl
+from google_scraper.response_capture import GoogleJobsResponseCapture
+from utility.run_checkpoint import RunCheckpoint
+from utility.session_dedup import SessionDedupIndex
+from utility.near_duplicate_index import NearDuplicateIndex
+from utility.async_store import AsyncJobHashStore, AsyncNearDuplicateIndex
+from utility.pacing import get_pacer
 from config import *
 
 # Set up logging for the scraper module
@@ -110,13 +118,12 @@ def estimate_posted_date(posted_str: str, scraped_date: str) -> str:
 async def human_sleep(range_tuple: Tuple[float, float]) -> None:
     """
     Sleep for a random duration within the specified range to mimic human behavior.
+    The duration is scaled by the run's pacing controller.
     
     Args:
         range_tuple: Tuple containing (min_duration, max_duration) in seconds
     """
-    duration = random_sleep(range_tuple)
-    logger.debug(f"Human-like sleep for {duration:.2f} seconds")
-    await asyncio.sleep(duration)
+    await get_pacer().sleep(range_tuple)
 
 def get_json_filename() -> str:
     """
@@ -130,13 +137,12 @@ def get_json_filename() -> str:
 
 def save_job_incrementally(job_data: Dict, filename: str) -> bool:
     """
-    Save a job to a JSON file incrementally.
-    If the file exists, read it, append the job, and write it back.
-    If not, create a new file with this job as the first element.
+    Save a job incrementally by appending it as one line to the run's JSON Lines file.
+    Call finalize_output(filename) at the end of the run to produce the JSON array file.
     
     Args:
         job_data: Dictionary containing job information
-        filename: Path to the JSON file
+        filename: Path to the final JSON file
         
     Returns:
         bool: True if save was successful, False otherwise
@@ -145,30 +151,9 @@ def save_job_incrementally(job_data: Dict, filename: str) -> bool:
     job_company = job_data.get('company', 'Unknown')
     
     try:
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        
-        # Check if file exists and has content
-        if os.path.exists(filename) and os.path.getsize(filename) > 0:
-            # Read existing jobs
-            with open(filename, 'r', encoding='utf-8') as f:
-                try:
-                    jobs = json.load(f)
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error in {filename}: {e}. Starting fresh for job '{job_title}' at '{job_company}'")
-                    jobs = []
-        else:
-            # Create new file with empty array
-            jobs = []
-        
-        # Append new job
-        jobs.append(job_data)
-        
-        # Write back to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(jobs, f, ensure_ascii=False, indent=2)
+        total = get_writer(filename).append(job_data)
         
-        logger.info(f"Successfully saved job '{job_title}' at '{job_company}' to {filename} (total: {len(jobs)} jobs)")
+        logger.info(f"Successfully saved job '{job_title}' at '{job_company}' to {filename} (total: {total} jobs)")
         return True
         
     except PermissionError as e:
@@ -181,6 +166,40 @@ def save_job_incrementally(job_data: Dict, filename: str) -> bool:
         logger.error(f"Unexpected error saving job '{job_title}' at '{job_company}' to {filename}: {e}")
         return False
 
+def build_basic_job_info(title: str, company: Optional[str], loc_platform: Optional[str],
+                         job_type: Optional[str], age: Optional[str], salary: Optional[str]) -> Dict:
+    """
+    Build the basic job info dict from the raw text of a job card.
+    
+    Args:
+        title: Job title text
+        company: Company text (None if the element is missing)
+        loc_platform: Combined "location • platform" text (None if missing)
+        job_type: Employment type text (None if missing)
+        age: Posted age text (None if missing)
+        salary: Salary text (None if missing)
+        
+    Returns:
+        Dict: Basic job information
+    """
+    company = company if company is not None else "N/A"
+    loc_platform = loc_platform or ""
+    location = loc_platform.split('•')[0].strip() if '•' in loc_platform else loc_platform
+    platform = loc_platform.split('•')[1].strip() if '•' in loc_platform and len(loc_platform.split('•')) > 1 else "N/A"
+    job_type = job_type if job_type is not None else "N/A"
+    age = age if age is not None else "N/A"
+    salary = salary if salary is not None else "N/A"
+    
+    return {
+        'title': title.strip(),
+        'company': company.strip(),
+        'location': location.strip(),
+        'platform': platform.strip(),
+        'job_type': job_type.strip(),
+        'posted': age.strip(),
+        'salary': salary.strip()
+    }
+
 async def extract_basic_job_info(job_element) -> Optional[Dict]:
     """
     Extract basic job information from a job element.
@@ -205,37 +224,180 @@ async def extract_basic_job_info(job_element) -> Optional[Dict]:
         
         # Extract company
         company_el = await job_element.query_selector(COMPANY_SELECTOR)
-        company = await company_el.text_content() if company_el else "N/A"
+        company = await company_el.text_content() if company_el else None
         
         # Process location and platform
         loc_platform_el = await job_element.query_selector(LOCATION_PLATFORM_SELECTOR)
         loc_platform = await loc_platform_el.text_content() if loc_platform_el else ""
-        location = loc_platform.split('•')[0].strip() if '•' in loc_platform else loc_platform
-        platform = loc_platform.split('•')[1].strip() if '•' in loc_platform and len(loc_platform.split('•')) > 1 else "N/A"
         
         # Get other job details
         job_type_el = await job_element.query_selector(JOB_TYPE_SELECTOR)
         age_el = await job_element.query_selector(AGE_SELECTOR)
         salary_el = await job_element.query_selector(SALARY_SELECTOR)
         
-        job_type = await job_type_el.text_content() if job_type_el else "N/A"
-        age = await age_el.text_content() if age_el else "N/A"
-        salary = await salary_el.text_content() if salary_el else "N/A"
+        job_type = await job_type_el.text_content() if job_type_el else None
+        age = await age_el.text_content() if age_el else None
+        salary = await salary_el.text_content() if salary_el else None
         
-        return {
-            'title': title.strip(),
-            'company': company.strip(),
-            'location': location.strip(),
-            'platform': platform.strip(),
-            'job_type': job_type.strip(),
-            'posted': age.strip(),
-            'salary': salary.strip()
-        }
+        return build_basic_job_info(title, company, loc_platform, job_type, age, salary)
         
     except Exception as e:
         logger.warning(f"Error extracting basic job info: {e}")
         return None
 
+# In-page script that reads the fields of every job card from `start` on in one call.
+# Returns one entry per card (null when the card has no title) so the
+# result stays index-aligned with query_selector_all(JOB_CONTAINER_SELECTOR)[start:].
+BATCH_EXTRACT_CARDS_JS = """
+(cards, args) => cards.slice(args.start).map(card => {
+    const sel = args.selectors;
+    const text = (selector) => {
+        const el = card.querySelector(selector);
+        return el ? el.textContent : null;
+    };
+    const title = text(sel.title);
+    if (!title) {
+        return null;
+    }
+    return {
+        title: title,
+        company: text(sel.company),
+        loc_platform: text(sel.loc_platform),
+        job_type: text(sel.job_type),
+        age: text(sel.age),
+        salary: text(sel.salary)
+    };
+})
+"""
+
+async def extract_all_basic_job_info(page, start_index: int = 0) -> Optional[List[Optional[Dict]]]:
+    """
+    Extract basic job information for every visible job card in a single round trip.
+    
+    Args:
+        page: The Playwright page object
+        start_index: Index of the first card to extract (earlier cards are skipped in-page)
+        
+    Returns:
+        List or None: One basic info dict per job card (None for cards without a title),
+        in the same order as query_selector_all(JOB_CONTAINER_SELECTOR)[start_index:],
+        or None if the in-page extraction failed
+    """
+    try:
+        raw_cards = await page.eval_on_selector_all(
+            JOB_CONTAINER_SELECTOR,
+            BATCH_EXTRACT_CARDS_JS,
+            {
+                'start': start_index,
+                'selectors': {
+                    'title': JOB_TITLE_SELECTOR,
+                    'company': COMPANY_SELECTOR,
+                    'loc_platform': LOCATION_PLATFORM_SELECTOR,
+                    'job_type': JOB_TYPE_SELECTOR,
+                    'age': AGE_SELECTOR,
+                    'salary': SALARY_SELECTOR
+                }
+            }
+        )
+        
+        return [
+            build_basic_job_info(
+                raw['title'], raw['company'], raw['loc_platform'],
+                raw['job_type'], raw['age'], raw['salary']
+            ) if raw else None
+            for raw in raw_cards
+        ]
+        
+    except Exception as e:
+        logger.warning(f"Error in batched job card extraction: {e}")
+        return None
+
+# In-page readiness check for the job details panel: the active panel must show
+# the clicked card's title and have a non-empty description node.
+PANEL_READY_JS = """
+(args) => {
+    const normalize = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+    const panel = document.querySelector(args.panel);
+    if (!panel) {
+        return false;
+    }
+    if (!normalize(panel.textContent).includes(normalize(args.title))) {
+        return false;
+    }
+    return Array.from(panel.querySelectorAll(args.description))
+        .some(el => normalize(el.textContent).length > 0);
+}
+"""
+
+async def wait_for_job_panel(page, job_title: str) -> float:
+    """
+    Wait until the job details panel shows the clicked job, instead of a fixed sleep.
+    Waits at least a random PANEL_READY_FLOOR duration and at most PANEL_READY_TIMEOUT seconds.
+    
+    Args:
+        page: The Playwright page object
+        job_title: Title of the clicked job card
+        
+    Returns:
+        float: Seconds spent waiting
+    """
+    start = time.monotonic()
+    floor = get_pacer().delay(PANEL_READY_FLOOR)
+    
+    async def wait_ready() -> bool:
+        try:
+            await page.wait_for_function(
+                PANEL_READY_JS,
+                arg={
+                    'panel': ACTIVE_JOB_PANEL_SELECTOR,
+                    'description': DESCRIPTION_CONTAINER_SELECTOR,
+                    'title': job_title
+                },
+                timeout=PANEL_READY_TIMEOUT * 1000
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Panel readiness wait ended without match for '{job_title}': {e}")
+            return False
+    
+    # The floor keeps the pace human-like even when the panel is ready instantly
+    ready, _ = await asyncio.gather(wait_ready(), asyncio.sleep(floor))
+    waited = time.monotonic() - start
+    
+    fixed_wait = sum(SLEEP_MEDIUM) / 2
+    if ready:
+        logger.info(f"Job panel ready for '{job_title}' in {waited:.2f}s (saved ~{fixed_wait - waited:.2f}s vs fixed wait)")
+        get_pacer().record_healthy(load_seconds=waited)
+    else:
+        logger.warning(f"Job panel not ready for '{job_title}' after {waited:.2f}s (timeout {PANEL_READY_TIMEOUT}s), reading it anyway")
+        get_pacer().record_throttling("job panel not ready")
+    
+    return waited
+
+def build_detailed_job_info(basic_info: Dict, description: str, platform_links: List[Dict]) -> Dict:
+    """
+    Build the complete job data dict saved to the output file.
+    
+    Args:
+        basic_info: Basic job information from the job card
+        description: Job description text
+        platform_links: List of {'text', 'href'} apply links
+        
+    Returns:
+        Dict: Complete job data with scraped and estimated posted dates
+    """
+    # Get scraped date first
+    scraped_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    # Create complete job data with estimated posted date
+    return {
+        **basic_info,
+        'description': description,
+        'platform_links': platform_links,
+        'scraped_date': scraped_date,
+        'estimated_posted_date': estimate_posted_date(basic_info.get('posted', ''), scraped_date)
+    }
+
 async def extract_detailed_job_info(page, job_element, basic_info: Dict) -> Optional[Dict]:
     """
     Extract detailed job information by clicking on the job element.
@@ -253,7 +415,10 @@ async def extract_detailed_job_info(page, job_element, basic_info: Dict) -> Opti
         description = ""
 
         # Wait for the job details panel to load
-        await human_sleep(SLEEP_MEDIUM)
+        if PANEL_READY_EVENT_DRIVEN:
+            await wait_for_job_panel(page, job_title)
+        else:
+            await human_sleep(SLEEP_MEDIUM)
         
         active_panel = await page.query_selector(ACTIVE_JOB_PANEL_SELECTOR)
         
@@ -270,6 +435,7 @@ async def extract_detailed_job_info(page, job_element, basic_info: Dict) -> Opti
             if not description:
                 description = "No description available"
                 logger.debug(f"No description found for job: '{job_title}' at '{job_company}'")
+                get_pacer().record_throttling("empty job panel")
 
             # Extract platform links
             link_elements = await active_panel.query_selector_all(PLATFORM_LINKS_SELECTOR)
@@ -287,26 +453,108 @@ async def extract_detailed_job_info(page, job_element, basic_info: Dict) -> Opti
             logger.warning(f"Could not find active job panel for '{job_title}' at '{job_company}'")
             description = "Failed to locate job details panel"
 
-        # Get scraped date first
-        scraped_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Create complete job data with estimated posted date
-        job_data = {
-            **basic_info,
-            'description': description,
-            'platform_links': platform_links,
-            'scraped_date': scraped_date,
-            'estimated_posted_date': estimate_posted_date(basic_info.get('posted', ''), scraped_date)  # ADD THIS LINE
-        }
-        
-        return job_data
+        return build_detailed_job_info(basic_info, description, platform_links)
         
     except Exception as e:
         logger.error(f"Error extracting detailed job info for '{job_title}' at '{job_company}': {e}")
         return None
 
 
-async def perform_scraping(page, output_filename: str = None, max_jobs_override: Optional[int] = None) -> Optional[int]:
+async def scroll_to_card(page, target_count: int) -> int:
+    """
+    Scroll until at least `target_count` job cards are loaded, or no more cards load.
+    
+    Args:
+        page: The Playwright page object
+        target_count: Number of job cards to load
+        
+    Returns:
+        int: Number of cards loaded, capped at target_count
+    """
+    job_count = await page.locator(JOB_CONTAINER_SELECTOR).count()
+    scroll_attempts = 0
+    
+    while job_count < target_count and scroll_attempts < MAX_SCROLL_ATTEMPTS and not shutdown_flag:
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await human_sleep(SLEEP_SCROLL)
+        
+        new_job_count = await page.locator(JOB_CONTAINER_SELECTOR).count()
+        scroll_attempts = scroll_attempts + 1 if new_job_count <= job_count else 0
+        job_count = new_job_count
+    
+    logger.info(f"Resumed at card {min(job_count, target_count)} of {target_count} visited before the interruption")
+    return min(job_count, target_count)
+
+def open_job_hash_store(read_only: bool = False) -> AsyncJobHashStore:
+    """Open the job hash store configured in config, behind its non-blocking facade, and drop expired partitions."""
+    def factory():
+        store = JobHashStore(
+            expiry_days=HASH_STORE_EXPIRY_DAYS,
+            read_only=read_only, persistent=HASH_STORE_PERSISTENT, commit_every=HASH_STORE_COMMIT_EVERY,
+            bloom_fp_rate=HASH_STORE_BLOOM_FP_RATE, persist_bloom=HASH_STORE_PERSIST_BLOOM
+        )
+        store.cleanup_expired()
+        return store
+    return AsyncJobHashStore(factory)
+
+def open_near_duplicate_index(read_only: bool = False) -> AsyncNearDuplicateIndex:
+    """Open the near-duplicate index configured in config, behind its non-blocking facade, and drop expired partitions."""
+    def factory():
+        index = NearDuplicateIndex(
+            db_path=NEAR_DUPLICATE_DB_PATH, expiry_days=HASH_STORE_EXPIRY_DAYS,
+            threshold=NEAR_DUPLICATE_THRESHOLD, min_tokens=NEAR_DUPLICATE_MIN_TOKENS, read_only=read_only
+        )
+        index.cleanup_expired()
+        return index
+    return AsyncNearDuplicateIndex(factory)
+
+async def restore_saved_jobs(output_filename: str, hash_store: AsyncJobHashStore,
+                             dedup_index: Optional[SessionDedupIndex] = None,
+                             near_duplicate_index: Optional[AsyncNearDuplicateIndex] = None) -> int:
+    """
+    Register the jobs an interrupted run already wrote to its output before resuming it.
+    
+    A crash can land between a job's save and the commit of its hash, so without this the
+    resumed run (and later runs) would save those jobs again.
+    
+    Args:
+        output_filename: Output file of the run being resumed
+        hash_store: Job hash store of the run
+        dedup_index: Optional run-wide index of postings already seen
+        near_duplicate_index: Optional index of saved jobs' descriptions
+        
+    Returns:
+        int: Number of jobs found in the output
+    """
+    jsonl_path = get_writer(output_filename).jsonl_path
+    if not os.path.exists(jsonl_path):
+        return 0
+    
+    saved_jobs = read_jsonl(jsonl_path)
+    unrecorded = []
+    for job in saved_jobs:
+        if dedup_index is not None:
+            dedup_index.add(job)
+        if not await hash_store.is_duplicate(job, record=False):
+            await hash_store.add_job(job)
+            unrecorded.append(job)
+    await hash_store.flush()
+    
+    if near_duplicate_index is not None:
+        for job in unrecorded:
+            await near_duplicate_index.add(job)
+    
+    logger.info(f"Found {len(saved_jobs)} jobs already saved to {output_filename} ({len(unrecorded)} were not recorded as seen yet)")
+    return len(saved_jobs)
+
+async def perform_scraping(page, output_filename: str = None, max_jobs_override: Optional[int] = None,
+                           hash_store: Optional[AsyncJobHashStore] = None,
+                           response_capture: Optional[GoogleJobsResponseCapture] = None,
+                           checkpoint: Optional[RunCheckpoint] = None, keyword: Optional[str] = None,
+                           max_scrolls_override: Optional[int] = None, time_budget: Optional[float] = None,
+                           stats: Optional[Dict] = None,
+                           dedup_index: Optional[SessionDedupIndex] = None,
+                           near_duplicate_index: Optional[AsyncNearDuplicateIndex] = None) -> Optional[int]:
     """
     Scrape job listings from Google Jobs search results with scrolling support.
     
@@ -314,24 +562,46 @@ async def perform_scraping(page, output_filename: str = None, max_jobs_override:
         page: The Playwright page object to use for scraping
         output_filename: Optional filename to save results
         max_jobs_override: Optional override for max jobs (used for multi-keyword scraping)
+        hash_store: Optional shared job hash store from open_job_hash_store() (used by concurrent keyword workers)
+        response_capture: Optional response capture already attached to the page
+        checkpoint: Optional run checkpoint to record this keyword's progress in
+        keyword: Search keyword being scraped (required with checkpoint)
+        max_scrolls_override: Optional override for MAX_SCROLL_ATTEMPTS (used for cheap probe runs)
+        time_budget: Optional time limit in seconds for this keyword
+        stats: Optional dict filled with the jobs/duplicates/failed counters of this run
+        dedup_index: Optional run-wide index of postings already seen by any keyword or worker
+        near_duplicate_index: Optional shared index of saved jobs, used to skip reworded reposts
         
     Returns:
-        int or None: Number of jobs scraped, or None if scraping failed
+        int or None: Number of jobs scraped (including those of an interrupted attempt when
+        resuming from a checkpoint), or None if scraping failed
     """
     global shutdown_flag
     
     logger.info("Starting job scraping process...")
     
+    # Listen for job data responses ourselves if the caller did not attach a capture
+    owns_capture = NETWORK_CAPTURE_MODE and response_capture is None
+    if owns_capture:
+        response_capture = GoogleJobsResponseCapture()
+        response_capture.attach(page)
+    
+    # Open our own job hash store and near-duplicate index if the caller did not share them
+    owns_hash_store = hash_store is None
+    owns_near_duplicate_index = NEAR_DUPLICATE_DETECTION and near_duplicate_index is None
+    
     try:
-        # Initialize the job hash store
+        # Initialize the job hash store unless a shared one was provided
         read_only_mode = TESTING_MODE
-        hash_store = JobHashStore(read_only=read_only_mode)
-        # hash_store.cleanup_expired()
+        if owns_hash_store:
+            hash_store = open_job_hash_store(read_only=read_only_mode)
+        if owns_near_duplicate_index:
+            near_duplicate_index = open_near_duplicate_index(read_only=read_only_mode)
         if read_only_mode:
             logger.warning("Hash storage is DISABLED - running in testing mode")
         
-        stats = hash_store.get_stats()
-        logger.info(f"Job hash store initialized - {stats['total_jobs_tracked']} jobs tracked")
+        store_stats = await hash_store.get_stats()
+        logger.info(f"Job hash store initialized - {store_stats['total_jobs_tracked']} jobs tracked")
         
         # Use provided filename or create new one
         if not output_filename:
@@ -344,37 +614,87 @@ async def perform_scraping(page, output_filename: str = None, max_jobs_override:
             logger.debug("Job container selector found successfully")
         except Exception as e:
             logger.error(f"Could not find job listings: {e}")
+            get_pacer().record_throttling("no job listings")
             return None
         
         # Initialize tracking variables
         processed_job_keys = set()
+        processed_cursor = 0  # Number of job cards already visited, from the top of the list
         jobs_count = 0
         skipped_duplicates = 0
         failed_extractions = 0
         jobs_to_send = []
         scroll_attempts = 0
         
-        # Use override if provided, otherwise use config
+        # Use overrides if provided, otherwise use config
         job_limit = max_jobs_override if max_jobs_override is not None else (MAX_JOBS_TO_SCRAPE if MAX_JOBS_TO_SCRAPE > 0 else None)
+        max_scrolls = max_scrolls_override if max_scrolls_override is not None else MAX_SCROLL_ATTEMPTS
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
         limit_str = job_limit if job_limit is not None else "unlimited"
-        logger.info(f"Starting scraping loop - target: {limit_str} jobs, max scrolls: {MAX_SCROLL_ATTEMPTS}")
-        
-        while scroll_attempts < MAX_SCROLL_ATTEMPTS and not shutdown_flag:
+        budget_str = f", time budget: {time_budget / 60:.1f} min" if time_budget is not None else ""
+        logger.info(f"Starting scraping loop - target: {limit_str} jobs, max scrolls: {max_scrolls}{budget_str}")
+        
+        # Skip the cards an interrupted attempt already visited; its jobs count towards the job limit
+        if checkpoint is not None:
+            resume_cursor, carried = checkpoint.begin_keyword(keyword)
+            jobs_count, skipped_duplicates, failed_extractions = carried['jobs'], carried['duplicates'], carried['failed']
+            if job_limit is not None and jobs_count >= job_limit:
+                logger.info(f"Job limit of {job_limit} already reached before the interruption")
+            elif resume_cursor > 0 and INCREMENTAL_SCROLL_PROCESSING:
+                processed_cursor = await scroll_to_card(page, resume_cursor)
+        
+        while scroll_attempts < max_scrolls and not shutdown_flag:
+            if job_limit is not None and jobs_count >= job_limit:
+                break
+            
             # Get current job elements
             job_elements = await page.query_selector_all(JOB_CONTAINER_SELECTOR)
             current_job_count = len(job_elements)
             
             logger.info(f"Found {current_job_count} job elements on page (scroll attempt {scroll_attempts})")
             
+            # Only visit cards loaded since the last pass when incremental processing is enabled
+            if not INCREMENTAL_SCROLL_PROCESSING:
+                processed_cursor = 0
+            elif current_job_count < processed_cursor:
+                logger.info(f"Job list shrank from {processed_cursor} to {current_job_count} cards, restarting from the top")
+                processed_cursor = 0
+            new_job_elements = job_elements[processed_cursor:]
+            
+            # Read every new card's basic fields in one round trip when enabled
+            batch_infos = None
+            if BATCHED_CARD_EXTRACTION and new_job_elements:
+                batch_infos = await extract_all_basic_job_info(page, processed_cursor)
+                if batch_infos is not None and len(batch_infos) != len(new_job_elements):
+                    logger.debug(f"Batched extraction returned {len(batch_infos)} cards for {len(new_job_elements)} elements, using per-element extraction")
+                    batch_infos = None
+            
+            # Check the basic hashes of the whole pass in one query
+            basic_duplicates = None
+            if batch_infos is not None:
+                flags = iter(await hash_store.find_basic_duplicates([info for info in batch_infos if info]))
+                basic_duplicates = [bool(info) and next(flags) for info in batch_infos]
+            
             # Process visible jobs
             job_limit_reached = False  # Add flag to track if limit was reached
-            for job_element in job_elements:
+            for job_index, job_element in enumerate(new_job_elements):
                 if shutdown_flag:
                     logger.warning("Shutdown signal received, stopping job processing")
                     break
                 
+                # Check the time budget before every card, so keywords yielding only duplicates stop too
+                if deadline is not None and time.monotonic() >= deadline:
+                    logger.info(f"Time budget of {time_budget / 60:.1f} min spent ({jobs_count} jobs)")
+                    job_limit_reached = True
+                    break
+                
+                processed_cursor += 1
+                
                 # Extract basic job information
-                basic_info = await extract_basic_job_info(job_element)
+                if batch_infos is not None:
+                    basic_info = batch_infos[job_index]
+                else:
+                    basic_info = await extract_basic_job_info(job_element)
                 if not basic_info:
                     failed_extractions += 1
                     continue
@@ -382,13 +702,18 @@ async def perform_scraping(page, output_filename: str = None, max_jobs_override:
                 job_title = basic_info['title']
                 job_company = basic_info['company']
                 
-                # Skip if we've already processed this job in this session
-                job_key = f"{job_title}_{job_company}"
-                if job_key in processed_job_keys:
-                    logger.info(f"Skipping already processed job: '{job_title}' at '{job_company}'")
-                    continue
-                
-                processed_job_keys.add(job_key)
+                # Skip if we've already processed this job in this session (across keywords when shared)
+                if dedup_index is not None:
+                    if dedup_index.check_and_add(basic_info, keyword or ''):
+                        logger.info(f"Skipping job already seen this run: '{job_title}' at '{job_company}'")
+                        continue
+                else:
+                    job_key = f"{job_title}_{job_company}"
+                    if job_key in processed_job_keys:
+                        logger.info(f"Skipping already processed job: '{job_title}' at '{job_company}'")
+                        continue
+                    
+                    processed_job_keys.add(job_key)
                 
                 # Check for basic duplicates using hash store
                 preliminary_job_data = {
@@ -397,28 +722,56 @@ async def perform_scraping(page, output_filename: str = None, max_jobs_override:
                     'location': basic_info['location']
                 }
                 
-                if hash_store.is_basic_duplicate(preliminary_job_data):
+                if basic_duplicates is not None:
+                    is_basic_duplicate = basic_duplicates[job_index]
+                else:
+                    is_basic_duplicate = await hash_store.is_basic_duplicate(preliminary_job_data)
+                if is_basic_duplicate:
                     logger.info(f"Skipping basic duplicate: '{job_title}' at '{job_company}'")
                     skipped_duplicates += 1
                     continue
 
+                # Use the captured network record when available, otherwise click the card
+                detailed_info = None
+                if response_capture is not None:
+                    captured = response_capture.lookup(basic_info)
+                    if captured:
+                        detailed_info = build_detailed_job_info(basic_info, captured['description'], captured['platform_links'])
+                        logger.debug(f"Built details from captured response for: '{job_title}' at '{job_company}'")
+                
                 # Extract detailed job information
-                detailed_info = await extract_detailed_job_info(page, job_element, basic_info)
+                if detailed_info is None:
+                    detailed_info = await extract_detailed_job_info(page, job_element, basic_info)
                 if not detailed_info:
                     logger.warning(f"Failed to extract detailed info for: '{job_title}' at '{job_company}'")
                     failed_extractions += 1
                     continue
                 
-                # Final duplicate check with complete data
-                if hash_store.is_duplicate(detailed_info):
+                # Final duplicate check with complete data (the hash is recorded after the save)
+                if await hash_store.is_duplicate(detailed_info, record=False):
                     logger.info(f"Skipping confirmed duplicate after full check: '{job_title}' at '{job_company}'")
                     skipped_duplicates += 1
                     continue
                 
-                # Save job incrementally
+                # Reworded or syndicated reposts of a saved job hash differently, so compare their text
+                if near_duplicate_index is not None:
+                    similar = await near_duplicate_index.find_similar(detailed_info)
+                    if similar:
+                        similarity, similar_title, similar_company, similar_hash = similar
+                        logger.info(f"Skipping near duplicate ({similarity:.0%} similar to '{similar_title}' at '{similar_company}', hash {similar_hash}): '{job_title}' at '{job_company}' in '{detailed_info.get('location')}'")
+                        skipped_duplicates += 1
+                        continue
+                
+                # Save job incrementally, then mark it as seen so a crash never loses a recorded job
                 if save_job_incrementally(detailed_info, output_filename):
+                    await hash_store.add_job(detailed_info)
+                    if near_duplicate_index is not None:
+                        await near_duplicate_index.add(detailed_info)
                     jobs_count += 1
                     jobs_to_send.append(detailed_info)
+                    # Record the saved job right away so a resume never saves it a second time
+                    if checkpoint is not None:
+                        checkpoint.update_keyword(keyword, processed_cursor, jobs_count, skipped_duplicates, failed_extractions)
                     logger.debug(f"Successfully processed job {jobs_count}: '{job_title}' at '{job_company}'")
                 else:
                     logger.error(f"Failed to save job: '{job_title}' at '{job_company}'")
@@ -430,23 +783,34 @@ async def perform_scraping(page, output_filename: str = None, max_jobs_override:
                     job_limit_reached = True
                     break
             
+            # Commit the hashes of this pass before the checkpoint records it as done
+            await hash_store.flush()
+            if checkpoint is not None:
+                checkpoint.update_keyword(keyword, processed_cursor, jobs_count, skipped_duplicates, failed_extractions)
+            
             # Break out of outer loop if job limit reached or shutdown requested
             if job_limit_reached or shutdown_flag:
                 break
             
+            # Don't scroll for more cards once this keyword's time budget is spent
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.info(f"Time budget of {time_budget / 60:.1f} min spent ({jobs_count} jobs)")
+                break
+            
             # Scroll down to load more jobs
             logger.info("Scrolling to load more jobs...")
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             await human_sleep(SLEEP_SCROLL)
             
             # Check if new jobs were loaded
-            new_job_elements = await page.query_selector_all(JOB_CONTAINER_SELECTOR)
-            if len(new_job_elements) <= current_job_count:
+            new_job_count = await page.locator(JOB_CONTAINER_SELECTOR).count()
+            if new_job_count <= current_job_count:
                 scroll_attempts += 1
-                logger.info(f"No new jobs loaded, scroll attempt {scroll_attempts}/{MAX_SCROLL_ATTEMPTS}")
+                logger.info(f"No new jobs loaded, scroll attempt {scroll_attempts}/{max_scrolls}")
             else:
                 scroll_attempts = 0  # Reset counter if new jobs found
-                logger.info(f"Found {len(new_job_elements) - current_job_count} new jobs after scrolling")
+                get_pacer().record_healthy()
+                logger.info(f"Found {new_job_count - current_job_count} new jobs after scrolling")
         
         # Log final statistics
         logger.info(f"Scraping completed! Summary:")
@@ -454,9 +818,20 @@ async def perform_scraping(page, output_filename: str = None, max_jobs_override:
         logger.info(f"  - Duplicates skipped: {skipped_duplicates}")
         logger.info(f"  - Failed extractions: {failed_extractions}")
         logger.info(f"  - Shutdown requested: {shutdown_flag}")
+        if stats is not None:
+            stats.update({'jobs': jobs_count, 'duplicates': skipped_duplicates, 'failed': failed_extractions})
+        if response_capture is not None:
+            logger.info(f"  - Network capture: {response_capture.hits} jobs from responses, {response_capture.misses} via DOM fallback, {response_capture.parse_failures} unparsable responses")
         
         return jobs_count
         
     except Exception as e:
         logger.error(f"Critical error in perform_scraping: {e}")
-        return None
\ No newline at end of file
+        return None
+    finally:
+        if owns_capture:
+            response_capture.detach(page)
+        if owns_hash_store and hash_store is not None:
+            await hash_store.close()
+        if owns_near_duplicate_index and near_duplicate_index is not None:
+            await near_duplicate_index.close()
\ No newline at end of file
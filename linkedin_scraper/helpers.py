@@ -1,10 +1,11 @@
 import random
 import logging
 import os
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 import re
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta
 
 # Import from main config
@@ -16,7 +17,10 @@ from config import *
 logger = logging.getLogger(__name__)
 
 # Import SQLite store for duplicate detection
-from utility.linkedin_post_store import load_scraped_ids, save_scraped_id, init_database
+from utility.async_store import AsyncLinkedinPostStore
+from utility.linkedin_post_store import activity_id
+from utility.pacing import get_pacer
+from utility.jsonl_writer import get_writer, finalize_output, finalize_leftovers
 
 # Global flag for graceful shutdown
 shutdown_flag = False
@@ -26,10 +30,8 @@ def random_sleep(range_tuple: Tuple[float, float]) -> float:
     return random.uniform(range_tuple[0], range_tuple[1])
 
 async def human_sleep(range_tuple: Tuple[float, float]) -> None:
-    """Sleep for a random duration within the specified range to mimic human behavior."""
-    duration = random_sleep(range_tuple)
-    logger.debug(f"Human-like sleep for {duration:.2f} seconds")
-    await asyncio.sleep(duration)
+    """Sleep for a random duration within the specified range to mimic human behavior, scaled by the run's pacing."""
+    await get_pacer().sleep(range_tuple)
 
 def get_json_filename() -> str:
     """Generate a timestamp-based filename for the JSON output."""
@@ -100,6 +102,47 @@ def estimate_posted_date(posted_str: str, scraped_date: str) -> str:
         except:
             return datetime.now().strftime("%Y-%m-%d")
 
+# LinkedIn launched in May 2003: decoded times before that are not activity timestamps
+ACTIVITY_EPOCH_MIN = datetime(2003, 5, 1)
+
+def decode_activity_timestamp(post_id: Optional[str]) -> Optional[datetime]:
+    """
+    Get the exact creation time of a post from its activity ID.
+    The first 41 bits of the 64-bit ID are the Unix time in milliseconds.
+    
+    Args:
+        post_id: The LinkedIn activity ID
+        
+    Returns:
+        datetime or None: Local creation time, or None if the ID doesn't decode to a plausible time
+    """
+    post_activity_id = activity_id(post_id)
+    if not post_activity_id:
+        return None
+    try:
+        created = datetime.fromtimestamp((post_activity_id >> 22) / 1000)
+    except (OverflowError, OSError, ValueError):
+        return None
+    if created < ACTIVITY_EPOCH_MIN or created > datetime.now() + timedelta(days=1):
+        return None
+    return created
+
+def format_relative_time(created: datetime, now: datetime) -> str:
+    """Format the age of a post the way LinkedIn shows it ("45m", "3h", "2d", "1w", "4mo", "1yr")."""
+    seconds = max(0, (now - created).total_seconds())
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h"
+    days = int(seconds // 86400)
+    if days < 7:
+        return f"{days}d"
+    if days < 30:
+        return f"{days // 7}w"
+    if days < 365:
+        return f"{days // 30}mo"
+    return f"{days // 365}yr"
+
 def extract_post_id_from_link(post_link: str) -> Optional[str]:
     """Extract post ID from LinkedIn post link."""
     try:
@@ -122,8 +165,15 @@ def extract_post_id_from_urn(urn: str) -> Optional[str]:
         logger.warning(f"Error extracting post ID from URN '{urn}': {e}")
         return None
 
-def save_post_incrementally(post_data: Dict, filename: str) -> bool:
-    """Save a LinkedIn post to a JSON file incrementally, with duplicate checking."""
+def save_post_incrementally(post_data: Dict, filename: str, scraped_ids: Set[str],
+                            pending_ids: List[Tuple[str, Optional[str], Optional[str]]]) -> bool:
+    """
+    Save a LinkedIn post incrementally to the run's JSON Lines file, with duplicate checking.
+    Call finalize_output(filename) at the end of the run to produce the JSON array file.
+    
+    Duplicates are checked against the run's in-memory `scraped_ids`, which is updated on save.
+    New IDs are queued in `pending_ids` for flush_scraped_ids() to write to the database in batches.
+    """
     person_name = post_data.get('person_name', 'Unknown')
     post_id = post_data.get('post_id')
     
@@ -131,9 +181,6 @@ def save_post_incrementally(post_data: Dict, filename: str) -> bool:
         logger.warning(f"Post by '{person_name}' has no post_id, cannot check for duplicates")
         # Still save it but without duplicate protection
     elif not TESTING_MODE:  # Only check duplicates if not in testing mode
-        # Load existing scraped IDs
-        scraped_ids = load_scraped_ids()
-        
         # Check if the post ID has already been scraped
         if post_id in scraped_ids:
             logger.info(f"Post by '{person_name}' with ID '{post_id}' has already been scraped. Skipping.")
@@ -142,40 +189,17 @@ def save_post_incrementally(post_data: Dict, filename: str) -> bool:
         logger.debug(f"TESTING_MODE enabled - skipping duplicate check for post ID '{post_id}'")
     
     try:
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # Append the post as one line to the run's JSON Lines file
+        total = get_writer(filename).append(post_data)
         
-        # Check if file exists and has content
-        if os.path.exists(filename) and os.path.getsize(filename) > 0:
-            # Read existing posts
-            with open(filename, 'r', encoding='utf-8') as f:
-                try:
-                    posts = json.load(f)
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error in {filename}: {e}. Starting fresh for post by '{person_name}'")
-                    posts = []
-        else:
-            # Create new file with empty array
-            posts = []
-        
-        # Append new post
-        posts.append(post_data)
-        
-        # Write back to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(posts, f, ensure_ascii=False, indent=2)
-        
-        # Save the new post ID to the SQLite database (only if we have an ID and not in testing mode)
+        # Record the new post ID for this run and queue it for the SQLite database (only if we have an ID and not in testing mode)
         if post_id and not TESTING_MODE:
-            save_scraped_id(
-                post_id, 
-                person_name=post_data.get('person_name'),
-                post_link=post_data.get('post_link')
-            )
+            scraped_ids.add(post_id)
+            pending_ids.append((post_id, post_data.get('person_name'), post_data.get('post_link')))
         elif post_id and TESTING_MODE:
             logger.debug(f"TESTING_MODE enabled - not saving post ID '{post_id}' to duplicate tracker")
         
-        logger.info(f"Successfully saved post by '{person_name}' to {filename} (total: {len(posts)} posts)")
+        logger.info(f"Successfully saved post by '{person_name}' to {filename} (total: {total} posts)")
         return True
         
     except PermissionError as e:
@@ -188,14 +212,103 @@ def save_post_incrementally(post_data: Dict, filename: str) -> bool:
         logger.error(f"Unexpected error saving post by '{person_name}' to {filename}: {e}")
         return False
 
+async def flush_scraped_ids(post_store: AsyncLinkedinPostStore,
+                            pending_ids: List[Tuple[str, Optional[str], Optional[str]]]) -> int:
+    """
+    Write the queued post IDs to the SQLite database in one insert and clear the queue.
+    
+    Returns:
+        int: Number of post IDs that were new
+    """
+    if not pending_ids:
+        return 0
+    saved = await post_store.add_many(list(pending_ids))
+    pending_ids.clear()
+    return saved
+
+# Fallback selector chains, tried in order by both the per-element and the batched extraction
+PERSON_NAME_SELECTORS = [
+    LINKEDIN_PERSON_NAME_SELECTOR,
+    '.meivKfdaNNAuIPkXHsImjugZzmtQ.t-16 a',
+    '.entity-result__content-actor .meivKfdaNNAuIPkXHsImjugZzmtQ span'
+]
+POST_TIME_SELECTORS = [
+    LINKEDIN_POST_TIME_SELECTOR,
+    'p.t-black--light.t-12 span[aria-hidden="true"]',
+    '.t-black--light.t-12 span[aria-hidden="true"]',
+    'p.t-black--light span[aria-hidden="true"]'
+]
+POST_CONTENT_SELECTORS = [
+    LINKEDIN_POST_CONTENT_SELECTOR,
+    'p.relative.entity-result__content-summary--3-lines',
+    '.entity-result__content-summary',
+    'p.entity-result__content-summary',
+    '.rcpNGBRTqHenDVxuthshRGglvWCTyFNRvSvUU p'
+]
+
+def parse_person_name(name_text: Optional[str]) -> Optional[str]:
+    """Get the person name from a name element's text, or None if it doesn't look like one."""
+    if name_text and name_text.strip() and len(name_text.strip()) > 1:
+        return name_text.strip()
+    return None
+
+def clean_person_link(href: Optional[str]) -> Optional[str]:
+    """Strip the query string from a profile/company link."""
+    if not href:
+        return None
+    return href.split('?')[0]
+
+def parse_post_time(time_text: Optional[str]) -> Optional[str]:
+    """Get the relative post time ("2h", "3d", "1w", ...) from a time element's text, or None."""
+    if not time_text or not time_text.strip():
+        return None
+    # Clean up the time text (remove extra characters and get only time part)
+    cleaned_time = time_text.strip()
+    time_units = ['h', 'd', 'w', 'm', 'min', 'hour', 'day', 'week']
+    # Look for time patterns like "2h", "3d", "1w", etc.
+    if '•' in cleaned_time:
+        for part in cleaned_time.split('•'):
+            part = part.strip()
+            # Check if this part looks like a time (contains numbers and time units)
+            if any(char.isdigit() for char in part) and any(unit in part.lower() for unit in time_units):
+                return part
+    # If no bullet separator, check if the whole text looks like time
+    elif any(char.isdigit() for char in cleaned_time) and any(unit in cleaned_time.lower() for unit in time_units):
+        return cleaned_time
+    return None
+
+def clean_post_content(content_text: Optional[str]) -> Optional[str]:
+    """Normalize a content element's text, or None if it is too short to be the post content."""
+    if not content_text or not content_text.strip() or len(content_text.strip()) <= 10:
+        return None
+    # Clean up the content (remove extra whitespace and normalize)
+    cleaned_content = ' '.join(content_text.strip().split())
+    # Remove the "see more" text if present
+    if '…see more' in cleaned_content:
+        cleaned_content = cleaned_content.replace('…see more', '').strip()
+    return cleaned_content
+
+def post_link_from_feed_href(href: Optional[str]) -> Optional[str]:
+    """Accept a feed link href only if it is an activity URL."""
+    if href and '/feed/update/urn:li:activity:' in href:
+        return href
+    return None
+
+def post_link_from_urn(urn: Optional[str]) -> Optional[str]:
+    """Build the feed URL of an activity URN."""
+    if urn and 'urn:li:activity:' in urn:
+        # Extract the activity ID from the URN and construct the LinkedIn feed URL
+        return f"https://www.linkedin.com/feed/update/urn:li:activity:{urn.split(':')[-1]}"
+    return None
+
 async def extract_post_link_from_feed_url(post_element) -> Optional[str]:
     """Extract post link from the feed update URL (Method 1 - Most reliable)."""
     try:
         # Look for the direct feed link
         feed_link_element = await post_element.query_selector(LINKEDIN_POST_LINK_SELECTOR)
         if feed_link_element:
-            href = await feed_link_element.get_attribute('href')
-            if href and '/feed/update/urn:li:activity:' in href:
+            href = post_link_from_feed_href(await feed_link_element.get_attribute('href'))
+            if href:
                 # This is the actual working LinkedIn post URL
                 logger.debug(f"Extracted post link from feed URL: {href}")
                 return href
@@ -213,12 +326,8 @@ async def extract_post_link_from_urn(post_element) -> Optional[str]:
         # Get the element with data-chameleon-result-urn attribute
         urn_element = await post_element.query_selector(LINKEDIN_POST_URN_SELECTOR)
         if urn_element:
-            urn = await urn_element.get_attribute('data-chameleon-result-urn')
-            if urn and 'urn:li:activity:' in urn:
-                # Extract the activity ID from the URN
-                activity_id = urn.split(':')[-1]
-                # Construct the LinkedIn feed URL (this is the correct format)
-                post_url = f"https://www.linkedin.com/feed/update/urn:li:activity:{activity_id}"
+            post_url = post_link_from_urn(await urn_element.get_attribute('data-chameleon-result-urn'))
+            if post_url:
                 logger.debug(f"Extracted post link from URN: {post_url}")
                 return post_url
         
@@ -256,19 +365,13 @@ async def extract_person_info(post_element) -> Dict:
     
     try:
         # Extract person name - try multiple selectors
-        name_selectors = [
-            LINKEDIN_PERSON_NAME_SELECTOR,
-            '.meivKfdaNNAuIPkXHsImjugZzmtQ.t-16 a',
-            '.entity-result__content-actor .meivKfdaNNAuIPkXHsImjugZzmtQ span'
-        ]
-        
-        for selector in name_selectors:
+        for selector in PERSON_NAME_SELECTORS:
             try:
                 name_element = await post_element.query_selector(selector)
                 if name_element:
-                    name_text = await name_element.text_content()
-                    if name_text and name_text.strip() and len(name_text.strip()) > 1:
-                        person_info['person_name'] = name_text.strip()
+                    name = parse_person_name(await name_element.text_content())
+                    if name:
+                        person_info['person_name'] = name
                         break
             except:
                 continue
@@ -276,11 +379,9 @@ async def extract_person_info(post_element) -> Dict:
         # Extract person profile link
         link_element = await post_element.query_selector(LINKEDIN_PERSON_LINK_SELECTOR)
         if link_element:
-            href = await link_element.get_attribute('href')
+            # Clean up the LinkedIn URL
+            href = clean_person_link(await link_element.get_attribute('href'))
             if href:
-                # Clean up the LinkedIn URL
-                if '?' in href:
-                    href = href.split('?')[0]
                 person_info['person_link'] = href
         
         # Extract person heading/title
@@ -299,32 +400,13 @@ async def extract_post_time(post_element) -> str:
     """Extract post time from a LinkedIn post element."""
     try:
         # Try multiple selectors for time
-        time_selectors = [
-            LINKEDIN_POST_TIME_SELECTOR,
-            'p.t-black--light.t-12 span[aria-hidden="true"]',
-            '.t-black--light.t-12 span[aria-hidden="true"]',
-            'p.t-black--light span[aria-hidden="true"]'
-        ]
-        
-        for selector in time_selectors:
+        for selector in POST_TIME_SELECTORS:
             try:
                 time_element = await post_element.query_selector(selector)
                 if time_element:
-                    time_text = await time_element.text_content()
-                    if time_text and time_text.strip():
-                        # Clean up the time text (remove extra characters and get only time part)
-                        cleaned_time = time_text.strip()
-                        # Look for time patterns like "2h", "3d", "1w", etc.
-                        if '•' in cleaned_time:
-                            time_parts = cleaned_time.split('•')
-                            for part in time_parts:
-                                part = part.strip()
-                                # Check if this part looks like a time (contains numbers and time units)
-                                if any(char.isdigit() for char in part) and any(unit in part.lower() for unit in ['h', 'd', 'w', 'm', 'min', 'hour', 'day', 'week']):
-                                    return part
-                        # If no bullet separator, check if the whole text looks like time
-                        elif any(char.isdigit() for char in cleaned_time) and any(unit in cleaned_time.lower() for unit in ['h', 'd', 'w', 'm', 'min', 'hour', 'day', 'week']):
-                            return cleaned_time
+                    post_time = parse_post_time(await time_element.text_content())
+                    if post_time:
+                        return post_time
             except:
                 continue
                 
@@ -333,6 +415,36 @@ async def extract_post_time(post_element) -> str:
     
     return 'Failed to extract'
 
+# In-page helpers shared by the "see more" scripts. LinkedIn may keep the button after expanding a post
+# (only its aria-expanded or label changes, or the content loses its line clamp), and clicking it again
+# collapses the post, so "expanded" is read from that state rather than from the button disappearing.
+# EXPAND_SEE_MORE_JS records the label and clamp of each post it clicks to compare against.
+SEE_MORE_STATE_JS = """
+    const lineClamped = (post, args) => {
+        const content = post.querySelector(args.content);
+        if (!content) return false;
+        const clamp = getComputedStyle(content).webkitLineClamp;
+        return Boolean(clamp) && clamp !== 'none';
+    };
+    const seeMoreExpanded = (post, args) => {
+        const button = post.querySelector(args.see_more);
+        if (!button || button.getAttribute('aria-expanded') === 'true') return true;
+        if (post.dataset.seeMoreLabel === undefined) return false;
+        return button.textContent.trim() !== post.dataset.seeMoreLabel
+            || (post.dataset.seeMoreClamped === 'true' && !lineClamped(post, args));
+    };
+"""
+
+# In-page check of one post item element: is its content expanded (or was never collapsed)?
+SEE_MORE_EXPANDED_JS = """
+(post, args) => {""" + SEE_MORE_STATE_JS + """
+    return seeMoreExpanded(post, args);
+}
+"""
+
+# Arguments of the "see more" scripts
+SEE_MORE_ARGS = {'see_more': LINKEDIN_SEE_MORE_BUTTON_SELECTOR, 'content': LINKEDIN_POST_CONTENT_SELECTOR}
+
 async def extract_post_content(post_element) -> str:
     """Extract post content from a LinkedIn post element."""
     try:
@@ -340,33 +452,27 @@ async def extract_post_content(post_element) -> str:
         see_more_button = await post_element.query_selector(LINKEDIN_SEE_MORE_BUTTON_SELECTOR)
         if see_more_button:
             try:
-                await see_more_button.click()
-                await human_sleep(SLEEP_SHORT)
-                logger.debug("Clicked 'see more' to expand post content")
+                expanded = await post_element.evaluate(SEE_MORE_EXPANDED_JS, SEE_MORE_ARGS)
             except Exception as e:
-                logger.debug(f"Could not click 'see more' button: {e}")
+                logger.debug(f"Could not read the 'see more' state: {e}")
+                expanded = False
+            # Clicking an expanded post's button collapses it again
+            if not expanded:
+                try:
+                    await see_more_button.click()
+                    await human_sleep(SLEEP_SHORT)
+                    logger.debug("Clicked 'see more' to expand post content")
+                except Exception as e:
+                    logger.debug(f"Could not click 'see more' button: {e}")
         
         # Try multiple selectors for content
-        content_selectors = [
-            LINKEDIN_POST_CONTENT_SELECTOR,
-            'p.relative.entity-result__content-summary--3-lines',
-            '.entity-result__content-summary',
-            'p.entity-result__content-summary',
-            '.rcpNGBRTqHenDVxuthshRGglvWCTyFNRvSvUU p'
-        ]
-        
-        for selector in content_selectors:
+        for selector in POST_CONTENT_SELECTORS:
             try:
                 content_element = await post_element.query_selector(selector)
                 if content_element:
-                    content_text = await content_element.text_content()
-                    if content_text and content_text.strip() and len(content_text.strip()) > 10:
-                        # Clean up the content (remove extra whitespace and normalize)
-                        cleaned_content = ' '.join(content_text.strip().split())
-                        # Remove the "see more" text if present
-                        if '…see more' in cleaned_content:
-                            cleaned_content = cleaned_content.replace('…see more', '').strip()
-                        return cleaned_content
+                    content = clean_post_content(await content_element.text_content())
+                    if content:
+                        return content
             except:
                 continue
     
@@ -381,9 +487,6 @@ async def extract_complete_post_info(page, post_element) -> Optional[Dict]:
         # Extract person information
         person_info = await extract_person_info(post_element)
         
-        # Extract post time
-        post_time = await extract_post_time(post_element)
-        
         # Extract post content
         post_content = await extract_post_content(post_element)
         
@@ -406,35 +509,349 @@ async def extract_complete_post_info(page, post_element) -> Optional[Dict]:
             except:
                 pass
         
-        # Get scraped date first
-        scraped_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Extract post time (not needed when the activity ID carries the exact time)
+        post_time = None
+        if not (DECODE_ACTIVITY_TIMESTAMPS and decode_activity_timestamp(post_id)):
+            post_time = await extract_post_time(post_element)
         
-        # Create complete post data with estimated posted date
-        post_data = {
-            **person_info,
-            'posted_time': post_time,
-            'post_content': post_content,
-            'post_link': post_link,
-            'post_id': post_id,
-            'scraped_date': scraped_date,
-            'estimated_posted_date': estimate_posted_date(post_time, scraped_date)  # ADD THIS LINE
-        }
+        return build_post_data(person_info, post_time, post_content, post_link, post_id)
         
-        # Log extraction results
-        person_name = person_info.get('person_name', 'Unknown')
-        failed_fields = [key for key, value in post_data.items() 
-                        if value == 'Failed to extract' and key != 'scraped_date']
-        
-        if failed_fields:
-            logger.warning(f"Post by '{person_name}': Failed to extract {failed_fields}")
+    except Exception as e:
+        logger.error(f"Error extracting complete post info: {e}")
+        return None
+
+def build_post_data(person_info: Dict, post_time: Optional[str], post_content: str, post_link: str,
+                    post_id: Optional[str]) -> Dict:
+    """
+    Assemble the saved post record from the extracted fields and log what could not be extracted.
+    
+    The posted date comes from the activity ID when it decodes (`posted_timestamp` is then the exact
+    creation time), and from the relative post time text otherwise. A post_time of None means the
+    text was not read; it is then formatted from the decoded time.
+    """
+    # Get scraped date first
+    now = datetime.now()
+    scraped_date = now.strftime("%Y-%m-%d %H:%M:%S")
+    
+    created = decode_activity_timestamp(post_id) if DECODE_ACTIVITY_TIMESTAMPS else None
+    if created:
+        post_time = post_time or format_relative_time(created, now)
+        posted_timestamp = created.strftime("%Y-%m-%d %H:%M:%S")
+        estimated_posted_date = created.strftime("%Y-%m-%d")
+    else:
+        post_time = post_time or 'Failed to extract'
+        posted_timestamp = None
+        estimated_posted_date = estimate_posted_date(post_time, scraped_date)
+    
+    # Create complete post data with estimated posted date
+    post_data = {
+        **person_info,
+        'posted_time': post_time,
+        'post_content': post_content,
+        'post_link': post_link,
+        'post_id': post_id,
+        'scraped_date': scraped_date,
+        'estimated_posted_date': estimated_posted_date,
+        'posted_timestamp': posted_timestamp
+    }
+    
+    # Log extraction results
+    person_name = person_info.get('person_name', 'Unknown')
+    failed_fields = [key for key, value in post_data.items() 
+                    if value == 'Failed to extract' and key != 'scraped_date']
+    
+    if failed_fields:
+        logger.warning(f"Post by '{person_name}': Failed to extract {failed_fields}")
+    
+    if not post_id:
+        logger.warning(f"Post by '{person_name}': Failed to extract post_id")
+    else:
+        logger.debug(f"Successfully extracted all fields for post by '{person_name}' (ID: {post_id})")
+    
+    return post_data
+
+# In-page script that reads the raw fields of every post item from `start` up to `end` (null: the end
+# of the list) in one call, querying every fallback selector so Python can apply the same rules as
+# the per-element path. Returns one entry per post item, index-aligned with
+# query_selector_all(LINKEDIN_POST_CONTAINER_SELECTOR)[start:end].
+BATCH_EXTRACT_POSTS_JS = """
+(posts, args) => {""" + SEE_MORE_STATE_JS + """
+    return posts.slice(args.start, args.end === null ? undefined : args.end).map(post => {
+        const sel = args.selectors;
+        const text = (selector) => {
+            const el = post.querySelector(selector);
+            return el ? el.textContent : null;
+        };
+        const attr = (selector, name) => {
+            const el = post.querySelector(selector);
+            return el ? el.getAttribute(name) : null;
+        };
+        return {
+            names: sel.names.map(text),
+            person_link: attr(sel.person_link, 'href'),
+            heading: text(sel.heading),
+            times: sel.times.map(text),
+            contents: sel.contents.map(text),
+            feed_link: attr(sel.feed_link, 'href'),
+            urn: attr(sel.urn, 'data-chameleon-result-urn'),
+            truncated: !seeMoreExpanded(post, sel)
+        };
+    });
+}
+"""
+
+def first_match(parse, texts: List[Optional[str]]) -> Optional[str]:
+    """Apply a fallback chain: the first text the parser accepts, or None."""
+    for text in texts:
+        value = parse(text)
+        if value:
+            return value
+    return None
+
+def build_post_data_from_raw(raw: Dict, post_content: Optional[str] = None) -> Dict:
+    """
+    Build the saved post record from one entry of BATCH_EXTRACT_POSTS_JS, by the same rules as extract_complete_post_info().
+    
+    Args:
+        raw: Raw fields of one post item, as returned by BATCH_EXTRACT_POSTS_JS
+        post_content: Content already re-read from the expanded post (None: use the raw contents)
         
-        if not post_id:
-            logger.warning(f"Post by '{person_name}': Failed to extract post_id")
-        else:
-            logger.debug(f"Successfully extracted all fields for post by '{person_name}' (ID: {post_id})")
+    Returns:
+        Dict: Post data in the same shape as build_post_data()
+    """
+    heading = raw['heading'].strip() if raw['heading'] and raw['heading'].strip() else None
+    person_info = {
+        'person_name': first_match(parse_person_name, raw['names']) or 'Failed to extract',
+        'person_link': clean_person_link(raw['person_link']) or 'Failed to extract',
+        'heading': heading or 'Failed to extract'
+    }
+    
+    if post_content is None:
+        post_content = first_match(clean_post_content, raw['contents']) or 'Failed to extract'
+    
+    post_link = post_link_from_feed_href(raw['feed_link']) or post_link_from_urn(raw['urn']) or 'Failed to extract'
+    post_id = None
+    if post_link != 'Failed to extract':
+        post_id = extract_post_id_from_link(post_link)
+    if not post_id and raw['urn']:
+        post_id = extract_post_id_from_urn(raw['urn'])
+    
+    # Post time text only matters when the activity ID doesn't carry the exact time
+    post_time = None
+    if not (DECODE_ACTIVITY_TIMESTAMPS and decode_activity_timestamp(post_id)):
+        post_time = first_match(parse_post_time, raw['times']) or 'Failed to extract'
+    
+    return build_post_data(person_info, post_time, post_content, post_link, post_id)
+
+async def extract_all_post_info(page, post_elements: List, start_index: int = 0,
+                                end_index: Optional[int] = None) -> Optional[List[Optional[Dict]]]:
+    """
+    Extract complete information for every visible post item with a single page evaluate.
+    
+    Posts whose content is still collapsed behind "see more" get their content re-read
+    with extract_post_content(), which expands it first.
+    
+    Args:
+        page: The Playwright page object
+        post_elements: query_selector_all(LINKEDIN_POST_CONTAINER_SELECTOR) of the same pass
+        start_index: Index of the first post item to extract (earlier items are skipped in-page)
+        end_index: Index after the last post item to extract (None: the end of the list)
         
-        return post_data
+    Returns:
+        List or None: One post data dict per post item (same shape as extract_complete_post_info),
+        index-aligned with post_elements[start_index:end_index], or None if the in-page extraction
+        failed or the list changed under it
+    """
+    post_elements = post_elements[start_index:end_index]
+    try:
+        raw_posts = await page.eval_on_selector_all(
+            LINKEDIN_POST_CONTAINER_SELECTOR,
+            BATCH_EXTRACT_POSTS_JS,
+            {
+                'start': start_index,
+                'end': end_index,
+                'selectors': {
+                    'names': PERSON_NAME_SELECTORS,
+                    'person_link': LINKEDIN_PERSON_LINK_SELECTOR,
+                    'heading': LINKEDIN_HEADING_SELECTOR,
+                    'times': POST_TIME_SELECTORS,
+                    'contents': POST_CONTENT_SELECTORS,
+                    'feed_link': LINKEDIN_POST_LINK_SELECTOR,
+                    'urn': LINKEDIN_POST_URN_SELECTOR,
+                    **SEE_MORE_ARGS
+                }
+            }
+        )
+    except Exception as e:
+        logger.warning(f"Error in batched post extraction: {e}")
+        return None
+    
+    if len(raw_posts) != len(post_elements):
+        logger.debug(f"Batched extraction returned {len(raw_posts)} posts for {len(post_elements)} elements, using per-element extraction")
+        return None
+    
+    posts = []
+    for post_element, raw in zip(post_elements, raw_posts):
+        try:
+            # Collapsed content is re-read after expanding it
+            post_content = await extract_post_content(post_element) if raw['truncated'] else None
+            posts.append(build_post_data_from_raw(raw, post_content))
+        except Exception as e:
+            logger.error(f"Error building batched post info: {e}")
+            posts.append(None)
+    
+    return posts
+
+# In-page script that clicks the "see more" button of every collapsed post item from `start` up to `end`.
+# Returns the number of buttons clicked.
+EXPAND_SEE_MORE_JS = """
+(posts, args) => {""" + SEE_MORE_STATE_JS + """
+    let clicked = 0;
+    posts.slice(args.start, args.end === null ? undefined : args.end).forEach(post => {
+        if (seeMoreExpanded(post, args)) return;
+        const button = post.querySelector(args.see_more);
+        post.dataset.seeMoreLabel = button.textContent.trim();
+        post.dataset.seeMoreClamped = String(lineClamped(post, args));
+        button.click();
+        clicked++;
+    });
+    return clicked;
+}
+"""
+
+# In-page check that the clicked posts have settled: every post item from `start` up to `end` is expanded
+SEE_MORE_SETTLED_JS = """
+(args) => {""" + SEE_MORE_STATE_JS + """
+    return Array.from(document.querySelectorAll(args.posts))
+        .slice(args.start, args.end === null ? undefined : args.end)
+        .every(post => seeMoreExpanded(post, args));
+}
+"""
+
+async def expand_all_posts(page, start_index: int = 0, end_index: Optional[int] = None) -> int:
+    """
+    Expand every collapsed post from `start_index` up to `end_index` with one click pass and a single settle wait.
+    Waits at least a random SEE_MORE_SETTLE_FLOOR duration and at most SEE_MORE_SETTLE_TIMEOUT seconds.
+    Posts that are still collapsed afterwards are expanded one by one during extraction.
+    
+    Args:
+        page: The Playwright page object
+        start_index: Index of the first post item to expand
+        end_index: Index after the last post item to expand (None: the end of the list)
         
+    Returns:
+        int: Number of "see more" buttons clicked
+    """
+    try:
+        clicked = await page.eval_on_selector_all(
+            LINKEDIN_POST_CONTAINER_SELECTOR,
+            EXPAND_SEE_MORE_JS,
+            {'start': start_index, 'end': end_index, **SEE_MORE_ARGS}
+        )
     except Exception as e:
-        logger.error(f"Error extracting complete post info: {e}")
+        logger.warning(f"Error expanding posts: {e}")
+        return 0
+    
+    if not clicked:
+        return 0
+    
+    start = time.monotonic()
+    
+    async def wait_settled() -> bool:
+        try:
+            await page.wait_for_function(
+                SEE_MORE_SETTLED_JS,
+                arg={
+                    'posts': LINKEDIN_POST_CONTAINER_SELECTOR,
+                    **SEE_MORE_ARGS,
+                    'start': start_index,
+                    'end': end_index
+                },
+                timeout=SEE_MORE_SETTLE_TIMEOUT * 1000
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"'See more' settle wait ended with posts still collapsed: {e}")
+            return False
+    
+    # The floor keeps the pace human-like even when the content expands instantly
+    settled, _ = await asyncio.gather(wait_settled(), asyncio.sleep(get_pacer().delay(SEE_MORE_SETTLE_FLOOR)))
+    waited = time.monotonic() - start
+    
+    if settled:
+        logger.info(f"Expanded {clicked} posts in {waited:.2f}s")
+        get_pacer().record_healthy(load_seconds=waited)
+    else:
+        logger.warning(f"Clicked 'see more' on {clicked} posts but some are still collapsed after {waited:.2f}s")
+        get_pacer().record_throttling("posts still collapsed after 'see more'")
+    
+    return clicked
+
+# In-page script that reads only the activity URN (or feed link) of every post item from `start` on
+READ_POST_URNS_JS = """
+(posts, args) => posts.slice(args.start).map(post => {
+    const urn = post.querySelector(args.urn);
+    const link = post.querySelector(args.feed_link);
+    return {
+        urn: urn ? urn.getAttribute('data-chameleon-result-urn') : null,
+        feed_link: link ? link.getAttribute('href') : null
+    };
+})
+"""
+
+async def read_post_ids(page, start_index: int = 0) -> Optional[List[Optional[str]]]:
+    """
+    Read the post IDs of every post item from `start_index` on in one call, without extracting content.
+    
+    Returns:
+        List or None: One post ID (or None) per post item, or None if the in-page read failed
+    """
+    try:
+        raw_posts = await page.eval_on_selector_all(
+            LINKEDIN_POST_CONTAINER_SELECTOR,
+            READ_POST_URNS_JS,
+            {'start': start_index, 'urn': LINKEDIN_POST_URN_SELECTOR, 'feed_link': LINKEDIN_POST_LINK_SELECTOR}
+        )
+    except Exception as e:
+        logger.warning(f"Error reading post IDs: {e}")
         return None
+    
+    post_ids = []
+    for raw in raw_posts:
+        post_link = post_link_from_feed_href(raw['feed_link'])
+        post_id = extract_post_id_from_link(post_link) if post_link else None
+        post_ids.append(post_id or extract_post_id_from_urn(raw['urn']))
+    return post_ids
+
+def find_saved_run(post_ids: List[Optional[str]], saved_before_run: Set[str], run_length: int,
+                   carried: int = 0) -> Tuple[Optional[int], int]:
+    """
+    Find where the part of the saved posts list scraped in earlier runs starts.
+    
+    The list is ordered by when posts were saved, not by activity ID, so a post is only known
+    to be old by its ID being stored. One stored post can sit among new ones (e.g. saved again),
+    so like the per-post stop condition, the old part starts with `run_length` consecutive stored
+    posts. Only posts stored before this run count: posts saved earlier in the same run don't.
+    
+    Args:
+        post_ids: Post IDs of this pass in list order (None where no ID could be read)
+        saved_before_run: Post IDs stored when the run started
+        run_length: Consecutive stored posts that mark the old part (STOP_AFTER_EXISTING_POSTS)
+        carried: Consecutive stored posts at the end of the previous pass
+        
+    Returns:
+        Tuple: (index in this pass where the old part starts, 0 if it began in an earlier pass,
+        or None if not reached; consecutive stored posts at the end of this pass)
+    """
+    consecutive = carried
+    run_start = 0
+    for index, post_id in enumerate(post_ids):
+        if post_id and post_id in saved_before_run:
+            if consecutive == 0:
+                run_start = index
+            consecutive += 1
+            if consecutive >= run_length:
+                return run_start, consecutive
+        else:
+            consecutive = 0
+    return None, consecutive
@@ -0,0 +1,281 @@
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from config import (
+    DECODE_ACTIVITY_TIMESTAMPS,
+    LINKEDIN_CAPTURE_URL_PATTERNS,
+    LINKEDIN_VOYAGER_ENTITY_FIELDS,
+    LINKEDIN_VOYAGER_URN_FIELDS,
+)
+from linkedin_scraper.helpers import (
+    build_post_data,
+    clean_person_link,
+    clean_post_content,
+    decode_activity_timestamp,
+    parse_person_name,
+    parse_post_time,
+    post_link_from_urn,
+)
+
+# Set up logging for the response capture module
+logger = logging.getLogger(__name__)
+
+ACTIVITY_URN_PATTERN = re.compile(r'urn:li:activity:(\d+)')
+
+# How deep to search decoded responses for saved-post entities
+MAX_ENTITY_DEPTH = 16
+
+# Fields a captured record must resolve for the post to skip the DOM entirely
+# (posted_time is also needed when the activity ID does not decode to a time)
+CAPTURED_POST_FIELDS = ('person_name', 'person_link', 'heading', 'post_content')
+
+
+def get_key_path(node: Any, path: List[str]) -> Any:
+    """
+    Follow a list of keys into nested response objects.
+
+    Args:
+        node: Decoded response node
+        path: Keys to follow
+
+    Returns:
+        Any: The value at the path, or None if the path does not exist
+    """
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+def find_activity_id(entity: Dict) -> Optional[str]:
+    """Get the activity ID from the first LINKEDIN_VOYAGER_URN_FIELDS value holding an activity URN."""
+    for key in LINKEDIN_VOYAGER_URN_FIELDS:
+        value = entity.get(key)
+        if isinstance(value, str):
+            match = ACTIVITY_URN_PATTERN.search(value)
+            if match:
+                return match.group(1)
+    return None
+
+
+def parse_post_entity(entity: Any) -> Optional[Dict]:
+    """
+    Map one response object to saved post fields using LINKEDIN_VOYAGER_ENTITY_FIELDS.
+
+    Fields are cleaned by the same rules as the DOM path; a field that is missing or
+    does not pass them is None.
+
+    Args:
+        entity: Candidate response object
+
+    Returns:
+        Dict or None: Post fields, or None if the object is not a saved post
+    """
+    if not isinstance(entity, dict):
+        return None
+
+    post_id = find_activity_id(entity)
+    if not post_id:
+        return None
+
+    fields = {name: get_key_path(entity, path) for name, path in LINKEDIN_VOYAGER_ENTITY_FIELDS.items()}
+    fields = {name: value if isinstance(value, str) else None for name, value in fields.items()}
+    heading = fields.get('heading')
+
+    record = {
+        'post_id': post_id,
+        'person_name': parse_person_name(fields.get('person_name')),
+        'person_link': clean_person_link(fields.get('person_link')),
+        'heading': heading.strip() if heading and heading.strip() else None,
+        'posted_time': parse_post_time(fields.get('posted_time')),
+        'post_content': clean_post_content(fields.get('post_content')),
+        'post_link': post_link_from_urn(f"urn:li:activity:{post_id}")
+    }
+    # Social counts, reactions etc. also carry the activity URN but none of the post fields
+    if not (record['person_name'] or record['post_content']):
+        return None
+    return record
+
+
+def find_post_records(node: Any, depth: int = 0) -> List[Dict]:
+    """
+    Walk a decoded response and collect every object that maps to a saved post.
+
+    Handles both the normalized layout (entities listed in "included") and the
+    nested one (entities inside "data"), since every object is visited.
+
+    Args:
+        node: Decoded response node
+        depth: Current recursion depth
+
+    Returns:
+        List[Dict]: Post records found under this node
+    """
+    if depth > MAX_ENTITY_DEPTH:
+        return []
+    if isinstance(node, list):
+        children = node
+    elif isinstance(node, dict):
+        record = parse_post_entity(node)
+        if record:
+            return [record]
+        children = node.values()
+    else:
+        return []
+
+    records = []
+    for child in children:
+        records.extend(find_post_records(child, depth + 1))
+    return records
+
+
+def more_complete(record: Dict, previous: Optional[Dict]) -> bool:
+    """
+    Check whether a record should replace the one already kept for the same post.
+    
+    The same post can appear more than once (e.g. entity and its cluster item, or a later
+    response with a reduced projection); the record with the most resolved fields wins.
+    
+    Args:
+        record: Newly parsed post record
+        previous: Record already kept for the post, if any
+        
+    Returns:
+        bool: True if `record` should be kept instead of `previous`
+    """
+    if previous is None:
+        return True
+    return sum(v is not None for v in record.values()) > sum(v is not None for v in previous.values())
+
+
+def parse_saved_posts_payload(text: str) -> List[Dict]:
+    """
+    Parse saved post records from a raw Voyager API response body.
+
+    Args:
+        text: Raw response body
+
+    Returns:
+        List[Dict]: Post records with post_id, person_name, person_link, heading,
+        posted_time, post_content and post_link (None where a field is not in the response)
+    """
+    records = {}
+    for record in find_post_records(json.loads(text)):
+        if more_complete(record, records.get(record['post_id'])):
+            records[record['post_id']] = record
+    return list(records.values())
+
+
+def missing_captured_fields(record: Dict) -> List[str]:
+    """
+    List the fields of a captured record that must still come from the DOM.
+
+    Args:
+        record: Captured post record
+
+    Returns:
+        List[str]: Missing field names, empty if the record is enough on its own
+    """
+    missing = [field for field in CAPTURED_POST_FIELDS if not record.get(field)]
+    decoded = DECODE_ACTIVITY_TIMESTAMPS and decode_activity_timestamp(record['post_id'])
+    if not record.get('posted_time') and not decoded:
+        missing.append('posted_time')
+    return missing
+
+
+def build_captured_post_data(record: Dict, dom_post_data: Optional[Dict] = None) -> Dict:
+    """
+    Build the saved post data from a captured record, taking missing fields from the DOM.
+
+    Args:
+        record: Captured post record
+        dom_post_data: Post data extracted from the DOM, if the record is incomplete
+
+    Returns:
+        Dict: Post data in the same shape as build_post_data()
+    """
+    dom_post_data = dom_post_data or {}
+
+    def field(name: str, default: Optional[str] = 'Failed to extract') -> Optional[str]:
+        dom_value = dom_post_data.get(name)
+        if dom_value == 'Failed to extract':
+            dom_value = None
+        return record.get(name) or dom_value or default
+
+    person_info = {
+        'person_name': field('person_name'),
+        'person_link': field('person_link'),
+        'heading': field('heading')
+    }
+    # Like the DOM path, the relative time text is only used when the activity ID does not decode
+    post_time = None
+    if not (DECODE_ACTIVITY_TIMESTAMPS and decode_activity_timestamp(record['post_id'])):
+        post_time = field('posted_time', None)
+    return build_post_data(person_info, post_time, field('post_content'),
+                           field('post_link'), record['post_id'])
+
+
+class LinkedinSavedPostsCapture:
+    """Collects saved post records from the Voyager API responses a page loads while scrolling."""
+
+    def __init__(self):
+        self.records: Dict[str, Dict] = {}
+        self.responses_parsed = 0
+        self.parse_failures = 0
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+
+    def attach(self, page):
+        """Start listening to the page's responses."""
+        page.on("response", self._on_response)
+
+    def detach(self, page):
+        """Stop listening to the page's responses."""
+        try:
+            page.remove_listener("response", self._on_response)
+        except Exception as e:
+            logger.debug(f"Error detaching response capture: {e}")
+
+    async def _on_response(self, response):
+        """Parse matching responses and index their post records."""
+        if not any(pattern in response.url for pattern in LINKEDIN_CAPTURE_URL_PATTERNS):
+            return
+
+        try:
+            records = parse_saved_posts_payload(await response.text())
+        except Exception as e:
+            self.parse_failures += 1
+            logger.debug(f"Could not parse Voyager response {response.url}: {e}")
+            return
+
+        self.responses_parsed += 1
+        for record in records:
+            # A later response may carry the same post with fewer fields
+            if more_complete(record, self.records.get(record['post_id'])):
+                self.records[record['post_id']] = record
+
+        if records:
+            logger.debug(f"Captured {len(records)} saved posts from network response ({len(self.records)} indexed)")
+
+    def lookup(self, post_id: Optional[str]) -> Optional[Dict]:
+        """
+        Find the captured record for a post item.
+
+        Args:
+            post_id: Activity ID read from the post item
+
+        Returns:
+            Dict or None: Captured record, or None if the post must use the DOM path
+        """
+        record = self.records.get(post_id) if post_id else None
+        if record is None:
+            self.misses += 1
+        elif missing_captured_fields(record):
+            self.partial_hits += 1
+        else:
+            self.hits += 1
+        return record
@@ -1,12 +1,15 @@
 from  linkedin_scraper.helpers import *
+from linkedin_scraper.response_capture import LinkedinSavedPostsCapture, build_captured_post_data, missing_captured_fields
 
 
-async def perform_linkedin_scraping(page) -> Optional[int]:
+async def perform_linkedin_scraping(page, response_capture: Optional[LinkedinSavedPostsCapture] = None) -> Optional[int]:
     """
     Scrape LinkedIn saved posts with scrolling support and smart stop condition.
     
     Args:
         page: The Playwright page object to use for scraping
+        response_capture: Optional response capture already attached to the page (attach it before
+            navigating, otherwise the first page of saved posts comes from the DOM)
         
     Returns:
         int or None: Number of posts scraped, or None if scraping failed
@@ -15,15 +18,29 @@ async def perform_linkedin_scraping(page) -> Optional[int]:
     
     logger.info("Starting LinkedIn posts scraping process...")
     
+    # Listen for saved-posts API responses ourselves if the caller did not attach a capture
+    owns_capture = LINKEDIN_NETWORK_CAPTURE_MODE and response_capture is None
+    if owns_capture:
+        response_capture = LinkedinSavedPostsCapture()
+        response_capture.attach(page)
+    
+    # SQLite work runs on the store's own thread so it never stalls the event loop
+    post_store = AsyncLinkedinPostStore()
+    pending_ids = []  # New post IDs not yet written to the database
+    output_filename = None
+    
     try:
         # Create output filename
         output_filename = get_json_filename()
+        # Posts of earlier runs that crashed before finalizing would otherwise stay in .jsonl files
+        finalize_leftovers(os.path.dirname(output_filename), keep=[output_filename])
         logger.info(f"LinkedIn posts will be saved to: {output_filename}")
         
         # Load existing scraped IDs for smart stop condition (only if not in testing mode)
+        # The run keeps this set up to date itself; new IDs reach the database in batches
         scraped_ids = set()
         if not TESTING_MODE:
-            scraped_ids = load_scraped_ids()
+            scraped_ids = await post_store.load_scraped_ids()
             logger.info(f"Loaded {len(scraped_ids)} previously scraped post IDs")
         else:
             logger.info("TESTING_MODE enabled - duplicate detection disabled")
@@ -34,14 +51,19 @@ async def perform_linkedin_scraping(page) -> Optional[int]:
             logger.debug("LinkedIn post container selector found successfully")
         except Exception as e:
             logger.error(f"Could not find LinkedIn post listings: {e}")
+            get_pacer().record_throttling("no post listings")
             return None
         
         # Initialize tracking variables
         processed_post_keys = set()
+        processed_cursor = 0  # Number of post items already visited, from the top of the list
         posts_count = 0
         failed_extractions = 0
         scroll_attempts = 0
         consecutive_existing_posts = 0  # Counter for smart stop condition
+        # The early stop only counts posts saved by earlier runs, never this run's own saves
+        saved_before_run = set(scraped_ids)
+        saved_run = 0  # Consecutive posts of earlier runs at the end of the last pass
         
         
         # Allow unlimited scraping when MAX_POSTS_TO_SCRAPE <= 0
@@ -57,14 +79,69 @@ async def perform_linkedin_scraping(page) -> Optional[int]:
             
             logger.debug(f"Found {current_post_count} post elements on page (scroll attempt {scroll_attempts})")
             
+            # Only visit posts loaded since the last pass when incremental processing is enabled
+            if not INCREMENTAL_SCROLL_PROCESSING:
+                processed_cursor = 0
+            elif current_post_count < processed_cursor:
+                logger.info(f"Post list shrank from {processed_cursor} to {current_post_count} items, restarting from the top")
+                processed_cursor = 0
+            new_post_elements = post_elements[processed_cursor:]
+            
+            # Read only the new posts' IDs (for the early stop and the captured responses)
+            post_ids = None
+            if new_post_elements and ((LINKEDIN_EARLY_STOP and saved_before_run) or response_capture is not None):
+                post_ids = await read_post_ids(page, processed_cursor)
+                if post_ids is not None and len(post_ids) != len(new_post_elements):
+                    post_ids = None
+            
+            # Cut the pass where the posts of earlier runs start, so they are never expanded or extracted
+            saved_run_reached = False
+            if LINKEDIN_EARLY_STOP and saved_before_run:
+                carried = saved_run if processed_cursor > 0 else 0
+                stop_index, saved_run = (None, 0) if post_ids is None else find_saved_run(
+                    post_ids, saved_before_run, STOP_AFTER_EXISTING_POSTS, carried)
+                if stop_index is not None:
+                    logger.info(f"Found {STOP_AFTER_EXISTING_POSTS} consecutive posts saved in earlier runs from post {processed_cursor + stop_index + 1}, everything below was already scraped")
+                    new_post_elements = new_post_elements[:stop_index]
+                    post_ids = post_ids[:stop_index]
+                    saved_run_reached = True
+            end_index = processed_cursor + len(new_post_elements)
+            
+            # Posts fully described by the captured API responses need no expansion or DOM extraction
+            captured_posts = [None] * len(new_post_elements)
+            if response_capture is not None and post_ids is not None:
+                captured_posts = [response_capture.lookup(post_id) for post_id in post_ids]
+            needs_dom = not all(record and not missing_captured_fields(record) for record in captured_posts)
+            
+            # Expand every new collapsed post at once instead of clicking and sleeping per post
+            if BATCHED_SEE_MORE_EXPANSION and new_post_elements and needs_dom:
+                await expand_all_posts(page, processed_cursor, end_index)
+            
+            # Read every new post's fields in one page evaluate (None falls back to per-element extraction)
+            batch_posts = None
+            if BATCHED_POST_EXTRACTION and new_post_elements and needs_dom:
+                batch_posts = await extract_all_post_info(page, post_elements, processed_cursor, end_index)
+            
             # Process visible posts
-            for post_element in post_elements:
+            for post_index, post_element in enumerate(new_post_elements):
                 if shutdown_flag:
                     logger.warning("Shutdown signal received, stopping post processing")
                     break
                 
-                # Extract complete post information (including post link and ID)
-                post_data = await extract_complete_post_info(page, post_element)
+                processed_cursor += 1
+                
+                # Extract complete post information (including post link and ID), from the captured
+                # response when it has every field and from the DOM for the fields it lacks otherwise
+                captured = captured_posts[post_index]
+                if captured and not missing_captured_fields(captured):
+                    post_data = build_captured_post_data(captured)
+                else:
+                    if batch_posts is not None:
+                        post_data = batch_posts[post_index]
+                    else:
+                        post_data = await extract_complete_post_info(page, post_element)
+                    if post_data and captured:
+                        post_data = build_captured_post_data(captured, post_data)
                 if not post_data:
                     failed_extractions += 1
                     continue
@@ -100,8 +177,10 @@ async def perform_linkedin_scraping(page) -> Optional[int]:
                     consecutive_existing_posts = 0
                 
                 # Save post incrementally
-                if save_post_incrementally(post_data, output_filename):
+                if save_post_incrementally(post_data, output_filename, scraped_ids, pending_ids):
                     posts_count += 1
+                    if len(pending_ids) >= LINKEDIN_ID_BATCH_SIZE:
+                        await flush_scraped_ids(post_store, pending_ids)
                     logger.info(f"Successfully processed NEW post {posts_count}: '{person_name}' - '{posted_time}' - ID: {post_id}")
                 else:
                     logger.debug(f"Skipped saving post by '{person_name}' at '{posted_time}' (likely duplicate)")
@@ -122,13 +201,17 @@ async def perform_linkedin_scraping(page) -> Optional[int]:
                     logger.info(f"Reached maximum post count ({posts_count})")
                     break
                 
-                # Add small delay between posts
-                await human_sleep(SLEEP_SHORT)
+                # Optional pacing between posts
+                if LINKEDIN_SLEEP_BETWEEN_POSTS:
+                    await human_sleep(SLEEP_SHORT)
             
             # CHECK STOP CONDITION BEFORE SCROLLING - ADD THIS:
             if consecutive_existing_posts >= STOP_AFTER_EXISTING_POSTS:
                 logger.info(f"Stop condition met. Exiting main scraping loop.")
                 break  # Break from WHILE loop
+            if saved_run_reached:
+                logger.info("Reached the posts saved in earlier runs. Exiting main scraping loop.")
+                break
             
             # Break if we've reached max posts or received shutdown signal
             if (post_limit is not None and posts_count >= post_limit) or shutdown_flag:
@@ -140,13 +223,14 @@ async def perform_linkedin_scraping(page) -> Optional[int]:
             await human_sleep(SLEEP_SCROLL)
             
             # Check if new posts were loaded
-            new_post_elements = await page.query_selector_all(LINKEDIN_POST_CONTAINER_SELECTOR)
-            if len(new_post_elements) <= current_post_count:
+            new_post_count = await page.locator(LINKEDIN_POST_CONTAINER_SELECTOR).count()
+            if new_post_count <= current_post_count:
                 scroll_attempts += 1
                 logger.info(f"No new posts loaded, scroll attempt {scroll_attempts}/{MAX_SCROLL_ATTEMPTS}")
             else:
                 scroll_attempts = 0  # Reset counter if new posts found
-                logger.info(f"Found {len(new_post_elements) - current_post_count} new posts after scrolling")
+                get_pacer().record_healthy()
+                logger.info(f"Found {new_post_count - current_post_count} new posts after scrolling")
         
         # Log final statistics
         logger.info(f"LinkedIn scraping completed! Summary:")
@@ -154,6 +238,13 @@ async def perform_linkedin_scraping(page) -> Optional[int]:
         logger.info(f"  - Failed extractions: {failed_extractions}")
         logger.info(f"  - Consecutive existing posts at end: {consecutive_existing_posts}")
         logger.info(f"  - Shutdown requested: {shutdown_flag}")
+        if response_capture is not None:
+            logger.info(f"  - Network capture: {response_capture.hits} posts from responses, {response_capture.partial_hits} completed from the DOM, {response_capture.misses} via DOM fallback, {response_capture.parse_failures} unparsable responses")
+        
+        await flush_scraped_ids(post_store, pending_ids)
+        
+        # Turn the append-only output into the JSON array file the uploader expects
+        finalize_output(output_filename)
         
         # Upload to Google Drive and trigger webhook
         if posts_count > 0 and output_filename and os.path.exists(output_filename) and not TESTING_MODE:
@@ -183,4 +274,16 @@ async def perform_linkedin_scraping(page) -> Optional[int]:
         
     except Exception as e:
         logger.error(f"Critical error in perform_linkedin_scraping: {e}")
-        return None
\ No newline at end of file
+        return None
+    finally:
+        if owns_capture:
+            response_capture.detach(page)
+        # Posts already written to the output file must not be scraped again next run
+        try:
+            await flush_scraped_ids(post_store, pending_ids)
+        except Exception as e:
+            logger.error(f"Could not save the remaining post IDs: {e}")
+        await post_store.close()
+        # Whatever was saved before a failure still becomes a JSON array file (no-op after a normal finalize)
+        if output_filename:
+            finalize_output(output_filename)
\ No newline at end of file
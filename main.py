@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import logging
 import json
@@ -5,13 +6,25 @@ import os
 from playwright_stealth import Stealth  # Changed import
 from playwright.async_api import async_playwright
 import random
+import time
+from contextlib import nullcontext
 import traceback
 
 # Import the scraping function from scraper.py
 from google_scraper.scraper import perform_scraping
+from google_scraper import scraper as google_scraper
+from google_scraper.response_capture import GoogleJobsResponseCapture
+from linkedin_scraper.response_capture import LinkedinSavedPostsCapture
+from utility.resource_blocker import ResourceBlocker
+from utility.browser_manager import BrowserManager
+from utility.run_checkpoint import RunCheckpoint
+from utility.jsonl_writer import finalize_leftovers
+from utility.keyword_scheduler import KeywordScheduler
+from utility.session_dedup import SessionDedupIndex
+from utility import pacing
 # Import LinkedIn scraper (you'll need to create this)2
 from linkedin_scraper.scraper import perform_linkedin_scraping
-from config import JOB_SEARCH_KEYWORDS , MAX_JOBS_TO_SCRAPE, TESTING_MODE
+from config import JOB_SEARCH_KEYWORDS , MAX_JOBS_TO_SCRAPE, TESTING_MODE, KEYWORD_CONCURRENCY, NETWORK_CAPTURE_MODE, BLOCK_RESOURCES, BROWSER_PERSISTENT_CONTEXT, KEYWORD_SCHEDULING, NEAR_DUPLICATE_DETECTION, PACING_PROFILE, LINKEDIN_NETWORK_CAPTURE_MODE
 
 
 # Set up logging
@@ -93,126 +106,301 @@ def get_random_user_agent():
     ]
     return random.choice(user_agents)
 
-async def run_google_scraper():
-    """Run the Google Jobs scraper"""
+# Navigator overrides applied to every Google Jobs page
+STEALTH_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+    
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+    
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en', 'fr', 'ar'],
+    });
+    
+    window.chrome = {
+        runtime: {},
+    };
+"""
+
+def get_search_url(keyword):
+    """Build the Google Jobs search URL for a keyword"""
+    return f"https://www.google.com/search?q={keyword.replace(' ', '+')}+jobs&ibp=htl;jobs&hl=en"
+
+async def keyword_worker(worker_id, page, keyword_queue, output_file, hash_store, worker_stats, checkpoint=None, scheduler=None,
+                         dedup_index=None, near_duplicate_index=None):
+    """Take keywords from the shared queue and scrape them on this worker's page"""
+    start_time = time.monotonic()
+    
+    # Throttling responses on any page slow down the whole run
+    pacing.get_pacer().attach(page)
+    
+    # Listen before navigating so the first data responses of each search are captured too
+    response_capture = None
+    if NETWORK_CAPTURE_MODE:
+        response_capture = GoogleJobsResponseCapture()
+        response_capture.attach(page)
+    
+    while not keyword_queue.empty() and not google_scraper.shutdown_flag:
+        idx, keyword, keyword_plan = keyword_queue.get_nowait()
+        keyword_plan = keyword_plan or {}
+        
+        logger.info(f"\n{'='*60}")
+        logger.info(f"[worker {worker_id}] Processing keyword {idx}/{len(JOB_SEARCH_KEYWORDS)}: '{keyword}'")
+        logger.info(f"Progress: {sum(stats['jobs'] for stats in worker_stats.values())} total jobs scraped so far")
+        logger.info(f"{'='*60}")
+        
+        try:
+            # Navigate to search URL for this keyword
+            await page.goto(get_search_url(keyword), timeout=0)
+            await asyncio.sleep(2)  # Wait for page load
+            
+            keyword_stats = {}
+            results = await perform_scraping(page, output_file, hash_store=hash_store, response_capture=response_capture,
+                                             checkpoint=checkpoint, keyword=keyword,
+                                             max_jobs_override=keyword_plan.get('max_jobs'),
+                                             max_scrolls_override=keyword_plan.get('max_scrolls'),
+                                             time_budget=keyword_plan.get('time_budget'),
+                                             stats=keyword_stats,
+                                             dedup_index=dedup_index,
+                                             near_duplicate_index=near_duplicate_index)
+        except Exception as e:
+            logger.error(f"[worker {worker_id}] Error scraping keyword '{keyword}': {e}")
+            results = None
+        
+        # A keyword only counts as done if it ran to the end without failing or being interrupted
+        if results is not None and not google_scraper.shutdown_flag:
+            if checkpoint is not None:
+                checkpoint.complete_keyword(keyword)
+            if scheduler is not None:
+                scheduler.record(keyword, keyword_stats.get('jobs', 0), keyword_stats.get('duplicates', 0))
+        
+        worker_stats[worker_id]['keywords'] += 1
+        if results:
+            worker_stats[worker_id]['jobs'] += results
+            logger.info(f"[worker {worker_id}] Completed '{keyword}': {results} jobs scraped")
+        else:
+            logger.warning(f"[worker {worker_id}] No results for keyword: '{keyword}'")
+    
+    if response_capture is not None:
+        response_capture.detach(page)
+    pacing.get_pacer().detach(page)
+    
+    worker_stats[worker_id]['elapsed'] = time.monotonic() - start_time
+
+async def scrape_keywords(context, first_page, output_file, checkpoint=None):
+    """
+    Scrape all JOB_SEARCH_KEYWORDS with a pool of KEYWORD_CONCURRENCY pages
+    sharing one output file and one job hash store.
+    Keywords already completed in the checkpoint are skipped.
+    
+    Returns:
+        int: Total number of jobs scraped across all workers
+    """
+    concurrency = max(1, min(KEYWORD_CONCURRENCY, len(JOB_SEARCH_KEYWORDS)))
+    logger.info(f"Scraping {len(JOB_SEARCH_KEYWORDS)} keywords with {concurrency} worker page(s)")
+    
+    pending = []
+    for idx, keyword in enumerate(JOB_SEARCH_KEYWORDS, 1):
+        if checkpoint is not None and checkpoint.is_completed(keyword):
+            logger.info(f"Skipping keyword {idx}/{len(JOB_SEARCH_KEYWORDS)} '{keyword}' - completed before the interruption")
+            continue
+        pending.append((idx, keyword))
+    
+    # Split the job/time budget by historical yield and queue the most productive keywords first
+    scheduler = None
+    keyword_queue = asyncio.Queue()
+    if KEYWORD_SCHEDULING:
+        scheduler = KeywordScheduler()
+        plan = scheduler.allocate([keyword for _, keyword in pending])
+        scheduler.log_plan(plan)
+        indexes = {keyword: idx for idx, keyword in pending}
+        for keyword, keyword_plan in plan.items():
+            keyword_queue.put_nowait((indexes[keyword], keyword, keyword_plan))
+    else:
+        for idx, keyword in pending:
+            keyword_queue.put_nowait((idx, keyword, None))
+    
+    # Open extra pages in the shared context; worker 1 reuses the page the user prepared
+    pages = [first_page]
+    for _ in range(concurrency - 1):
+        page = await context.new_page()
+        await page.add_init_script(STEALTH_INIT_SCRIPT)
+        pages.append(page)
+    
+    hash_store = google_scraper.open_job_hash_store(read_only=TESTING_MODE)
+    dedup_index = SessionDedupIndex()
+    near_duplicate_index = None
+    if NEAR_DUPLICATE_DETECTION:
+        near_duplicate_index = google_scraper.open_near_duplicate_index(read_only=TESTING_MODE)
+    
+    # Jobs a resumed run already saved are skipped even if the crash came before their hash commit
+    await google_scraper.restore_saved_jobs(output_file, hash_store, dedup_index, near_duplicate_index)
+    worker_stats = {worker_id: {'keywords': 0, 'jobs': 0, 'elapsed': 0.0} for worker_id in range(1, concurrency + 1)}
+    
+    start_time = time.monotonic()
+    try:
+        await asyncio.gather(*(
+            keyword_worker(worker_id, page, keyword_queue, output_file, hash_store, worker_stats, checkpoint, scheduler, dedup_index,
+                           near_duplicate_index)
+            for worker_id, page in enumerate(pages, 1)
+        ))
+    finally:
+        for page in pages[1:]:
+            try:
+                await page.close()
+            except Exception as e:
+                logger.debug(f"Error closing worker page: {e}")
+        await hash_store.close()
+        if near_duplicate_index is not None:
+            await near_duplicate_index.close()
+    total_elapsed = time.monotonic() - start_time
+    
+    # Report per-worker and total throughput
+    total_jobs = sum(stats['jobs'] for stats in worker_stats.values())
+    logger.info("Keyword worker throughput:")
+    for worker_id, stats in worker_stats.items():
+        minutes = stats['elapsed'] / 60
+        rate = stats['jobs'] / minutes if minutes > 0 else 0.0
+        logger.info(f"  - Worker {worker_id}: {stats['keywords']} keywords, {stats['jobs']} jobs in {minutes:.1f} min ({rate:.2f} jobs/min)")
+    total_minutes = total_elapsed / 60
+    total_rate = total_jobs / total_minutes if total_minutes > 0 else 0.0
+    logger.info(f"  - Total: {total_jobs} jobs in {total_minutes:.1f} min ({total_rate:.2f} jobs/min)")
+    dedup_index.log_summary()
+    
+    return total_jobs
+
+# Chromium arguments used for Google Jobs
+GOOGLE_LAUNCH_ARGS = [
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-extensions-http-throttling',
+    '--disable-ipc-flooding-protection',
+    '--no-sandbox',
+    '--disable-setuid-sandbox'
+]
+
+def get_google_context_options():
+    """Get the browser context options used for Google Jobs"""
+    return {
+        'viewport': {'width': 1366, 'height': 768},
+        'user_agent': get_random_user_agent(),
+        'locale': 'en-US',
+        'timezone_id': 'Africa/Casablanca',
+        'permissions': ['geolocation'],
+        'geolocation': {'latitude': 33.5731, 'longitude': -7.5898},
+        'extra_http_headers': {
+            'Accept-Language': 'en-US,en;q=0.9,fr;q=0.8,ar;q=0.7',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-User': '?1',
+            'Cache-Control': 'max-age=0'
+        }
+    }
+
+async def run_google_scraper(browser_manager=None, resume=False, pacing_profile=PACING_PROFILE):
+    """
+    Run the Google Jobs scraper (on a warm persistent context when a browser manager is given).
+    With resume=True, continue the run recorded in the checkpoint file.
+    """
     browser = None
     context = None 
+    page = None
+    resource_blocker = None
+    pacer = pacing.start_run(pacing_profile)
+    
+    # Starting a new run replaces the checkpoint, so say so while the user can still quit and resume
+    interrupted = None if resume else RunCheckpoint.load()
+    if interrupted is not None:
+        logger.warning(f"An unfinished run started at {interrupted.state['started_at']} "
+                       f"({len(interrupted.state['completed_keywords'])}/{len(JOB_SEARCH_KEYWORDS)} keywords completed, "
+                       f"{interrupted.get_totals()['jobs']} jobs in {interrupted.output_file}) will be discarded by this new run. "
+                       f"Its jobs are kept in its output file. Quit and run 'python main.py --resume' to continue it instead.")
     
     try:
         logger.info("Starting Google Jobs scraper with enhanced stealth")
+        run_start = time.monotonic()
         
-        async with Stealth().use_async(async_playwright()) as p:
-            logger.info("Launching browser with stealth settings")
-            browser = await p.chromium.launch(
-                headless=False,
-                args=[
-                    '--no-first-run',
-                    '--no-default-browser-check',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--disable-extensions-http-throttling',
-                    '--disable-ipc-flooding-protection',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox'
-                ]
-            )
-            
-            context = await browser.new_context(
-                viewport={'width': 1366, 'height': 768},
-                user_agent=get_random_user_agent(),
-                locale='en-US',
-                timezone_id='Africa/Casablanca',
-                permissions=['geolocation'],
-                geolocation={'latitude': 33.5731, 'longitude': -7.5898},
-                extra_http_headers={
-                    'Accept-Language': 'en-US,en;q=0.9,fr;q=0.8,ar;q=0.7',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0'
-                }
-            )
+        async with (nullcontext() if browser_manager else Stealth().use_async(async_playwright())) as p:
+            if browser_manager:
+                import_cookies = browser_manager.cookies_outdated('google', 'data/google_cookies.json')
+                context, warm = await browser_manager.get_context('google', launch_args=GOOGLE_LAUNCH_ARGS, **get_google_context_options())
+                resource_blocker = browser_manager.resource_blockers.get('google')
+            else:
+                import_cookies = True
+                warm = False
+                logger.info("Launching browser with stealth settings")
+                browser = await p.chromium.launch(headless=False, args=GOOGLE_LAUNCH_ARGS)
+                context = await browser.new_context(**get_google_context_options())
+                
+                if BLOCK_RESOURCES:
+                    resource_blocker = ResourceBlocker()
+                    await resource_blocker.attach(context)
             
-            page = await context.new_page()
+            # A persistent launch already opened a blank page: use it rather than leaving it open next to a new one
+            page = await browser_manager.get_page(context) if browser_manager else await context.new_page()
+            pacer.attach(page)
             
-            await load_cookies(context)
+            # A persistent profile keeps its own session; the cookie file seeds a new one and is
+            # imported again only when it was refreshed since the last import
+            if import_cookies:
+                if await load_cookies(context) and browser_manager:
+                    browser_manager.mark_cookies_imported('google')
             
-            await page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-                
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en', 'fr', 'ar'],
-                });
-                
-                window.chrome = {
-                    runtime: {},
-                };
-            """)
+            await page.add_init_script(STEALTH_INIT_SCRIPT)
             
             logger.info("Navigating to Google Jobs search")
             await page.goto("https://www.google.com/search?q=software+engineer+jobs&ibp=htl;jobs&hl=en", timeout=0)
+            logger.info(f"Time to first scrape-ready page: {time.monotonic() - run_start:.2f}s ({'warm' if warm else 'cold'} browser)")
                         
             logger.info("Browser is ready. Solve CAPTCHA if needed, then press Enter to start scraping...")
             await asyncio.get_event_loop().run_in_executor(None, input)
             
-            await save_cookies(context)
+            if await save_cookies(context) and browser_manager:
+                # The file now matches the profile's session, no need to import it next run
+                browser_manager.mark_cookies_imported('google')
             
-            # Create single output file for all keywords
-            from google_scraper.scraper import get_json_filename
-            output_file = get_json_filename()
+            # Continue the interrupted run's output file, or create a single output file for all keywords
+            checkpoint = RunCheckpoint.load() if resume else None
+            if checkpoint:
+                output_file = checkpoint.output_file
+                logger.info(f"Resuming run started at {checkpoint.state['started_at']} - {len(checkpoint.state['completed_keywords'])} keywords already completed")
+            else:
+                if resume:
+                    logger.warning("No checkpoint found to resume, starting a new run")
+                from google_scraper.scraper import get_json_filename
+                output_file = get_json_filename()
+                checkpoint = RunCheckpoint(output_file)
+                checkpoint.save()
             logger.info(f"All jobs will be saved to: {output_file}")
             
-            total_jobs = 0
-            # REMOVE THIS LINE:
-            # total_limit = MAX_JOBS_TO_SCRAPE if MAX_JOBS_TO_SCRAPE > 0 else None
+            # Outputs of interrupted runs that are not being resumed become JSON array files
+            finalize_leftovers(os.path.dirname(output_file), keep=[output_file])
+            
+            await scrape_keywords(context, page, output_file, checkpoint)
+            totals = checkpoint.get_totals()
+            total_jobs = totals['jobs']
             
-            # Loop through keywords
-            for idx, keyword in enumerate(JOB_SEARCH_KEYWORDS, 1):
-                # REMOVE THIS CHECK:
-                # if total_limit is not None and total_jobs >= total_limit:
-                #     logger.info(f"Reached global job limit ({total_limit}). Stopping.")
-                #     break
+            if google_scraper.shutdown_flag:
+                logger.warning(f"Run interrupted - progress saved to {checkpoint.path}. Run 'python main.py --resume' to continue it.")
+            else:
+                # Turn the append-only output into the JSON array file the uploader expects
+                from google_scraper.scraper import finalize_output
+                finalize_output(output_file)
+                checkpoint.finish()
                 
                 logger.info(f"\n{'='*60}")
-                logger.info(f"Processing keyword {idx}/{len(JOB_SEARCH_KEYWORDS)}: '{keyword}'")
-                logger.info(f"Progress: {total_jobs} total jobs scraped so far")  # CHANGED THIS LINE
+                logger.info(f"All keywords processed! Total jobs scraped: {total_jobs}")
+                logger.info(f"Results saved to: {output_file}")
                 logger.info(f"{'='*60}")
-                
-                # Navigate to search URL for this keyword
-                search_url = f"https://www.google.com/search?q={keyword.replace(' ', '+')}+jobs&ibp=htl;jobs&hl=en"
-                await page.goto(search_url, timeout=0)
-                await asyncio.sleep(2)  # Wait for page load
-                
-                # REMOVE THESE LINES:
-                # remaining_jobs = None
-                # if total_limit is not None:
-                #     remaining_jobs = total_limit - total_jobs
-                #     if remaining_jobs <= 0:
-                #         break
-                
-                # CHANGE THIS LINE - remove remaining_jobs parameter (let it use config):
-                results = await perform_scraping(page, output_file)
-                
-                if results:
-                    total_jobs += results
-                    logger.info(f"Completed '{keyword}': {results} jobs scraped (total: {total_jobs})")
-                else:
-                    logger.warning(f"No results for keyword: '{keyword}'")
-            
-            logger.info(f"\n{'='*60}")
-            logger.info(f"All keywords processed! Total jobs scraped: {total_jobs}")
-            logger.info(f"Results saved to: {output_file}")
-            logger.info(f"{'='*60}")
 
             # Upload after all keywords are done:
             if total_jobs > 0 and os.path.exists(output_file) and not TESTING_MODE:
@@ -222,12 +410,12 @@ async def run_google_scraper():
                     logger.info("Uploading all results to Google Drive...")
                     uploader = GoogleDriveUploader(scraper_type="google_jobs")
                     
-                    # Note: We don't have per-keyword stats, so use total counts
+                    # Totals across all keywords, including work done before a resume
                     upload_result = uploader.upload_scraper_results(
                         output_file, 
                         total_jobs, 
-                        0,  # We don't track total skipped across keywords
-                        0   # We don't track total failed across keywords
+                        totals['duplicates'],
+                        totals['failed']
                     )
                     
                     if upload_result:
@@ -248,6 +436,15 @@ async def run_google_scraper():
         logger.info("Press Enter to close the browser and exit...")
         await asyncio.get_event_loop().run_in_executor(None, input)
     finally:
+        pacer.log_summary()
+        if resource_blocker:
+            resource_blocker.log_summary()
+        if browser_manager and page:
+            # Keep the persistent context warm for the next run, only release this run's page
+            try:
+                await page.close()
+            except Exception as e:
+                logger.error(f"Error closing page: {e}")
         if browser:
             try:
                 logger.info("Closing browser")
@@ -255,51 +452,78 @@ async def run_google_scraper():
             except Exception as e:
                 logger.error(f"Error closing browser: {e}")
 
-async def run_linkedin_scraper():
-    """Run the LinkedIn Saved Jobs scraper"""
+async def run_linkedin_scraper(browser_manager=None, pacing_profile=PACING_PROFILE):
+    """Run the LinkedIn Saved Jobs scraper (on a warm persistent context when a browser manager is given)"""
     browser = None
     context = None
+    page = None
+    resource_blocker = None
+    response_capture = None
+    pacer = pacing.start_run(pacing_profile)
     
     try:
         logger.info("Starting LinkedIn Saved Jobs scraper")
+        run_start = time.monotonic()
         
         # Initialize Stealth with Playwright
-        async with Stealth().use_async(async_playwright()) as p:
-            logger.info("Launching browser for LinkedIn scraping")
-            browser = await p.chromium.launch(
-                headless=False,
-                # args=[
-                #     '--no-first-run',
-                #     '--no-default-browser-check',
-                #     '--disable-blink-features=AutomationControlled',
-                #     '--disable-web-security',
-                #     '--disable-features=VizDisplayCompositor',
-                #     '--no-sandbox',
-                #     '--disable-setuid-sandbox'
-                # ]
-            )
+        async with (nullcontext() if browser_manager else Stealth().use_async(async_playwright())) as p:
+            if browser_manager:
+                import_cookies = browser_manager.cookies_outdated('linkedin', 'data/linkedin_cookies.json')
+                context, warm = await browser_manager.get_context('linkedin')
+                resource_blocker = browser_manager.resource_blockers.get('linkedin')
+            else:
+                import_cookies = True
+                warm = False
+                logger.info("Launching browser for LinkedIn scraping")
+                browser = await p.chromium.launch(
+                    headless=False,
+                    # args=[
+                    #     '--no-first-run',
+                    #     '--no-default-browser-check',
+                    #     '--disable-blink-features=AutomationControlled',
+                    #     '--disable-web-security',
+                    #     '--disable-features=VizDisplayCompositor',
+                    #     '--no-sandbox',
+                    #     '--disable-setuid-sandbox'
+                    # ]
+                )
+                
+                # Create context with realistic settings
+                context = await browser.new_context(
+                    # viewport={'width': 1366, 'height': 768},
+                    # user_agent=get_random_user_agent(),
+                    # locale='en-US',
+                    # timezone_id='Africa/Casablanca',
+                    # extra_http_headers={
+                    #     'Accept-Language': 'en-US,en;q=0.9,fr;q=0.8,ar;q=0.7',
+                    #     'Accept-Encoding': 'gzip, deflate, br',
+                    #     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8'
+                    # }
+                )
+                
+                if BLOCK_RESOURCES:
+                    resource_blocker = ResourceBlocker()
+                    await resource_blocker.attach(context)
             
-            # Create context with realistic settings
-            context = await browser.new_context(
-                # viewport={'width': 1366, 'height': 768},
-                # user_agent=get_random_user_agent(),
-                # locale='en-US',
-                # timezone_id='Africa/Casablanca',
-                # extra_http_headers={
-                #     'Accept-Language': 'en-US,en;q=0.9,fr;q=0.8,ar;q=0.7',
-                #     'Accept-Encoding': 'gzip, deflate, br',
-                #     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8'
-                # }
-            )
+            # A persistent launch already opened a blank page: use it rather than leaving it open next to a new one
+            page = await browser_manager.get_page(context) if browser_manager else await context.new_page()
+            pacer.attach(page)
             
-            page = await context.new_page()
+            # Listen before navigating so the first page of saved posts is captured too
+            if LINKEDIN_NETWORK_CAPTURE_MODE:
+                response_capture = LinkedinSavedPostsCapture()
+                response_capture.attach(page)
             
-            # Load LinkedIn cookies (separate from Google cookies)
-            await load_cookies(context, 'data/linkedin_cookies.json')
+            # Load LinkedIn cookies (separate from Google cookies); a persistent profile keeps its own
+            # session and only imports the file again when it was refreshed since the last import
+            if import_cookies:
+                if await load_cookies(context, 'data/linkedin_cookies.json') and browser_manager:
+                    browser_manager.mark_cookies_imported('linkedin')
             
             # Navigate to LinkedIn
             logger.info("Navigating to LinkedIn")
             await page.goto("https://www.linkedin.com/my-items/saved-posts/", timeout=0)
+            logger.info(f"Time to first scrape-ready page: {time.monotonic() - run_start:.2f}s ({'warm' if warm else 'cold'} browser)")
             
             logger.info("LinkedIn page loaded. Please log in if needed.")
             logger.info("Press Enter here to start scraping saved jobs...")
@@ -313,7 +537,7 @@ async def run_linkedin_scraper():
             
             # Call the LinkedIn scraping function
             logger.info("Starting LinkedIn scraping process")
-            results = await perform_linkedin_scraping(page)
+            results = await perform_linkedin_scraping(page, response_capture=response_capture)
             
             if results:
                 logger.info(f"LinkedIn scraping completed successfully! Processed {results} jobs")
@@ -332,6 +556,17 @@ async def run_linkedin_scraper():
         logger.info("Press Enter to close the browser and exit...")
         await asyncio.get_event_loop().run_in_executor(None, input)
     finally:
+        pacer.log_summary()
+        if resource_blocker:
+            resource_blocker.log_summary()
+        if response_capture is not None:
+            response_capture.detach(page)
+        if browser_manager and page:
+            # Keep the persistent context warm for the next run, only release this run's page
+            try:
+                await page.close()
+            except Exception as e:
+                logger.error(f"Error closing page: {e}")
         if browser:
             try:
                 logger.info("Closing browser")
@@ -339,23 +574,38 @@ async def run_linkedin_scraper():
             except Exception as e:
                 logger.error(f"Error closing browser: {e}")
 
-async def main():
-    """Main function with menu selection"""
+async def main(resume=False, pacing_profile=PACING_PROFILE):
+    """Main function with menu selection (or a direct Google Jobs resume)"""
     logger.info("Job Scraper Toolkit Starting...")
     
+    # One long-lived browser per profile, reused by every menu run
+    browser_manager = BrowserManager() if BROWSER_PERSISTENT_CONTEXT else None
+    
+    try:
+        if resume:
+            logger.info("Resuming interrupted Google Jobs run")
+            await run_google_scraper(browser_manager, resume=True, pacing_profile=pacing_profile)
+        else:
+            await run_menu(browser_manager, pacing_profile)
+    finally:
+        if browser_manager:
+            await browser_manager.close()
+
+async def run_menu(browser_manager=None, pacing_profile=PACING_PROFILE):
+    """Show the menu and run the selected scrapers until the user exits"""
     while True:
         try:
             choice = get_user_choice()
             
             if choice == 1:
                 logger.info("User selected Google Jobs Scraper")
-                await run_google_scraper()
+                await run_google_scraper(browser_manager, pacing_profile=pacing_profile)
                 # Don't break here - go back to menu
                 print("\nGoogle Jobs Scraper completed. Returning to main menu...")
                 
             elif choice == 2:
                 logger.info("User selected LinkedIn Saved Jobs Scraper")
-                await run_linkedin_scraper()
+                await run_linkedin_scraper(browser_manager, pacing_profile=pacing_profile)
                 # Don't break here - go back to menu
                 print("\nLinkedIn Scraper completed. Returning to main menu...")
                 
@@ -374,8 +624,14 @@ async def main():
 
 # Run the main function
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Job Scraper Toolkit")
+    parser.add_argument('--resume', action='store_true', help="Resume the interrupted Google Jobs run from its checkpoint")
+    parser.add_argument('--pacing', choices=pacing.PROFILES, default=PACING_PROFILE,
+                        help="'adaptive' scales the human-like delays with the site's health, 'fixed' uses the SLEEP_* ranges as configured")
+    args = parser.parse_args()
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(resume=args.resume, pacing_profile=args.pacing))
     except KeyboardInterrupt:
         logger.info("Script terminated by user (Ctrl+C)")
     except Exception as e:
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utility.browser_manager as browser_manager_module
+from utility.browser_manager import BrowserManager
+
+# Set up logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class FakePage:
+    """Page of a fake context"""
+
+    def __init__(self, context, url='about:blank'):
+        self.context = context
+        self.url = url
+
+    async def close(self):
+        self.context.pages.remove(self)
+
+
+class FakeContext:
+    """Persistent context that opens with one blank page, like launch_persistent_context"""
+
+    def __init__(self):
+        self.pages = [FakePage(self)]
+        self.handlers = {}
+        self.new_pages = 0
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        self.new_pages += 1
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.handlers['close'](self)
+
+
+class FakeChromium:
+    async def launch_persistent_context(self, profile_dir, **options):
+        return FakeContext()
+
+
+class FakePlaywright:
+    chromium = FakeChromium()
+
+
+def check(name, passed, detail):
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+async def main():
+    results = []
+    browser_manager_module.BLOCK_RESOURCES = True
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = BrowserManager(user_data_root=tmp_dir)
+        manager._playwright = FakePlaywright()
+
+        context, warm = await manager.get_context('google')
+        page = await manager.get_page(context)
+        results.append(check("The launch's blank page is used instead of opening another",
+                             page is context.pages[0] and len(context.pages) == 1 and context.new_pages == 0,
+                             f"{len(context.pages)} pages open, {context.new_pages} opened by the run"))
+
+        # A page in use by a run is not handed out again
+        page.url = 'https://www.google.com/search?q=stage&ibp=htl;jobs'
+        second = await manager.get_page(context)
+        results.append(check("A page already in use is not reused", second is not page and context.new_pages == 1,
+                             f"{context.new_pages} pages opened"))
+
+        # The user closes the browser window: the profile relaunches with a fresh blocker
+        old_blocker = manager.resource_blockers['google']
+        await context.close()
+        results.append(check("Closing the context drops its resource blocker",
+                             'google' not in manager.resource_blockers and not manager.is_warm('google'),
+                             f"blockers left: {list(manager.resource_blockers)}"))
+        context, warm = await manager.get_context('google')
+        results.append(check("A relaunched profile reports its new blocker",
+                             not warm and manager.resource_blockers.get('google') not in (None, old_blocker),
+                             f"warm={warm}, blocker replaced={manager.resource_blockers.get('google') is not old_blocker}"))
+
+        await manager.close()
+        results.append(check("Closing the manager drops every blocker", not manager.resource_blockers,
+                             f"blockers left: {list(manager.resource_blockers)}"))
+
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
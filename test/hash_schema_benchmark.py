@@ -0,0 +1,130 @@
+import argparse
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility.job_hash_store import JobHashStore, LEGACY_TABLE, fingerprint
+from utility.migrate_job_hashes import migrate
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def make_job(i):
+    """Build a synthetic job posting"""
+    return {
+        'title': f"Senior Software Engineer - Backend Platform {i}",
+        'company': f"Company {i % 5000} Technologies",
+        'location': f"City {i % 300}, Morocco",
+        'description': f"Description of job {i}"
+    }
+
+
+def create_old_format_db(db_path, count):
+    """Write `count` jobs in the original single TEXT-keyed table"""
+    hasher = JobHashStore.__new__(JobHashStore)
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(f'''
+            CREATE TABLE {LEGACY_TABLE} (
+                hash TEXT PRIMARY KEY,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                title TEXT,
+                company TEXT,
+                location TEXT,
+                basic_hash TEXT
+            )
+        ''')
+        conn.execute(f'CREATE INDEX idx_basic_hash ON {LEGACY_TABLE}(basic_hash)')
+        rows = []
+        for i in range(count):
+            job = make_job(i)
+            rows.append((hasher._generate_full_hash(job), now, now, job['title'], job['company'], job['location'], hasher._generate_basic_hash(job)))
+        conn.executemany(f"INSERT INTO {LEGACY_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+
+def table_sizes(db_path):
+    """Get bytes used per table/index, from SQLite's dbstat virtual table"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return dict(conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name").fetchall())
+    finally:
+        conn.close()
+
+
+def hot_bytes(sizes, compact):
+    """Bytes of what a basic/full hash lookup touches (the table or WITHOUT ROWID table plus the basic_hash index)"""
+    if compact:
+        return sum(size for name, size in sizes.items() if name.startswith('job_fp_') or name.startswith('idx_job_fp_'))
+    return sum(size for name, size in sizes.items() if name in (LEGACY_TABLE, 'idx_basic_hash') or name.startswith('sqlite_autoindex_job_hashes'))
+
+
+def bench_lookups(db_path, keys, compact):
+    """Time basic hash lookups on a fresh connection with a small page cache"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA cache_size=-2000")  # 2 MB, so the index size decides how much stays cached
+    table = None
+    if compact:
+        table = conn.execute("SELECT name FROM sqlite_master WHERE name LIKE 'job_fp_%' AND type = 'table'").fetchone()[0]
+    start = time.perf_counter()
+    for key in keys:
+        if compact:
+            conn.execute(f"SELECT 1 FROM {table} WHERE basic_hash = ? LIMIT 1", (fingerprint(key),)).fetchone()
+        else:
+            conn.execute(f"SELECT 1 FROM {LEGACY_TABLE} WHERE basic_hash = ? LIMIT 1", (key,)).fetchone()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed / len(keys)
+
+
+def run_benchmark(count, lookups):
+    """Compare the original schema with the compact one at one store size"""
+    hasher = JobHashStore.__new__(JobHashStore)
+    rng = random.Random(42)
+    keys = [hasher._generate_basic_hash(make_job(rng.randrange(count * 2))) for _ in range(lookups)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'job_hashes.db')
+        logger.info(f"Creating old-format store with {count:,} hashes...")
+        create_old_format_db(db_path, count)
+        old_size = os.path.getsize(db_path)
+        old_sizes = table_sizes(db_path)
+        old_lookup = bench_lookups(db_path, keys, compact=False)
+
+        migrate(db_path, batch_size=50_000, pause=0, backup=False)
+        new_size = os.path.getsize(db_path)
+        new_sizes = table_sizes(db_path)
+        new_lookup = bench_lookups(db_path, keys, compact=True)
+
+    old_hot, new_hot = hot_bytes(old_sizes, False), hot_bytes(new_sizes, True)
+    logger.info(f"Results with {count:,} stored hashes:")
+    logger.info(f"  - File size: {old_size / 1e6:.1f} MB -> {new_size / 1e6:.1f} MB ({old_size / new_size:.1f}x smaller)")
+    logger.info(f"  - Lookup tables and indexes: {old_hot / 1e6:.1f} MB -> {new_hot / 1e6:.1f} MB ({old_hot / new_hot:.1f}x smaller)")
+    logger.info(f"  - Basic hash lookup (2 MB page cache): {old_lookup * 1e6:.1f} us -> {new_lookup * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Size and lookup benchmark of the old and compact job hash schemas")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000], help="Stored hash counts to benchmark")
+    parser.add_argument('--lookups', type=int, default=20000, help="Basic hash lookups per run")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run_benchmark(size, args.lookups)
@@ -0,0 +1,119 @@
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility.job_hash_store import JobHashStore, fingerprint
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Jobs per scroll pass, the unit perform_scraping checks in one batch
+PAGE_SIZE = 20
+
+
+def make_job(i):
+    """Build a synthetic job posting"""
+    return {
+        'title': f"Software Engineer {i}",
+        'company': f"Company {i % 5000}",
+        'location': f"City {i % 300}",
+        'description': f"Description of job {i}"
+    }
+
+
+def populate(db_path, count):
+    """Fill a hash store with `count` jobs in one transaction"""
+    store = JobHashStore(db_path=db_path)
+    now = int(datetime.now().timestamp())
+    rows = []
+    for i in range(count):
+        job = make_job(i)
+        rows.append((fingerprint(store._generate_full_hash(job)), fingerprint(store._generate_basic_hash(job)),
+                     now, now, job['title'], job['company'], job['location']))
+
+    with store._connection() as conn:
+        store._insert_rows(conn, store._current_partition(conn), rows)
+        conn.commit()
+
+def make_lookups(stored, lookups):
+    """Half known jobs, half unseen ones"""
+    jobs = [make_job(random.randrange(stored)) for _ in range(lookups // 2)]
+    jobs += [make_job(stored + i) for i in range(lookups - len(jobs))]
+    random.shuffle(jobs)
+    return jobs
+
+
+def bench_lookups(store, jobs, batched):
+    """Time basic duplicate checks, per job or per page"""
+    start = time.perf_counter()
+    if batched:
+        for page_start in range(0, len(jobs), PAGE_SIZE):
+            store.find_basic_duplicates(jobs[page_start:page_start + PAGE_SIZE])
+    else:
+        for job in jobs:
+            store.is_basic_duplicate(job)
+    return time.perf_counter() - start
+
+
+def bench_inserts(store, jobs):
+    """Time recording new jobs (group-committed in persistent mode)"""
+    start = time.perf_counter()
+    for job in jobs:
+        store.add_job(job)
+    store.flush()
+    return time.perf_counter() - start
+
+
+def run_benchmark(stored, lookups, inserts):
+    """Compare the per-call store with the persistent, batched one at one store size"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'job_hashes.db')
+        logger.info(f"Populating store with {stored:,} hashes...")
+        populate(db_path, stored)
+
+        jobs = make_lookups(stored, lookups)
+        new_jobs = [make_job(stored * 2 + i) for i in range(inserts)]
+        new_jobs_persistent = [make_job(stored * 3 + i) for i in range(inserts)]
+
+        per_call = JobHashStore(db_path=db_path)
+        persistent = JobHashStore(db_path=db_path, persistent=True)
+        bloom = JobHashStore(db_path=db_path, persistent=True, bloom_fp_rate=0.01)
+
+        results = {
+            'per-call lookups': bench_lookups(per_call, jobs, batched=False),
+            'persistent lookups': bench_lookups(persistent, jobs, batched=False),
+            f'persistent batch lookups ({PAGE_SIZE}/query)': bench_lookups(persistent, jobs, batched=True),
+            f'persistent + Bloom batch lookups ({PAGE_SIZE}/query)': bench_lookups(bloom, jobs, batched=True),
+            'per-call inserts': bench_inserts(per_call, new_jobs),
+            'persistent group-commit inserts': bench_inserts(persistent, new_jobs_persistent),
+        }
+        persistent.close()
+        bloom.close()
+
+    logger.info(f"Results with {stored:,} stored hashes:")
+    for name, elapsed in results.items():
+        count = inserts if 'inserts' in name else lookups
+        logger.info(f"  - {name}: {elapsed:.3f}s ({elapsed / count * 1e6:.1f} us/job)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark of JobHashStore lookups and inserts")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000], help="Stored hash counts to benchmark")
+    parser.add_argument('--lookups', type=int, default=2000, help="Basic duplicate checks per run")
+    parser.add_argument('--inserts', type=int, default=500, help="New jobs recorded per run")
+    args = parser.parse_args()
+
+    random.seed(42)
+    for size in args.sizes:
+        run_benchmark(size, args.lookups, args.inserts)
@@ -0,0 +1,69 @@
+import logging
+import os
+import sys
+import tempfile
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utility.keyword_scheduler as keyword_scheduler
+from utility.keyword_scheduler import KeywordScheduler
+
+# Set up logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def make_scheduler(tmp_dir, yields):
+    """Scheduler whose history gives each keyword the smoothed yield in `yields` (over 5 runs, none dead)"""
+    scheduler = KeywordScheduler(history_path=os.path.join(tmp_dir, 'keyword_yield.json'))
+    scheduler.history = {keyword: {'runs': 5, 'new_ewma': value, 'duplicate_ewma': 0.0} for keyword, value in yields.items()}
+    return scheduler
+
+
+def check(name, passed, detail):
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+def main():
+    results = []
+    keyword_scheduler.GLOBAL_TIME_BUDGET_MINUTES = 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # One productive keyword and three weak (but not dead) ones: their proportional share is under one job
+        keyword_scheduler.GLOBAL_JOB_BUDGET = 20
+        keyword_scheduler.MAX_JOBS_TO_SCRAPE = 35
+        scheduler = make_scheduler(tmp_dir, {'stage data': 100.0, 'stage php': 0.8, 'stage cobol': 0.7, 'stage sap': 0.6})
+        plan = scheduler.allocate(list(scheduler.history))
+        weak = {keyword: plan[keyword]['max_jobs'] for keyword in ('stage php', 'stage cobol', 'stage sap')}
+        results.append(check("Weak keywords still get at least a probe's jobs",
+                             all(jobs >= keyword_scheduler.KEYWORD_PROBE_MAX_JOBS for jobs in weak.values()),
+                             f"weak keywords get {weak}, 'stage data' gets {plan['stage data']['max_jobs']}"))
+        results.append(check("Budget still goes to the productive keyword first",
+                             plan['stage data']['max_jobs'] == 20 - sum(weak.values()),
+                             f"{sum(entry['max_jobs'] for entry in plan.values())} jobs planned for a budget of 20"))
+
+        # One dominant keyword clipped at the per-keyword limit: its excess goes to the others
+        keyword_scheduler.GLOBAL_JOB_BUDGET = 100
+        scheduler = make_scheduler(tmp_dir, {'stage java': 90.0, 'stage react': 5.0, 'stage devops': 5.0})
+        plan = scheduler.allocate(list(scheduler.history))
+        jobs = {keyword: entry['max_jobs'] for keyword, entry in plan.items()}
+        results.append(check("Excess above MAX_JOBS_TO_SCRAPE is handed to the other keywords",
+                             jobs['stage java'] == 35 and sum(jobs.values()) == 100 and max(jobs.values()) <= 35,
+                             f"{jobs} (total {sum(jobs.values())} of 100)"))
+
+        # More budget than every keyword can use: each stops at the limit
+        keyword_scheduler.GLOBAL_JOB_BUDGET = 500
+        plan = scheduler.allocate(list(scheduler.history))
+        jobs = {keyword: entry['max_jobs'] for keyword, entry in plan.items()}
+        results.append(check("No keyword exceeds the limit when the budget is larger than all limits",
+                             all(value == 35 for value in jobs.values()), f"{jobs}"))
+
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
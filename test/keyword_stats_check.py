@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import google_scraper.scraper as google_scraper
+from config import NEAR_DUPLICATE_DB_PATH
+from google_scraper.scraper import build_basic_job_info, build_detailed_job_info, perform_scraping
+from utility.async_store import AsyncJobHashStore, AsyncNearDuplicateIndex
+from utility.job_hash_store import JobHashStore
+from utility.keyword_scheduler import KeywordScheduler
+from utility.near_duplicate_index import NearDuplicateIndex
+
+# Set up logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+KEYWORD = 'stage developpeur'
+
+
+class FakeCard:
+    """Job card element carrying the basic info the fake extraction returns"""
+
+    def __init__(self, i):
+        self.info = build_basic_job_info(f"Job {i}", f"Company {i}", "Casablanca • LinkedIn", "Stage", "2 days ago", None)
+
+
+class FakeLocator:
+    def __init__(self, page):
+        self.page = page
+
+    async def count(self):
+        return len(self.page.cards)
+
+
+class FakePage:
+    """The few Page methods perform_scraping calls, over a fixed list of cards that never grows"""
+
+    def __init__(self, cards):
+        self.cards = cards
+        self.scrolls = 0
+
+    async def wait_for_selector(self, selector, timeout=None):
+        return None
+
+    async def query_selector_all(self, selector):
+        return list(self.cards)
+
+    async def evaluate(self, script, *args):
+        self.scrolls += 1
+
+    def locator(self, selector):
+        return FakeLocator(self)
+
+
+async def extract_basic_job_info(job_element):
+    return dict(job_element.info)
+
+
+async def extract_detailed_job_info(page, job_element, basic_info):
+    return build_detailed_job_info(basic_info, f"Description of {basic_info['title']} " * 20, [])
+
+
+async def no_sleep(range_tuple):
+    return None
+
+
+def patch_scraper():
+    """Replace the browser-bound steps with the fakes above (per-element path, near-duplicate index only when passed in)"""
+    google_scraper.extract_basic_job_info = extract_basic_job_info
+    google_scraper.extract_detailed_job_info = extract_detailed_job_info
+    google_scraper.human_sleep = no_sleep
+    google_scraper.BATCHED_CARD_EXTRACTION = False
+    google_scraper.NEAR_DUPLICATE_DETECTION = False
+
+
+async def run_keyword(tmp_dir, new_jobs, duplicates, time_budget=None, near_duplicates=False):
+    """Scrape one keyword over fake cards the way keyword_worker does, and record it in a scheduler"""
+    # Group commit leaves a write transaction open on job_hashes.db between saves
+    hash_store = AsyncJobHashStore(lambda: JobHashStore(db_path=os.path.join(tmp_dir, 'job_hashes.db'), persistent=True, commit_every=20))
+    near_duplicate_index = None
+    if near_duplicates:
+        near_duplicate_index = AsyncNearDuplicateIndex(lambda: NearDuplicateIndex(
+            db_path=os.path.join(tmp_dir, os.path.basename(NEAR_DUPLICATE_DB_PATH))
+        ))
+    cards = [FakeCard(i) for i in range(new_jobs + duplicates)]
+    try:
+        # The first cards were saved by an earlier run
+        for card in cards[:duplicates]:
+            await hash_store.add_job(await extract_detailed_job_info(None, card, card.info))
+        await hash_store.flush()
+
+        page = FakePage(cards)
+        keyword_stats = {}
+        results = await perform_scraping(page, os.path.join(tmp_dir, 'jobs.json'), hash_store=hash_store,
+                                         keyword=KEYWORD, max_jobs_override=100, max_scrolls_override=3,
+                                         time_budget=time_budget, stats=keyword_stats,
+                                         near_duplicate_index=near_duplicate_index)
+    finally:
+        await hash_store.close()
+        if near_duplicate_index is not None:
+            await near_duplicate_index.close()
+
+    scheduler = KeywordScheduler(history_path=os.path.join(tmp_dir, 'keyword_yield.json'))
+    scheduler.record(KEYWORD, keyword_stats.get('jobs', 0), keyword_stats.get('duplicates', 0))
+    return results, scheduler.history[KEYWORD], page
+
+
+def check(name, passed, detail):
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+async def main():
+    patch_scraper()
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs, entry, _ = await run_keyword(tmp_dir, new_jobs=3, duplicates=2)
+        results.append(check("Scheduler records the keyword's real counts",
+                             jobs == 3 and entry['last_new_jobs'] == 3 and entry['last_duplicates'] == 2,
+                             f"perform_scraping returned {jobs}, record() got {entry['last_new_jobs']} new / {entry['last_duplicates']} duplicates"))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # A keyword that only finds duplicates must still stop at its (already spent) time budget
+        jobs, entry, page = await run_keyword(tmp_dir, new_jobs=0, duplicates=5, time_budget=0)
+        results.append(check("Time budget stops a duplicate-only keyword",
+                             entry['last_duplicates'] == 0 and page.scrolls == 0,
+                             f"{entry['last_duplicates']} cards checked, {page.scrolls} scrolls after the budget was spent"))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Storing signatures must not wait on the hash store's open transaction
+        jobs, entry, _ = await run_keyword(tmp_dir, new_jobs=3, duplicates=2, near_duplicates=True)
+        results.append(check("Near-duplicate index saves alongside the hash store",
+                             jobs == 3 and entry['last_new_jobs'] == 3,
+                             f"perform_scraping returned {jobs} with the near-duplicate index enabled"))
+
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
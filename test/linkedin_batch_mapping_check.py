@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import os
+import sys
+import time
+# Decoded activity times are local: pin the zone so the expected timestamps hold anywhere
+os.environ['TZ'] = 'UTC'
+time.tzset()
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import linkedin_scraper.helpers as helpers
+from config import (
+    LINKEDIN_HEADING_SELECTOR,
+    LINKEDIN_PERSON_LINK_SELECTOR,
+    LINKEDIN_POST_LINK_SELECTOR,
+    LINKEDIN_POST_URN_SELECTOR,
+    LINKEDIN_SEE_MORE_BUTTON_SELECTOR,
+)
+from linkedin_scraper.helpers import (
+    PERSON_NAME_SELECTORS,
+    POST_CONTENT_SELECTORS,
+    POST_TIME_SELECTORS,
+    extract_all_post_info,
+    extract_complete_post_info,
+)
+
+# Set up logging
+logging.basicConfig(
+    level=logging.ERROR,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Fields that depend on the time of extraction rather than on the page
+TIME_FIELDS = ('scraped_date', 'posted_time', 'estimated_posted_date')
+
+# Hand-written post items: the element (text and attributes) each selector finds in them.
+# 'expanded' replaces elements once "see more" is clicked. 'expected' lists the record fields
+# that do not depend on the time of extraction.
+CASES = [
+    {
+        'name': "Person post, primary selectors",
+        'dom': {
+            PERSON_NAME_SELECTORS[0]: {'text': ' Sara Benali '},
+            LINKEDIN_PERSON_LINK_SELECTOR: {'href': 'https://www.linkedin.com/in/sara-benali?miniProfileUrn=urn%3Ali%3Afsd_profile%3AACoAAB1x2y3z'},
+            LINKEDIN_HEADING_SELECTOR: {'text': '\n  Talent Acquisition Specialist at Capgemini  \n'},
+            POST_TIME_SELECTORS[0]: {'text': '11h • Edited • '},
+            POST_CONTENT_SELECTORS[0]: {'text': "\n  We're hiring PFE interns!\n\n  Full Stack, Data and DevOps tracks in Casablanca.  "},
+            LINKEDIN_POST_LINK_SELECTOR: {'href': 'https://www.linkedin.com/feed/update/urn:li:activity:7380917238549340160/'},
+            LINKEDIN_POST_URN_SELECTOR: {'data-chameleon-result-urn': 'urn:li:activity:7380917238549340160'},
+        },
+        'expected': {
+            'person_name': 'Sara Benali',
+            'person_link': 'https://www.linkedin.com/in/sara-benali',
+            'heading': 'Talent Acquisition Specialist at Capgemini',
+            'post_content': "We're hiring PFE interns! Full Stack, Data and DevOps tracks in Casablanca.",
+            'post_link': 'https://www.linkedin.com/feed/update/urn:li:activity:7380917238549340160/',
+            'post_id': '7380917238549340160',
+            'posted_timestamp': '2025-10-06 10:50:00',
+        },
+    },
+    {
+        'name': "Company post, fallback selectors and URN link",
+        'dom': {
+            PERSON_NAME_SELECTORS[0]: {'text': ''},
+            PERSON_NAME_SELECTORS[1]: {'text': 'Orange Business'},
+            LINKEDIN_PERSON_LINK_SELECTOR: {'href': 'https://www.linkedin.com/company/orange-business/posts'},
+            LINKEDIN_HEADING_SELECTOR: {'text': '245,318 followers'},
+            POST_TIME_SELECTORS[1]: {'text': '4d • '},
+            POST_CONTENT_SELECTORS[0]: {'text': 'see more'},
+            POST_CONTENT_SELECTORS[2]: {'text': 'Our SOC in Rabat opens 5 internship positions.   Apply before October 31 …see more'},
+            LINKEDIN_POST_LINK_SELECTOR: {'href': 'https://www.linkedin.com/company/orange-business/'},
+            LINKEDIN_POST_URN_SELECTOR: {'data-chameleon-result-urn': 'urn:li:activity:7379402715823521792'},
+        },
+        'expected': {
+            'person_name': 'Orange Business',
+            'person_link': 'https://www.linkedin.com/company/orange-business/posts',
+            'heading': '245,318 followers',
+            'post_content': 'Our SOC in Rabat opens 5 internship positions. Apply before October 31',
+            'post_link': 'https://www.linkedin.com/feed/update/urn:li:activity:7379402715823521792',
+            'post_id': '7379402715823521792',
+            'posted_timestamp': '2025-10-02 06:31:50',
+        },
+    },
+    {
+        'name': "Post without an activity ID",
+        'dom': {
+            PERSON_NAME_SELECTORS[2]: {'text': 'Youssef El Amrani'},
+            POST_TIME_SELECTORS[0]: {'text': '3d • Edited • '},
+            POST_CONTENT_SELECTORS[1]: {'text': 'Platform team is looking for two cloud interns.'},
+        },
+        'expected': {
+            'person_name': 'Youssef El Amrani',
+            'person_link': 'Failed to extract',
+            'heading': 'Failed to extract',
+            'posted_time': '3d',
+            'post_content': 'Platform team is looking for two cloud interns.',
+            'post_link': 'Failed to extract',
+            'post_id': None,
+            'posted_timestamp': None,
+        },
+    },
+    {
+        'name': "Collapsed post, content re-read after expanding",
+        'dom': {
+            PERSON_NAME_SELECTORS[0]: {'text': 'Meryem Ouazzani'},
+            POST_CONTENT_SELECTORS[0]: {'text': 'Looking for a data analyst intern …see more'},
+            LINKEDIN_SEE_MORE_BUTTON_SELECTOR: {'text': '…see more'},
+            LINKEDIN_POST_URN_SELECTOR: {'data-chameleon-result-urn': 'urn:li:activity:7376113457281654784'},
+        },
+        'expanded': {
+            POST_CONTENT_SELECTORS[0]: {'text': 'Looking for a data analyst intern (Power BI, SQL) for our Marrakech office.'},
+            LINKEDIN_SEE_MORE_BUTTON_SELECTOR: None,
+        },
+        'expected': {
+            'person_name': 'Meryem Ouazzani',
+            'post_content': 'Looking for a data analyst intern (Power BI, SQL) for our Marrakech office.',
+            'post_link': 'https://www.linkedin.com/feed/update/urn:li:activity:7376113457281654784',
+            'post_id': '7376113457281654784',
+            'posted_timestamp': '2025-09-23 04:41:29',
+        },
+    },
+]
+
+
+class FakeNode:
+    """Element found by a selector, with its text and attributes"""
+
+    def __init__(self, post, fields):
+        self.post = post
+        self.fields = fields
+
+    async def text_content(self):
+        return self.fields.get('text')
+
+    async def get_attribute(self, name):
+        return self.fields.get(name)
+
+    async def click(self):
+        self.post.expand()
+
+
+class FakePost:
+    """Post item element answering query_selector from a case's selector table"""
+
+    def __init__(self, case):
+        self.case = case
+        self.dom = dict(case['dom'])
+
+    def expand(self):
+        self.dom.update(self.case.get('expanded', {}))
+
+    def text(self, selector):
+        fields = self.dom.get(selector)
+        return fields.get('text') if fields is not None else None
+
+    def attr(self, selector, name):
+        fields = self.dom.get(selector)
+        return fields.get(name) if fields is not None else None
+
+    async def query_selector(self, selector):
+        fields = self.dom.get(selector)
+        return FakeNode(self, fields) if fields is not None else None
+
+    async def evaluate(self, script, args):
+        # SEE_MORE_EXPANDED_JS: the button of these posts disappears once expanded
+        return self.dom.get(args['see_more']) is None
+
+
+def raw_post(post):
+    """The entry BATCH_EXTRACT_POSTS_JS returns for a post item (same fields and selectors)"""
+    return {
+        'names': [post.text(selector) for selector in PERSON_NAME_SELECTORS],
+        'person_link': post.attr(LINKEDIN_PERSON_LINK_SELECTOR, 'href'),
+        'heading': post.text(LINKEDIN_HEADING_SELECTOR),
+        'times': [post.text(selector) for selector in POST_TIME_SELECTORS],
+        'contents': [post.text(selector) for selector in POST_CONTENT_SELECTORS],
+        'feed_link': post.attr(LINKEDIN_POST_LINK_SELECTOR, 'href'),
+        'urn': post.attr(LINKEDIN_POST_URN_SELECTOR, 'data-chameleon-result-urn'),
+        'truncated': post.dom.get(LINKEDIN_SEE_MORE_BUTTON_SELECTOR) is not None
+    }
+
+
+class FakePage:
+    """Page whose batched evaluate returns fixed raw entries"""
+
+    def __init__(self, raw_posts):
+        self.raw_posts = raw_posts
+
+    async def eval_on_selector_all(self, selector, script, args):
+        return self.raw_posts[args['start']:args['end']]
+
+
+async def no_sleep(range_tuple):
+    return None
+
+
+def check(name, passed, detail):
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+def differences(record, expected, skip=()):
+    """Fields of `expected` (except `skip`) that the record does not match"""
+    return {key: (record.get(key), value) for key, value in expected.items()
+            if key not in skip and record.get(key) != value}
+
+
+async def main():
+    helpers.human_sleep = no_sleep
+    results = []
+
+    raw_posts = [raw_post(FakePost(case)) for case in CASES]
+    batched = await extract_all_post_info(FakePage(raw_posts), [FakePost(case) for case in CASES])
+    results.append(check("Batched extraction returns one record per post item",
+                         batched is not None and len(batched) == len(CASES),
+                         f"{'None' if batched is None else len(batched)} records for {len(CASES)} post items"))
+    if batched is None or len(batched) != len(CASES):
+        return False
+
+    for case, record in zip(CASES, batched):
+        diff = differences(record or {}, case['expected'])
+        results.append(check(f"{case['name']}: raw fields map to the expected record", record is not None and not diff,
+                             diff or "all fields match"))
+
+        per_element = await extract_complete_post_info(None, FakePost(case))
+        diff = differences(per_element, record or {}, skip=TIME_FIELDS)
+        results.append(check(f"{case['name']}: same record as the per-element path", not diff,
+                             diff or "all fields match"))
+
+    # A batch run with an offset keeps the records aligned with the element slice
+    tail = await extract_all_post_info(FakePage(raw_posts), [FakePost(case) for case in CASES], start_index=2)
+    results.append(check("Offset batch stays aligned with its elements",
+                         tail is not None and [post['post_id'] for post in tail] == [case['expected']['post_id'] for case in CASES[2:]],
+                         f"post IDs {None if tail is None else [post['post_id'] for post in tail]}"))
+
+    # A list that changed between query_selector_all and the evaluate falls back to per-element extraction
+    changed = await extract_all_post_info(FakePage(raw_posts[:-1]), [FakePost(case) for case in CASES])
+    results.append(check("Length mismatch falls back to per-element extraction", changed is None,
+                         f"returned {'None' if changed is None else f'{len(changed)} records'}"))
+
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
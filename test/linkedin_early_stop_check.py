@@ -0,0 +1,70 @@
+import logging
+import os
+import sys
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkedin_scraper.helpers import find_saved_run
+
+# Set up logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+RUN_LENGTH = 5
+
+
+def post_id(i):
+    """Activity ID of the i-th post by creation time (higher is newer)"""
+    return str(7300000000000000000 + i * 4194304000)
+
+
+# Posts saved by earlier runs, all fairly recent
+STORED = [post_id(i) for i in range(100, 120)]
+
+
+def check(name, passed, detail):
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+def main():
+    results = []
+
+    # An old post (lower activity ID than anything stored) saved to the list since the last run sits on top
+    late_old_post = post_id(1)
+    result = find_saved_run([late_old_post] + STORED[:RUN_LENGTH], set(STORED), RUN_LENGTH)
+    results.append(check("Post saved late with an old activity ID is still scraped", result == (1, RUN_LENGTH),
+                         f"old part starts at {result[0]} (expected 1)"))
+
+    # One stored post among new ones (e.g. saved again) doesn't end the run
+    new_posts = [post_id(200 + i) for i in range(6)]
+    ids = new_posts[:2] + [STORED[0]] + new_posts[2:]
+    result = find_saved_run(ids, set(STORED), RUN_LENGTH)
+    results.append(check("A single stored post among new ones doesn't stop", result == (None, 0),
+                         f"got {result}"))
+
+    # Posts saved earlier in this run are not in the snapshot taken at the start of the run
+    saved_this_run = new_posts[:RUN_LENGTH]
+    result = find_saved_run(saved_this_run, set(STORED), RUN_LENGTH)
+    results.append(check("Posts saved earlier in the same run don't count", result == (None, 0),
+                         f"got {result}"))
+
+    # A run split over two scroll passes
+    first = find_saved_run(new_posts[:2] + STORED[:3], set(STORED), RUN_LENGTH)
+    second = find_saved_run(STORED[3:6], set(STORED), RUN_LENGTH, carried=first[1])
+    results.append(check("Run carried across scroll passes", first == (None, 3) and second == (0, RUN_LENGTH),
+                         f"first pass {first}, second pass {second}"))
+
+    # A post whose ID could not be read breaks the run
+    result = find_saved_run(STORED[:3] + [None] + STORED[3:5], set(STORED), RUN_LENGTH)
+    results.append(check("Unreadable post ID breaks the run", result == (None, 2),
+                         f"got {result}"))
+
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,142 @@
+import asyncio
+import argparse
+import logging
+import os
+import sys
+import time
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import async_playwright
+from linkedin_scraper.helpers import extract_complete_post_info, extract_all_post_info, expand_all_posts
+from config import LINKEDIN_POST_CONTAINER_SELECTOR
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'linkedin_saved_posts.html')
+
+# Fields that depend on the time of extraction rather than on the page
+TIME_FIELDS = ('scraped_date', 'posted_time', 'estimated_posted_date')
+
+
+class CountingProxy:
+    """Wrap a Playwright handle and count every awaited call as one CDP round trip"""
+
+    def __init__(self, target, counter):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        async def wrapper(*args, **kwargs):
+            self._counter['round_trips'] += 1
+            result = await attr(*args, **kwargs)
+            # Keep counting calls made on returned element handles
+            if result is not None and hasattr(result, 'query_selector'):
+                return CountingProxy(result, self._counter)
+            return result
+
+        return wrapper
+
+
+async def load_fixture(page, copies: int) -> int:
+    """Load the saved posts fixture and replicate its posts to simulate a long saved list"""
+    with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+        await page.set_content(f.read())
+
+    await page.evaluate("""(copies) => {
+        const list = document.getElementById('post-list');
+        const posts = Array.from(list.children);
+        for (let i = 1; i < copies; i++) {
+            posts.forEach(post => list.appendChild(post.cloneNode(true)));
+        }
+    }""", copies)
+
+    return len(await page.query_selector_all(LINKEDIN_POST_CONTAINER_SELECTOR))
+
+
+def comparable(results):
+    """Drop the time-dependent fields so both paths can be compared"""
+    return [{key: value for key, value in post.items() if key not in TIME_FIELDS} if post else post for post in results]
+
+
+async def benchmark_per_element(page, rounds: int):
+    """Time the per-element extraction path (clicks "see more" and sleeps per collapsed post)"""
+    counter = {'round_trips': 0}
+    start = time.perf_counter()
+
+    for _ in range(rounds):
+        counter['round_trips'] += 1  # query_selector_all
+        post_elements = await page.query_selector_all(LINKEDIN_POST_CONTAINER_SELECTOR)
+        results = [await extract_complete_post_info(page, CountingProxy(el, counter)) for el in post_elements]
+
+    elapsed = time.perf_counter() - start
+    return results, counter['round_trips'] / rounds, elapsed / rounds
+
+
+async def benchmark_batched(page, rounds: int):
+    """Time the batched "see more" expansion and single-evaluate extraction path"""
+    counter = {'round_trips': 0}
+    start = time.perf_counter()
+
+    for _ in range(rounds):
+        counter['round_trips'] += 3  # expansion evaluate + query_selector_all + eval_on_selector_all
+        await expand_all_posts(page)
+        post_elements = await page.query_selector_all(LINKEDIN_POST_CONTAINER_SELECTOR)
+        results = await extract_all_post_info(page, post_elements)
+
+    elapsed = time.perf_counter() - start
+    return results, counter['round_trips'] / rounds, elapsed / rounds
+
+
+async def run_benchmark(copies: int, rounds: int):
+    """Compare both extraction paths on the saved fixture"""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+
+        try:
+            # Each path starts from a freshly loaded fixture with its posts still collapsed
+            post_count = await load_fixture(page, copies)
+            logger.info(f"Loaded fixture with {post_count} posts, {rounds} rounds per path")
+            per_element_results, per_element_trips, per_element_time = await benchmark_per_element(page, rounds)
+
+            await load_fixture(page, copies)
+            batched_results, batched_trips, batched_time = await benchmark_batched(page, rounds)
+
+            if comparable(per_element_results) != comparable(batched_results):
+                logger.error("Extraction paths returned different results!")
+                return False
+
+            print("\n" + "=" * 60)
+            print("           LINKEDIN POST EXTRACTION BENCHMARK")
+            print("=" * 60)
+            print(f"Posts per page:        {post_count}")
+            print(f"Per-element path:      {per_element_trips:.0f} round trips, {per_element_time * 1000:.1f} ms")
+            print(f"Batched path:          {batched_trips:.0f} round trips, {batched_time * 1000:.1f} ms")
+            print(f"Round-trip reduction:  {per_element_trips / batched_trips:.1f}x")
+            print(f"Wall-clock speedup:    {per_element_time / batched_time:.1f}x")
+            print("=" * 60)
+            return True
+        finally:
+            await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-element vs batched LinkedIn post extraction")
+    parser.add_argument('--copies', type=int, default=10, help="How many times to replicate the fixture posts")
+    parser.add_argument('--rounds', type=int, default=5, help="Extraction rounds per path")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run_benchmark(args.copies, args.rounds))
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Benchmark interrupted by user. Goodbye!")
@@ -0,0 +1,85 @@
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility import linkedin_post_store
+from utility.linkedin_post_store import LinkedinPostStore
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 10  # Post IDs seen per scroll pass
+
+
+def make_post(i):
+    """Build a synthetic (post_id, person_name, post_link) tuple"""
+    post_id = str(7300000000000000000 + i * 7919)
+    return (post_id, f"Person {i}", f"https://www.linkedin.com/feed/update/urn:li:activity:{post_id}")
+
+
+def timed(function, count):
+    """Run a function and return seconds per item"""
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) / count
+
+
+def run_benchmark(stored, lookups, inserts):
+    """Compare the module functions with LinkedinPostStore at one store size"""
+    rng = random.Random(42)
+    # Half known post IDs, half unseen ones
+    post_ids = [make_post(rng.randrange(stored))[0] for _ in range(lookups // 2)]
+    post_ids += [make_post(stored + i)[0] for i in range(lookups - len(post_ids))]
+    rng.shuffle(post_ids)
+    pages = [post_ids[i:i + PAGE_SIZE] for i in range(0, len(post_ids), PAGE_SIZE)]
+    function_posts = [make_post(stored * 2 + i) for i in range(inserts)]
+    store_posts = [make_post(stored * 3 + i) for i in range(inserts)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        linkedin_post_store.DB_PATH = os.path.join(tmp_dir, 'data', 'linkedin_posts.db')
+        logger.info(f"Populating post store with {stored:,} post IDs...")
+        store = LinkedinPostStore(linkedin_post_store.DB_PATH)
+        store.add_many([make_post(i) for i in range(stored)])
+        store.close()
+
+        results = {
+            'functions: is_post_scraped': timed(lambda: [linkedin_post_store.is_post_scraped(p) for p in post_ids], lookups),
+            'functions: save_scraped_id': timed(lambda: [linkedin_post_store.save_scraped_id(*post) for post in function_posts], inserts),
+            'functions: get_total_scraped_count': timed(linkedin_post_store.get_total_scraped_count, 1),
+        }
+
+        start = time.perf_counter()
+        store = LinkedinPostStore(linkedin_post_store.DB_PATH)
+        results['store: open'] = time.perf_counter() - start
+        results['store: is_post_scraped'] = timed(lambda: [store.is_post_scraped(p) for p in post_ids], lookups)
+        results[f'store: contains_many ({PAGE_SIZE}/query)'] = timed(lambda: [store.contains_many(page) for page in pages], lookups)
+        results['store: add (one commit each)'] = timed(lambda: [store.add(*post) for post in store_posts[:inserts // 2]], inserts // 2)
+        results[f'store: add_many ({PAGE_SIZE}/batch)'] = timed(
+            lambda: [store.add_many(store_posts[i:i + PAGE_SIZE]) for i in range(inserts // 2, inserts, PAGE_SIZE)], inserts - inserts // 2)
+        results['store: count'] = timed(store.count, 1)
+        store.close()
+
+    logger.info(f"Results with {stored:,} stored post IDs:")
+    for name, seconds in results.items():
+        logger.info(f"  - {name}: {seconds * 1e6:.1f} us/item")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of the LinkedIn post store functions against LinkedinPostStore")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000], help="Stored post ID counts to benchmark")
+    parser.add_argument('--lookups', type=int, default=5000, help="Post ID lookups per run")
+    parser.add_argument('--inserts', type=int, default=500, help="Post IDs inserted per run")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run_benchmark(size, args.lookups, args.inserts)
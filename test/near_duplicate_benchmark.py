@@ -0,0 +1,106 @@
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility.job_hash_store import full_job_hash
+from utility.near_duplicate_index import NearDuplicateIndex, bands_table, minhash_partition, normalize_location
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+VOCABULARY = [f"word{i}" for i in range(5000)]
+
+
+def make_job(rng, i):
+    """Build a synthetic job with a random 120-word description"""
+    return {
+        'title': f"Data Engineer {i}",
+        'company': f"Company {i % 3000}",
+        'location': "Casablanca",
+        'description': ' '.join(rng.choice(VOCABULARY) for _ in range(120))
+    }
+
+
+def reword(rng, job, changes):
+    """Repost a job with a few words replaced and a different platform footer"""
+    words = job['description'].split()
+    for _ in range(changes):
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    return {**job, 'description': ' '.join(words) + " apply on indeed"}
+
+
+def populate(index, rng, count):
+    """Store `count` synthetic jobs in one transaction"""
+    jobs = [make_job(rng, i) for i in range(count)]
+    signatures = [index.signature(job) for job in jobs]
+    partition = minhash_partition(datetime.now())
+    index._ensure_partition(partition)
+    index._conn.executemany(
+        f"INSERT INTO {partition} (id, signature, first_seen, title, company, location, job_hash) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(job_id, signature.tobytes(), '2025-01-01 00:00:00', job['title'], job['company'],
+          normalize_location(job['location']), full_job_hash(job))
+         for job_id, (job, signature) in enumerate(zip(jobs, signatures), 1)]
+    )
+    index._conn.executemany(
+        f"INSERT OR IGNORE INTO {bands_table(partition)} (band_key, job_id) VALUES (?, ?)",
+        [(band_key, job_id) for job_id, signature in enumerate(signatures, 1) for band_key in index._band_keys(signature)]
+    )
+    index._conn.commit()
+    return jobs
+
+
+def time_lookups(index, jobs):
+    """Return (matches, seconds per lookup) over a list of jobs"""
+    start = time.perf_counter()
+    matches = sum(1 for job in jobs if index.find_similar(job))
+    return matches, (time.perf_counter() - start) / len(jobs)
+
+
+def run_benchmark(stored, queries, threshold, changes):
+    """Time near-duplicate lookups and measure detection of reworded reposts"""
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index = NearDuplicateIndex(db_path=os.path.join(tmp_dir, 'job_minhashes.db'), threshold=threshold)
+        logger.info(f"Populating index with {stored:,} jobs...")
+        jobs = populate(index, rng, stored)
+
+        reposts = [reword(rng, rng.choice(jobs), changes) for _ in range(queries)]
+        unseen = [make_job(rng, stored + i) for i in range(queries)]
+
+        # Signatures are paid once per job whatever the index size, so time them apart
+        start = time.perf_counter()
+        for job in reposts:
+            index.signature(job)
+        signature_time = (time.perf_counter() - start) / queries
+
+        detected, repost_time = time_lookups(index, reposts)
+        false_matches, unseen_time = time_lookups(index, unseen)
+        index.close()
+
+    logger.info(f"Results with {stored:,} stored jobs (threshold {threshold}, {changes} words changed per repost):")
+    logger.info(f"  - Signature: {signature_time * 1e3:.3f} ms/job")
+    logger.info(f"  - Reworded reposts detected: {detected}/{queries} ({repost_time * 1e3:.3f} ms/lookup incl. signature)")
+    logger.info(f"  - Unrelated jobs matched: {false_matches}/{queries} ({unseen_time * 1e3:.3f} ms/lookup incl. signature)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of the MinHash near-duplicate index")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 300_000], help="Stored job counts to benchmark")
+    parser.add_argument('--queries', type=int, default=1000, help="Lookups per run")
+    parser.add_argument('--threshold', type=float, default=0.7, help="Similarity threshold")
+    parser.add_argument('--changes', type=int, default=5, help="Words replaced in each repost")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run_benchmark(size, args.queries, args.threshold, args.changes)
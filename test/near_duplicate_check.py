@@ -0,0 +1,62 @@
+import logging
+import os
+import sys
+import tempfile
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility.job_hash_store import full_job_hash
+from utility.near_duplicate_index import NearDuplicateIndex
+
+# Set up logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Company boilerplate shared by every posting of the role, whatever the city
+DESCRIPTION = (
+    "Capgemini is looking for a PFE intern to join its data engineering team. You will build batch and "
+    "streaming pipelines with Spark and Kafka, model data in the warehouse, write tests and documentation, "
+    "and present your work to the team at the end of the internship. Profile: final year engineering "
+    "student, good knowledge of SQL and Python, curious and autonomous. Six month internship starting in February."
+)
+
+
+def make_job(location, footer=""):
+    return {'title': "Data Engineer Intern", 'company': "Capgemini", 'location': location,
+            'description': DESCRIPTION + footer}
+
+
+def check(name, passed, detail):
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+def main():
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index = NearDuplicateIndex(db_path=os.path.join(tmp_dir, 'job_minhashes.db'), threshold=0.7)
+        stored = make_job("Casablanca, Casablanca-Settat")
+        index.add(stored)
+
+        # Same role and boilerplate in another city: a distinct job
+        similar = index.find_similar(make_job("Rabat, Rabat-Salé-Kénitra"))
+        results.append(check("Same posting in another city is not a near duplicate", similar is None,
+                             f"matched {similar}"))
+
+        # Syndicated repost in the same city (location written differently)
+        similar = index.find_similar(make_job("casablanca,  Casablanca-Settat", footer=" Apply on Indeed."))
+        results.append(check("Reworded repost in the same city is a near duplicate",
+                             similar is not None and similar[3] == full_job_hash(stored),
+                             f"matched {similar}"))
+
+        index.close()
+
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from google_scraper.response_capture import GoogleJobsResponseCapture, XSSI_PREFIX, parse_jobs_payload
+from config import GOOGLE_JOBS_CAPTURE_URL_PATTERNS, LINKEDIN_CAPTURE_URL_PATTERNS
+from linkedin_scraper.response_capture import LinkedinSavedPostsCapture, parse_saved_posts_payload
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Response body -> expected parsed records, and the parser of that response type.
+# The *_synthetic fixtures are hand-written in the layout of the configured field paths, not
+# recorded from live traffic: they check decoding and record walking, not the paths themselves.
+# Replace them with recorded responses once the capture modes have been verified live.
+FIXTURES = [
+    ('google_jobs_batchexecute_synthetic.txt', 'google_jobs_batchexecute_synthetic_expected.json', parse_jobs_payload),
+    ('linkedin_voyager_saved_posts_synthetic.json', 'linkedin_voyager_saved_posts_synthetic_expected.json', parse_saved_posts_payload),
+]
+
+
+def replay_fixture(payload_name: str, expected_name: str, parse) -> bool:
+    """Parse a response fixture and compare it with the expected records"""
+    with open(os.path.join(FIXTURES_DIR, payload_name), 'r', encoding='utf-8') as f:
+        records = parse(f.read())
+    with open(os.path.join(FIXTURES_DIR, expected_name), 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+
+    if records != expected:
+        print(f"❌ {payload_name}: parsed {len(records)} records, expected {len(expected)}")
+        print(json.dumps(records, ensure_ascii=False, indent=2))
+        return False
+
+    print(f"✅ {payload_name}: {len(records)} records parsed as expected")
+    return True
+
+
+class FakeResponse:
+    """Captured page response with a URL the LinkedIn (or Google) capture listens to"""
+
+    def __init__(self, body: str, url: str = f"https://www.linkedin.com{LINKEDIN_CAPTURE_URL_PATTERNS[0]}?queryId=saved"):
+        self.url = url
+        self.body = body
+
+    async def text(self):
+        return self.body
+
+
+def replay_capture_order() -> bool:
+    """Replay the LinkedIn fixture, then the same posts with fewer fields: the fuller records must be kept"""
+    with open(os.path.join(FIXTURES_DIR, 'linkedin_voyager_saved_posts_synthetic.json'), 'r', encoding='utf-8') as f:
+        body = f.read()
+    payload = json.loads(body)
+    # Later pages can repeat a post with a reduced projection (no summary, subtitles or actor link)
+    for entity in payload['included']:
+        for key in ('summary', 'primarySubtitle', 'secondarySubtitle', 'actorNavigationUrl'):
+            entity.pop(key, None)
+
+    capture = LinkedinSavedPostsCapture()
+
+    async def replay():
+        await capture._on_response(FakeResponse(body))
+        await capture._on_response(FakeResponse(json.dumps(payload)))
+
+    asyncio.run(replay())
+    expected = {record['post_id']: record for record in parse_saved_posts_payload(body)}
+    if capture.records != expected:
+        print("❌ Capture replaced complete records with later, less complete ones")
+        print(json.dumps(capture.records, ensure_ascii=False, indent=2))
+        return False
+
+    print(f"✅ Capture kept the most complete record of {len(expected)} posts seen twice")
+    return True
+
+
+def replay_same_role_two_cities() -> bool:
+    """Replay the Google fixture with its first job also posted in another city: each card must get its own record"""
+    with open(os.path.join(FIXTURES_DIR, 'google_jobs_batchexecute_synthetic.txt'), 'r', encoding='utf-8') as f:
+        lines = f.read()[len(XSSI_PREFIX):].splitlines()
+    chunk = json.loads(next(line for line in lines if line.startswith('[["wrb.fr", "RlkHNe"')))
+    payload = json.loads(chunk[0][2])
+    jobs = payload[0][0]
+    other_city = list(jobs[0])
+    other_city[2] = "Rabat, Maroc"
+    other_city[-1] = "Stage PFE à Rabat : application mobile Flutter pour l'équipe Banque."
+    jobs.append(other_city)
+    chunk[0][2] = json.dumps(payload, ensure_ascii=False)
+
+    capture = GoogleJobsResponseCapture()
+    url = f"https://www.google.com/_/SearchJobsUi/data{GOOGLE_JOBS_CAPTURE_URL_PATTERNS[0]}?rpcids=RlkHNe"
+    asyncio.run(capture._on_response(FakeResponse(f"{XSSI_PREFIX}\n{json.dumps(chunk, ensure_ascii=False)}\n", url)))
+
+    cards = [{'title': jobs[0][0], 'company': jobs[0][1], 'location': location} for location in ("Casablanca, Maroc", "Rabat,  Maroc")]
+    descriptions = [(capture.lookup(card) or {}).get('description') for card in cards]
+    if descriptions != [jobs[0][-1], other_city[-1]]:
+        print("❌ Cards of the same role in two cities did not get their own captured record")
+        print(json.dumps(descriptions, ensure_ascii=False, indent=2))
+        return False
+
+    print("✅ Cards of the same role in two cities each got their own captured record")
+    return True
+
+
+if __name__ == "__main__":
+    results = [replay_fixture(payload, expected, parse) for payload, expected, parse in FIXTURES]
+    results.append(replay_capture_order())
+    results.append(replay_same_role_two_cities())
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,308 @@
+import asyncio
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import linkedin_scraper.helpers as helpers
+from config import (
+    LINKEDIN_POST_CONTAINER_SELECTOR,
+    LINKEDIN_POST_CONTENT_SELECTOR,
+    LINKEDIN_SEE_MORE_BUTTON_SELECTOR,
+    SEE_MORE_SETTLE_FLOOR,
+)
+from linkedin_scraper.helpers import (
+    EXPAND_SEE_MORE_JS,
+    POST_CONTENT_SELECTORS,
+    SEE_MORE_EXPANDED_JS,
+    SEE_MORE_SETTLED_JS,
+    expand_all_posts,
+    extract_post_content,
+)
+from utility.pacing import get_pacer
+
+# Set up logging
+logging.basicConfig(
+    level=logging.ERROR,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+COLLAPSED_TEXT = 'Looking for a data analyst intern …see more'
+EXPANDED_TEXT = 'Looking for a data analyst intern (Power BI, SQL) for our Marrakech office.'
+
+# Runs the in-page scripts against a stub DOM. A post item is 'expanded' (no "see more" button)
+# or the delay in ms after which a click expands it (never, for null). Its button then disappears,
+# like LinkedIn's in-place expansion, or with {delay, keep} stays and only changes its 'aria'-expanded
+# attribute, its 'label' or the content's line 'clamp'. Clicking an expanded post collapses it.
+# After the settle check, the click pass runs once more (`reclicked`), as the per-post fallback would.
+# Reads the scripts and scenarios as JSON on stdin, prints results as JSON.
+NODE_HARNESS = """
+const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const expand = eval(input.expand_js);
+const settled = eval(input.settled_js);
+global.getComputedStyle = (element) => element.style;
+
+const makePost = (item) => {
+    const spec = item !== null && typeof item === 'object' ? item : { delay: item, keep: null };
+    const post = { clicks: 0, expanded: spec.delay === 'expanded', dataset: {} };
+    const button = {
+        get textContent() { return post.expanded && spec.keep === 'label' ? 'see less' : ' …see more '; },
+        getAttribute: (name) => name === 'aria-expanded' && spec.keep === 'aria' ? String(post.expanded) : null,
+        click: () => {
+            post.clicks++;
+            if (post.expanded) post.expanded = false;
+            else if (spec.delay !== null) setTimeout(() => { post.expanded = true; }, spec.delay);
+        }
+    };
+    const content = { get style() { return { webkitLineClamp: post.expanded && spec.keep === 'clamp' ? 'none' : '3' }; } };
+    post.querySelector = (selector) => {
+        if (selector === input.see_more) return post.expanded && !spec.keep ? null : button;
+        return selector === input.content ? content : null;
+    };
+    return post;
+};
+
+const run = async (scenario) => {
+    const posts = scenario.posts.map(makePost);
+    global.document = { querySelectorAll: (selector) => selector === input.posts ? posts : [] };
+    const args = { posts: input.posts, see_more: input.see_more, content: input.content, start: scenario.start, end: scenario.end };
+    const clicked = expand(posts, args);
+    const settledAtOnce = settled(args);
+    const started = Date.now();
+    while (!settled(args) && Date.now() - started < scenario.timeout) {
+        await new Promise(resolve => setTimeout(resolve, 10));
+    }
+    const isSettled = settled(args);
+    const reclicked = expand(posts, args);
+    return {
+        clicked, settled_at_once: settledAtOnce, settled: isSettled, reclicked,
+        clicks: posts.map(post => post.clicks), expanded: posts.map(post => post.expanded)
+    };
+};
+
+(async () => {
+    const results = [];
+    for (const scenario of input.scenarios) results.push(await run(scenario));
+    console.log(JSON.stringify(results));
+})();
+"""
+
+# Post items as in NODE_HARNESS; `timeout` is how long to poll the settled check, in ms
+JS_SCENARIOS = [
+    {
+        'name': "New posts expand and settle",
+        'posts': [40, 'expanded', 40, 80, 'expanded'], 'start': 1, 'end': None, 'timeout': 1000,
+        'expected': {'clicked': 2, 'settled_at_once': False, 'settled': True, 'reclicked': 0,
+                     'clicks': [0, 0, 1, 1, 0], 'expanded': [False, True, True, True, True]},
+    },
+    {
+        'name': "End index bounds the clicks and the settle check",
+        'posts': [40, 40, 40, 40], 'start': 1, 'end': 3, 'timeout': 1000,
+        'expected': {'clicked': 2, 'settled_at_once': False, 'settled': True, 'reclicked': 0,
+                     'clicks': [0, 1, 1, 0], 'expanded': [False, True, True, False]},
+    },
+    {
+        'name': "A post that never expands keeps the check unsettled",
+        'posts': [40, None], 'start': 0, 'end': None, 'timeout': 200,
+        'expected': {'clicked': 2, 'settled_at_once': False, 'settled': False, 'reclicked': 1,
+                     'clicks': [1, 2], 'expanded': [True, False]},
+    },
+    {
+        'name': "Posts that keep their button settle on their expanded state and aren't clicked again",
+        'posts': [{'delay': 40, 'keep': 'aria'}, {'delay': 40, 'keep': 'label'}, {'delay': 80, 'keep': 'clamp'}],
+        'start': 0, 'end': None, 'timeout': 1000,
+        'expected': {'clicked': 3, 'settled_at_once': False, 'settled': True, 'reclicked': 0,
+                     'clicks': [1, 1, 1], 'expanded': [True, True, True]},
+    },
+]
+
+
+class FakeContent:
+    """Content element of a fake post"""
+
+    def __init__(self, post):
+        self.post = post
+
+    async def text_content(self):
+        return COLLAPSED_TEXT if self.post.collapsed() else EXPANDED_TEXT
+
+
+class FakeButton:
+    """'See more' button of a fake post"""
+
+    def __init__(self, post):
+        self.post = post
+
+    async def click(self):
+        self.post.click()
+
+
+class FakePost:
+    """
+    Post item whose content expands `delay` seconds after its "see more" click (never, for None).
+    With keep_button, the button stays once expanded (marked aria-expanded) and clicking it collapses the post.
+    """
+
+    def __init__(self, delay=0.0, collapsed=True, keep_button=False):
+        self.delay = delay
+        self.clicked_at = None if collapsed else 0.0
+        self.keep_button = keep_button
+        self.clicks = 0
+
+    def click(self):
+        self.clicks += 1
+        if not self.collapsed():
+            self.clicked_at = None
+        elif self.clicked_at is None:
+            self.clicked_at = time.monotonic()
+
+    def collapsed(self):
+        if self.clicked_at is None or self.delay is None:
+            return True
+        return time.monotonic() < self.clicked_at + self.delay
+
+    async def query_selector(self, selector):
+        if selector == LINKEDIN_SEE_MORE_BUTTON_SELECTOR:
+            return FakeButton(self) if self.collapsed() or self.keep_button else None
+        if selector == POST_CONTENT_SELECTORS[0]:
+            return FakeContent(self)
+        return None
+
+    async def evaluate(self, script, args):
+        assert script == SEE_MORE_EXPANDED_JS and args['see_more'] == LINKEDIN_SEE_MORE_BUTTON_SELECTOR
+        return not self.collapsed()
+
+
+class FakePage:
+    """The two Page calls of expand_all_posts(), with the in-page scripts' behavior over fake posts"""
+
+    def __init__(self, posts):
+        self.posts = posts
+        self.evaluates = 0
+        self.waits = 0
+
+    def slice(self, args):
+        return self.posts[args['start']:args['end']]
+
+    async def eval_on_selector_all(self, selector, script, args):
+        assert selector == LINKEDIN_POST_CONTAINER_SELECTOR and script == EXPAND_SEE_MORE_JS
+        self.evaluates += 1
+        collapsed = [post for post in self.slice(args) if post.collapsed()]
+        for post in collapsed:
+            post.click()
+        return len(collapsed)
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        assert script == SEE_MORE_SETTLED_JS
+        self.waits += 1
+        deadline = time.monotonic() + timeout / 1000
+        while any(post.collapsed() for post in self.slice(arg)):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timeout {timeout}ms exceeded")
+            await asyncio.sleep(0.01)
+        return True
+
+
+def check(name, passed, detail):
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+def run_js_scenarios():
+    """Run JS_SCENARIOS through the in-page scripts under node, or None if node is not installed"""
+    if not shutil.which('node'):
+        return None
+    payload = {
+        'expand_js': EXPAND_SEE_MORE_JS,
+        'settled_js': SEE_MORE_SETTLED_JS,
+        'posts': LINKEDIN_POST_CONTAINER_SELECTOR,
+        'see_more': LINKEDIN_SEE_MORE_BUTTON_SELECTOR,
+        'content': LINKEDIN_POST_CONTENT_SELECTOR,
+        'scenarios': [{key: scenario[key] for key in ('posts', 'start', 'end', 'timeout')} for scenario in JS_SCENARIOS]
+    }
+    output = subprocess.run(['node', '-e', NODE_HARNESS], input=json.dumps(payload), capture_output=True, text=True, timeout=30)
+    if output.returncode != 0:
+        raise RuntimeError(output.stderr)
+    return json.loads(output.stdout)
+
+
+async def timed_expansion(posts):
+    """Run expand_all_posts() from the second post item on; return (clicked, seconds, page)"""
+    page = FakePage(posts)
+    start = time.monotonic()
+    clicked = await expand_all_posts(page, start_index=1)
+    return clicked, time.monotonic() - start, page
+
+
+async def main():
+    results = []
+
+    js_results = run_js_scenarios()
+    if js_results is None:
+        print("⚠️ node is not installed, skipping the in-page script checks")
+    else:
+        for scenario, result in zip(JS_SCENARIOS, js_results):
+            results.append(check(f"In-page scripts: {scenario['name']}", result == scenario['expected'], result))
+
+    floor = SEE_MORE_SETTLE_FLOOR[0] * get_pacer().scale
+
+    # The first post was handled by an earlier pass: it must not be clicked
+    posts = [FakePost(0.1), FakePost(0.1), FakePost(collapsed=False), FakePost(0.3)]
+    clicked, seconds, page = await timed_expansion(posts)
+    results.append(check("One click pass and one settle wait for all new posts",
+                         clicked == 2 and page.evaluates == 1 and page.waits == 1 and posts[0].clicks == 0,
+                         f"{clicked} clicked, {page.evaluates} evaluate, {page.waits} wait, first post clicked {posts[0].clicks} times"))
+    results.append(check("Settle wait ends when the slowest post expands (not before the floor)",
+                         not any(post.collapsed() for post in posts[1:]) and max(0.3, floor) <= seconds < helpers.SEE_MORE_SETTLE_TIMEOUT,
+                         f"returned after {seconds:.2f}s"))
+
+    # Settled posts need no per-post click or sleep during extraction
+    sleeps = []
+
+    async def counting_sleep(range_tuple):
+        sleeps.append(range_tuple)
+
+    helpers.human_sleep = counting_sleep
+    contents = [await extract_post_content(post) for post in posts[1:]]
+    results.append(check("Extraction after the settle wait skips the per-post click and sleep",
+                         contents == [EXPANDED_TEXT] * 3 and not sleeps and [post.clicks for post in posts[1:]] == [1, 0, 1],
+                         f"{len(sleeps)} sleeps, clicks {[post.clicks for post in posts[1:]]}"))
+
+    # A post that never expands: the wait stops at the timeout and extraction falls back to click + sleep
+    helpers.SEE_MORE_SETTLE_TIMEOUT = 0.5
+    throttle_signals = get_pacer().throttle_signals
+    posts = [FakePost(collapsed=False), FakePost(0.05), FakePost(None)]
+    clicked, seconds, page = await timed_expansion(posts)
+    results.append(check("Settle wait gives up at the timeout",
+                         clicked == 2 and 0.5 <= seconds < 1.5 and get_pacer().throttle_signals == throttle_signals + 1,
+                         f"returned after {seconds:.2f}s, throttling recorded {get_pacer().throttle_signals - throttle_signals} times"))
+    await extract_post_content(posts[2])
+    results.append(check("A post still collapsed falls back to the per-post click and sleep",
+                         posts[2].clicks == 2 and len(sleeps) == 1,
+                         f"{posts[2].clicks} clicks, {len(sleeps)} sleeps"))
+
+    # Posts that keep their button once expanded must not be clicked again by the per-post fallback
+    sleeps.clear()
+    posts = [FakePost(collapsed=False), FakePost(0.05, keep_button=True), FakePost(0.1, keep_button=True)]
+    clicked, seconds, page = await timed_expansion(posts)
+    contents = [await extract_post_content(post) for post in posts[1:]]
+    results.append(check("Expanded posts that keep their button are not collapsed again",
+                         clicked == 2 and contents == [EXPANDED_TEXT] * 2 and not sleeps and [post.clicks for post in posts[1:]] == [1, 1],
+                         f"{clicked} clicked, clicks {[post.clicks for post in posts[1:]]}, {len(sleeps)} sleeps"))
+
+    # Nothing collapsed: no settle wait at all
+    clicked, seconds, page = await timed_expansion([FakePost(collapsed=False)] * 3)
+    results.append(check("No wait when nothing is collapsed", clicked == 0 and page.waits == 0 and seconds < 0.1,
+                         f"{clicked} clicked, {page.waits} waits, {seconds:.2f}s"))
+
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import queue
+import threading
+from typing import Callable, Dict, List, Optional
+
+from utility import linkedin_post_store
+from utility.linkedin_post_store import LinkedinPostStore
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncStore:
+    """
+    Async facade over a blocking SQLite store.
+
+    Every call is queued to one dedicated thread that owns the store (and its SQLite
+    connections), so the event loop never waits on disk I/O or fsync. Requests run in
+    the order they were made, which keeps the store's read-after-write semantics.
+    Consecutive reads of a method listed in BATCHED_READS that are waiting in the queue
+    together are answered by one call of its batch method (which looks identical keys up once).
+    """
+
+    # Read method -> batch method taking a list of keys and returning one result per key
+    BATCHED_READS: Dict[str, str] = {}
+
+    def __init__(self, factory: Callable[[], object], name: str = 'store'):
+        """
+        Start the store thread.
+
+        Args:
+            factory: Builds the blocking store; called on the store thread so that
+                SQLite connections are created on the thread that uses them
+            name: Thread name, used in logs
+        """
+        self.name = name
+        self.batched_requests = 0
+        self.batch_calls = 0
+        self._requests = queue.Queue()
+        self._store = None
+        self._factory_error: Optional[Exception] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, args=(factory,), name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self, factory):
+        """Store thread: build the store, then serve queued requests until close()."""
+        try:
+            self._store = factory()
+        except Exception as e:
+            self._factory_error = e
+            logger.error(f"Could not open {self.name}: {e}")
+
+        while True:
+            requests = [self._requests.get()]
+            # Take everything already waiting so consecutive reads can share a query
+            while True:
+                try:
+                    requests.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in requests
+            self._execute([request for request in requests if request is not None])
+            if stop:
+                break
+
+    def _execute(self, requests: List):
+        """Run a list of requests in order, batching consecutive runs of the same read."""
+        start = 0
+        while start < len(requests):
+            method = requests[start][0]
+            end = start + 1
+            if method in self.BATCHED_READS:
+                while end < len(requests) and requests[end][0] == method:
+                    end += 1
+
+            if end - start > 1:
+                self._execute_batch(method, requests[start:end])
+            else:
+                self._execute_one(requests[start])
+            start = end
+
+    def _execute_one(self, request):
+        """Run a single request and hand its result back to the event loop."""
+        method, args, kwargs, future, loop = request
+        try:
+            if self._factory_error is not None:
+                raise self._factory_error
+            result = getattr(self._store, method)(*args, **kwargs)
+        except Exception as e:
+            loop.call_soon_threadsafe(self._set_exception, future, e)
+            return
+        loop.call_soon_threadsafe(self._set_result, future, result)
+
+    def _execute_batch(self, method, requests: List):
+        """Answer several reads of the same method with one batch call."""
+        keys = [request[1][0] for request in requests]
+        try:
+            if self._factory_error is not None:
+                raise self._factory_error
+            results = getattr(self._store, self.BATCHED_READS[method])(keys)
+        except Exception as e:
+            for _, _, _, future, loop in requests:
+                loop.call_soon_threadsafe(self._set_exception, future, e)
+            return
+
+        self.batched_requests += len(requests)
+        self.batch_calls += 1
+        for (_, _, _, future, loop), result in zip(requests, results):
+            loop.call_soon_threadsafe(self._set_result, future, result)
+
+    @staticmethod
+    def _set_result(future, result):
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future, error):
+        if not future.done():
+            future.set_exception(error)
+
+    async def _call(self, method: str, *args, **kwargs):
+        """Queue a store call and wait for its result without blocking the event loop."""
+        if self._closed:
+            raise RuntimeError(f"{self.name} is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._requests.put((method, args, kwargs, future, loop))
+        return await future
+
+    async def close(self):
+        """Run the store's close() if it has one, then stop the store thread."""
+        if self._closed:
+            return
+        if self._factory_error is None and hasattr(self._store, 'close'):
+            await self._call('close')
+        self._closed = True
+        self._requests.put(None)
+        await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+        if self.batch_calls:
+            logger.debug(f"{self.name}: {self.batched_requests} reads answered by {self.batch_calls} batched queries")
+
+
+class AsyncJobHashStore(AsyncStore):
+    """Async facade over JobHashStore."""
+
+    BATCHED_READS = {'is_basic_duplicate': 'find_basic_duplicates'}
+
+    def __init__(self, factory: Callable[[], object]):
+        super().__init__(factory, name='job-hash-store')
+
+    async def get_stats(self):
+        return await self._call('get_stats')
+
+    async def is_basic_duplicate(self, job_data):
+        return await self._call('is_basic_duplicate', job_data)
+
+    async def find_basic_duplicates(self, jobs):
+        return await self._call('find_basic_duplicates', jobs)
+
+    async def is_duplicate(self, job_data, record=True):
+        return await self._call('is_duplicate', job_data, record=record)
+
+    async def add_job(self, job_data):
+        return await self._call('add_job', job_data)
+
+    async def flush(self):
+        return await self._call('flush')
+
+    async def cleanup_expired(self):
+        return await self._call('cleanup_expired')
+
+
+class AsyncNearDuplicateIndex(AsyncStore):
+    """Async facade over NearDuplicateIndex."""
+
+    def __init__(self, factory: Callable[[], object]):
+        super().__init__(factory, name='near-duplicate-index')
+
+    async def find_similar(self, job_data):
+        return await self._call('find_similar', job_data)
+
+    async def add(self, job_data):
+        return await self._call('add', job_data)
+
+    async def cleanup_expired(self):
+        return await self._call('cleanup_expired')
+
+
+class AsyncLinkedinPostStore(AsyncStore):
+    """Async facade over LinkedinPostStore."""
+
+    BATCHED_READS = {'is_post_scraped': 'contains_many'}
+
+    def __init__(self, db_path: str = linkedin_post_store.DB_PATH):
+        super().__init__(lambda: LinkedinPostStore(db_path), name='linkedin-post-store')
+
+    async def load_scraped_ids(self):
+        return await self._call('load_scraped_ids')
+
+    async def is_post_scraped(self, post_id):
+        return await self._call('is_post_scraped', post_id)
+
+    async def contains_many(self, post_ids):
+        return await self._call('contains_many', post_ids)
+
+    async def add(self, post_id, person_name=None, post_link=None):
+        return await self._call('add', post_id, person_name=person_name, post_link=post_link)
+
+    async def add_many(self, posts):
+        return await self._call('add_many', posts)
+
+    async def count(self):
+        return await self._call('count')
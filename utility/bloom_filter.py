@@ -0,0 +1,121 @@
+import hashlib
+import json
+import math
+import os
+import logging
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys.
+
+    Answers "definitely not seen" or "maybe seen": a miss is always right, a hit is
+    wrong with probability close to `fp_rate` while fewer than `capacity` keys are stored.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01):
+        """
+        Initialize an empty filter sized for `capacity` keys.
+
+        Args:
+            capacity: Number of keys the filter is sized for
+            fp_rate: Target false-positive rate at full capacity
+        """
+        self.capacity = max(1, int(capacity))
+        self.fp_rate = fp_rate
+        self.num_bits, self.num_hashes = self.optimal_size(self.capacity, fp_rate)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    @staticmethod
+    def optimal_size(capacity: int, fp_rate: float) -> Tuple[int, int]:
+        """
+        Get the bit count and hash count that reach `fp_rate` at `capacity` keys.
+
+        Returns:
+            Tuple: (number of bits, number of hash functions)
+        """
+        num_bits = max(8, int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))))
+        num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        return num_bits, num_hashes
+
+    def _positions(self, key: str):
+        """Get the bit positions of a key (double hashing over one 128-bit digest)."""
+        digest = int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest(), 'little')
+        h1 = digest & 0xFFFFFFFFFFFFFFFF
+        h2 = (digest >> 64) | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str):
+        """Add a key to the filter."""
+        bits = self.bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def is_full(self) -> bool:
+        """Check whether more keys were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    def save(self, path: str, meta: Optional[Dict] = None):
+        """
+        Write the filter atomically: one JSON header line followed by the raw bits.
+
+        Args:
+            path: Destination file
+            meta: Extra values stored in the header (e.g. what the filter was built from)
+        """
+        header = {
+            'capacity': self.capacity,
+            'fp_rate': self.fp_rate,
+            'num_bits': self.num_bits,
+            'num_hashes': self.num_hashes,
+            'count': self.count,
+            'meta': meta or {}
+        }
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Tuple[Optional['BloomFilter'], Dict]:
+        """
+        Read a filter written by save().
+
+        Returns:
+            Tuple: (filter or None if missing/unreadable, header metadata)
+        """
+        if not os.path.exists(path):
+            return None, {}
+        try:
+            with open(path, 'rb') as f:
+                header = json.loads(f.readline().decode('utf-8'))
+                bits = bytearray(f.read())
+
+            bloom = cls.__new__(cls)
+            bloom.capacity = header['capacity']
+            bloom.fp_rate = header['fp_rate']
+            bloom.num_bits = header['num_bits']
+            bloom.num_hashes = header['num_hashes']
+            bloom.count = header['count']
+            bloom.bits = bits
+            if len(bits) != (bloom.num_bits + 7) // 8:
+                raise ValueError(f"expected {(bloom.num_bits + 7) // 8} bytes of bits, got {len(bits)}")
+            return bloom, header.get('meta', {})
+        except Exception as e:
+            logger.warning(f"Could not read Bloom filter {path}: {e}")
+            return None, {}
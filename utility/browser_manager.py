@@ -0,0 +1,170 @@
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from playwright_stealth import Stealth
+from playwright.async_api import async_playwright
+
+from config import BROWSER_USER_DATA_DIR, BLOCK_RESOURCES
+from utility.resource_blocker import ResourceBlocker
+
+logger = logging.getLogger(__name__)
+
+# File in a profile directory whose mtime records when a cookie file was last imported into it
+COOKIES_IMPORTED_MARKER = '.cookies_imported'
+
+
+class BrowserManager:
+    """
+    Long-lived browser manager built on persistent Chromium user-data directories.
+
+    One Playwright instance is started for the whole session and each profile
+    (e.g. "google", "linkedin") gets one persistent context that stays open across
+    menu runs, so cache, storage and login sessions are reused instead of cold-starting.
+    """
+
+    def __init__(self, user_data_root: str = BROWSER_USER_DATA_DIR):
+        """
+        Initialize the browser manager.
+
+        Args:
+            user_data_root: Directory holding one user-data directory per profile
+        """
+        self.user_data_root = user_data_root
+        self._playwright_cm = None
+        self._playwright = None
+        self._contexts: Dict[str, object] = {}
+        self.resource_blockers: Dict[str, ResourceBlocker] = {}
+
+    def get_profile_dir(self, profile: str) -> str:
+        """Get the user-data directory of a profile."""
+        return os.path.join(self.user_data_root, profile)
+
+    def has_profile(self, profile: str) -> bool:
+        """Check whether a profile directory already exists on disk."""
+        return os.path.isdir(self.get_profile_dir(profile))
+
+    def cookies_outdated(self, profile: str, cookie_file: str) -> bool:
+        """
+        Check whether a cookie file must be loaded into a profile: the profile is new,
+        or the file was refreshed since it was last imported (call before get_context).
+
+        Args:
+            profile: Profile name
+            cookie_file: Path of the profile's cookie file
+
+        Returns:
+            bool: True if the cookies should be loaded
+        """
+        if not self.has_profile(profile):
+            return True
+        if not os.path.exists(cookie_file):
+            return False
+        marker = os.path.join(self.get_profile_dir(profile), COOKIES_IMPORTED_MARKER)
+        return not os.path.exists(marker) or os.path.getmtime(cookie_file) > os.path.getmtime(marker)
+
+    def mark_cookies_imported(self, profile: str):
+        """Record that the profile's session now matches its cookie file."""
+        marker = os.path.join(self.get_profile_dir(profile), COOKIES_IMPORTED_MARKER)
+        try:
+            with open(marker, 'w') as f:
+                f.write(time.strftime("%Y-%m-%d %H:%M:%S"))
+        except Exception as e:
+            logger.debug(f"Could not write cookie import marker {marker}: {e}")
+
+    def is_warm(self, profile: str) -> bool:
+        """Check whether a profile's context is already running."""
+        return profile in self._contexts
+
+    async def _start(self):
+        """Start Playwright (with stealth) once for the whole session."""
+        if self._playwright is None:
+            self._playwright_cm = Stealth().use_async(async_playwright())
+            self._playwright = await self._playwright_cm.__aenter__()
+            logger.info("Playwright started for persistent browser contexts")
+
+    async def get_context(self, profile: str, launch_args: Optional[List[str]] = None,
+                          **context_options) -> Tuple[object, bool]:
+        """
+        Get the persistent context of a profile, launching it if needed.
+        The profile's resource blocker counters are reset, so its summary covers one run.
+
+        Args:
+            profile: Profile name (one user-data directory per profile)
+            launch_args: Chromium command line arguments, used on launch only
+            **context_options: Context options (viewport, user_agent, ...), used on launch only
+
+        Returns:
+            Tuple: (browser context, True if an already running context was reused)
+        """
+        if profile in self._contexts:
+            logger.info(f"Reusing warm browser context for profile '{profile}'")
+            if profile in self.resource_blockers:
+                self.resource_blockers[profile].reset_stats()
+            return self._contexts[profile], True
+
+        await self._start()
+
+        profile_dir = self.get_profile_dir(profile)
+        os.makedirs(profile_dir, exist_ok=True)
+
+        start = time.monotonic()
+        context = await self._playwright.chromium.launch_persistent_context(
+            profile_dir,
+            headless=False,
+            args=launch_args or [],
+            **context_options
+        )
+        logger.info(f"Launched persistent browser context for profile '{profile}' in {time.monotonic() - start:.2f}s ({profile_dir})")
+
+        # Forget the context (and its blocker's stats) if the user closes the browser window
+        context.on("close", lambda _: self._forget(profile, context))
+        self._contexts[profile] = context
+
+        if BLOCK_RESOURCES:
+            resource_blocker = ResourceBlocker()
+            await resource_blocker.attach(context)
+            self.resource_blockers[profile] = resource_blocker
+
+        return context, False
+
+    def _forget(self, profile: str, context):
+        """Drop a closed context and its resource blocker, unless the profile was relaunched since."""
+        if self._contexts.get(profile) is context:
+            self._contexts.pop(profile)
+            self.resource_blockers.pop(profile, None)
+
+    async def get_page(self, context):
+        """
+        Get a page for a run: the blank page a persistent context opens on launch, or a new one.
+
+        Args:
+            context: Browser context returned by get_context
+
+        Returns:
+            Page: A page that no other run is using
+        """
+        for page in context.pages:
+            if page.url == 'about:blank':
+                return page
+        return await context.new_page()
+
+    async def close(self):
+        """Close every persistent context and stop Playwright."""
+        for profile, context in list(self._contexts.items()):
+            try:
+                logger.info(f"Closing persistent browser context for profile '{profile}'")
+                await context.close()
+            except Exception as e:
+                logger.error(f"Error closing browser context for profile '{profile}': {e}")
+        self._contexts.clear()
+        self.resource_blockers.clear()
+
+        if self._playwright_cm is not None:
+            try:
+                await self._playwright_cm.__aexit__(None, None, None)
+            except Exception as e:
+                logger.error(f"Error stopping Playwright: {e}")
+            self._playwright_cm = None
+            self._playwright = None
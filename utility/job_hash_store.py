@@ -1,56 +1,398 @@
 import sqlite3
 import hashlib
 import os
+import re
 import logging
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
+from utility.bloom_filter import BloomFilter
+
+# SQLite limits the number of bound parameters per statement, so IN (...) lookups are chunked
+MAX_IN_PARAMS = 500
+
+# Smallest Bloom filter built, so a young store doesn't resize after every few jobs
+BLOOM_MIN_CAPACITY = 20000
+
+# Hashes live in one pair of tables per month of last_seen, so expiry is a table drop:
+# job_fp_YYYY_MM holds only the 64-bit fingerprints (the hot index), job_meta_YYYY_MM the rest
+COMPACT_PATTERN = re.compile(r'^job_fp_(\d{4})_(\d{2})$')
+# Older formats with TEXT MD5 keys, still readable and migrated in batches by migrate_step()
+TEXT_PATTERN = re.compile(r'^job_hashes_(\d{4})_(\d{2})$')
+LEGACY_TABLE = 'job_hashes'
+
+# Rows moved from old-format tables on every writable open
+MIGRATION_BATCH_ON_OPEN = 5000
+
 logger = logging.getLogger(__name__)
 
+def partition_name(when):
+    """Get the name of the month partition holding hashes last seen at `when`."""
+    return f"job_fp_{when.year:04d}_{when.month:02d}"
+
+def meta_table(partition):
+    """Get the name of the metadata table paired with a compact partition."""
+    return partition.replace('job_fp_', 'job_meta_', 1)
+
+def partition_month(name):
+    """Get (year, month) of a partition, or None for the legacy table."""
+    match = COMPACT_PATTERN.match(name) or TEXT_PATTERN.match(name)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+def month_expired(year, month, expiry_days, now=None):
+    """Check whether a whole month lies before the expiry period (month-grained expiry of partitions)."""
+    month_end = datetime(year + month // 12, month % 12 + 1, 1)
+    return month_end <= (now or datetime.now()) - timedelta(days=expiry_days)
+
+def full_job_hash(job_data):
+    """Get the full hash of a job (title, company, location and start of the description) as an MD5 hex digest."""
+    desc_part = job_data.get('description', '')[:100] if job_data.get('description') else ''
+    hash_input = f"{job_data['title']}|{job_data['company']}|{job_data['location']}|{desc_part}"
+    return hashlib.md5(hash_input.encode()).hexdigest()
+
+def to_timestamp(text):
+    """Get the Unix timestamp of a "%Y-%m-%d %H:%M:%S" date (now if it can't be parsed)."""
+    try:
+        return int(datetime.strptime(text, "%Y-%m-%d %H:%M:%S").timestamp())
+    except (TypeError, ValueError):
+        return int(datetime.now().timestamp())
+
+def format_timestamp(timestamp):
+    """Format a Unix timestamp like the dates of the old-format tables."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+def fingerprint(hex_hash):
+    """Get the signed 64-bit integer fingerprint of an MD5 hex digest (its first 8 bytes)."""
+    value = int(hex_hash[:16], 16)
+    return value - (1 << 64) if value >= (1 << 63) else value
+
 class JobHashStore:
-    """Manages a database of job hashes to prevent duplicate scraping."""
+    """
+    Manages a database of job hashes to prevent duplicate scraping.
+    
+    Hashes are partitioned by the month they were last seen. Each partition is a compact
+    WITHOUT ROWID table of 64-bit fingerprints (job_fp_YYYY_MM) plus a side table with the
+    Unix timestamps and job fields (job_meta_YYYY_MM) that lookups never touch. Lookups fan out
+    over the live partitions, newest first, and expiry drops whole partitions.
+    """
     
-    def __init__(self, db_path='data/job_hashes.db', expiry_days=30 , read_only=False):
+    def __init__(self, db_path='data/job_hashes.db', expiry_days=30 , read_only=False, persistent=False, commit_every=20,
+                 bloom_fp_rate=None, persist_bloom=False):
         """
         Initialize the job hash store.
         
         Args:
             db_path: Path to the SQLite database file
             expiry_days: Number of days after which to consider a job hash expired
+            read_only: Never store new hashes (testing mode)
+            persistent: Keep one long-lived WAL connection instead of reconnecting per call,
+                and group-commit writes every `commit_every` statements (call flush()/close())
+            commit_every: Number of writes per group commit in persistent mode
+            bloom_fp_rate: Keep an in-memory Bloom filter of the stored hashes with this
+                false-positive rate so most misses never reach SQLite (None disables it)
+            persist_bloom: Save the Bloom filter next to the database on close() and
+                reload it on open instead of rescanning the table
         """
         self.db_path = db_path
         self.expiry_days = expiry_days
         self.read_only = read_only
+        self.persistent = persistent
+        self.commit_every = max(1, commit_every)
+        self._conn = None
+        self._pending_writes = 0
+        self._partitions = []
+        self.bloom_fp_rate = bloom_fp_rate
+        self.persist_bloom = persist_bloom
+        self.bloom_path = self.db_path + '.bloom'
+        self._bloom = None
+        self._bloom_dirty = False
+        self.bloom_lookups = 0
+        self.bloom_skips = 0
         self._ensure_dir_exists()
         self._init_db()
+        if self.bloom_fp_rate:
+            self._init_bloom()
         
         if self.read_only:
             logger.info("JobHashStore initialized in READ-ONLY mode - no new hashes will be stored")
+        if self.persistent:
+            logger.info(f"JobHashStore using a persistent WAL connection (group commit every {self.commit_every} writes)")
     
     def _ensure_dir_exists(self):
         """Ensure the directory for the database exists."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
     
-    def _init_db(self):
-        """Initialize the database if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
+    @contextmanager
+    def _connection(self):
+        """Yield the persistent connection, or a short-lived one that is closed afterwards."""
+        if self.persistent:
+            if self._conn is None:
+                # Statements are compiled once and reused from the connection's statement cache
+                self._conn = sqlite3.connect(self.db_path, cached_statements=256)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            yield self._conn
+        else:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                yield conn
+            finally:
+                conn.close()
+    
+    def _commit(self, conn):
+        """Commit a write now, or defer it to the next group commit in persistent mode."""
+        if not self.persistent:
+            conn.commit()
+            return
+        self._pending_writes += 1
+        if self._pending_writes >= self.commit_every:
+            self.flush()
+    
+    def flush(self):
+        """Commit writes pending in persistent mode."""
+        if self._conn is not None and self._pending_writes:
+            self._conn.commit()
+            logger.debug(f"Group-committed {self._pending_writes} job hash writes")
+        self._pending_writes = 0
+    
+    def close(self):
+        """Commit pending writes, save the Bloom filter and close the persistent connection."""
+        self.flush()
+        if self._bloom is not None:
+            if self.bloom_lookups:
+                logger.info(f"Bloom filter answered {self.bloom_skips}/{self.bloom_lookups} job hash lookups without SQLite")
+            if self.persist_bloom and self._bloom_dirty:
+                self._save_bloom()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def _is_compact(self, name):
+        """Check whether a partition uses the compact integer schema."""
+        return name.startswith('job_fp_')
+    
+    def _key(self, name, hex_hash):
+        """Get the lookup key of a hash in a partition (fingerprint, or hex digest in old-format tables)."""
+        return fingerprint(hex_hash) if self._is_compact(name) else hex_hash
+    
+    def _partition_signature(self, conn, name):
+        """Get [name, row count, checksum] of a partition."""
+        checksum = "TOTAL(hash)" if self._is_compact(name) else "COALESCE(MAX(rowid), 0)"
+        return [name] + list(conn.execute(f"SELECT COUNT(*), {checksum} FROM {name}").fetchone())
+    
+    def _table_signature(self):
+        """Get the signature of every partition, used to tell whether a saved Bloom filter is current."""
+        with self._connection() as conn:
+            return [self._partition_signature(conn, name) for name in self._partitions]
+    
+    def _init_bloom(self):
+        """Load the saved Bloom filter if it matches the partitions, otherwise build it from them."""
+        if self.persist_bloom:
+            bloom, meta = BloomFilter.load(self.bloom_path)
+            if bloom is not None and bloom.fp_rate == self.bloom_fp_rate and meta.get('signature') == self._table_signature():
+                self._bloom = bloom
+                logger.info(f"Loaded Bloom filter of {bloom.count} job hashes from {self.bloom_path}")
+                return
+        self._build_bloom()
+    
+    def _build_bloom(self):
+        """Build the Bloom filter from every stored full and basic fingerprint."""
+        with self._connection() as conn:
+            rows = sum(conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0] for name in self._partitions)
+            
+            # Two keys per row, sized with headroom for the jobs added before the next rebuild
+            bloom = BloomFilter(max(4 * rows, BLOOM_MIN_CAPACITY), self.bloom_fp_rate)
+            for name in self._partitions:
+                compact = self._is_compact(name)
+                for full_hash, basic_hash in conn.execute(f"SELECT hash, basic_hash FROM {name}"):
+                    bloom.add(f"f:{full_hash if compact else fingerprint(full_hash)}")
+                    if basic_hash:
+                        bloom.add(f"b:{basic_hash if compact else fingerprint(basic_hash)}")
+        
+        self._bloom = bloom
+        self._bloom_dirty = True
+        logger.info(f"Built Bloom filter of {bloom.count} job hashes ({len(bloom.bits) / 1024:.0f} KB, {bloom.num_hashes} hashes, target FP rate {self.bloom_fp_rate})")
+    
+    def _save_bloom(self):
+        """Save the Bloom filter next to the database."""
         try:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS job_hashes (
-                    hash TEXT PRIMARY KEY,
-                    first_seen TEXT NOT NULL,
-                    last_seen TEXT NOT NULL,
-                    title TEXT,
-                    company TEXT,
-                    location TEXT,
-                    basic_hash TEXT
-                )
-            ''')
-            # Create an index on the basic_hash field for faster lookups
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_basic_hash ON job_hashes(basic_hash)')
+            self._bloom.save(self.bloom_path, {'signature': self._table_signature()})
+            self._bloom_dirty = False
+            logger.debug(f"Saved Bloom filter to {self.bloom_path}")
+        except Exception as e:
+            logger.error(f"Could not save Bloom filter {self.bloom_path}: {e}")
+    
+    def _bloom_excludes(self, kind, hex_hash):
+        """Check whether the Bloom filter rules a hash out, so SQLite can be skipped."""
+        if self._bloom is None:
+            return False
+        self.bloom_lookups += 1
+        if f"{kind}:{fingerprint(hex_hash)}" in self._bloom:
+            return False
+        self.bloom_skips += 1
+        return True
+    
+    def _init_db(self):
+        """Load the list of partitions and move a first batch of old-format rows into compact partitions."""
+        with self._connection() as conn:
+            self._load_partitions(conn)
+        
+        if self.migration_pending():
+            if self.read_only:
+                # Old-format tables stay readable, they are migrated on the next non-testing run
+                logger.warning("Old-format job hash tables found - they will be migrated on the next non-testing run")
+            else:
+                self.migrate_step(MIGRATION_BATCH_ON_OPEN)
+    
+    def _load_partitions(self, conn):
+        """Refresh the partition list, newest month first (the legacy table, if any, last)."""
+        names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        partitions = [name for name in names if COMPACT_PATTERN.match(name) or TEXT_PATTERN.match(name)]
+        # Compact before old-format within a month: that's where recently touched hashes are
+        partitions.sort(key=lambda name: (partition_month(name), self._is_compact(name)), reverse=True)
+        if LEGACY_TABLE in names:
+            partitions.append(LEGACY_TABLE)
+        self._partitions = partitions
+    
+    def _ensure_partition(self, conn, name):
+        """Create a compact month partition and its metadata table if they don't exist yet."""
+        if name in self._partitions:
+            return
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {name} (
+                hash INTEGER PRIMARY KEY,
+                basic_hash INTEGER NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        # Create an index on the basic_hash field for faster lookups
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{name}_basic_hash ON {name}(basic_hash)')
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {meta_table(name)} (
+                hash INTEGER PRIMARY KEY,
+                first_seen INTEGER NOT NULL,
+                last_seen INTEGER NOT NULL,
+                title TEXT,
+                company TEXT,
+                location TEXT
+            )
+        ''')
+        self._load_partitions(conn)
+    
+    def _current_partition(self, conn):
+        """Get the partition of this month, creating it if needed."""
+        name = partition_name(datetime.now())
+        self._ensure_partition(conn, name)
+        return name
+    
+    def _insert_rows(self, conn, partition, rows, replace=False):
+        """
+        Insert rows into a compact partition.
+        
+        Args:
+            rows: Tuples of (hash, basic_hash, first_seen, last_seen, title, company, location),
+                with integer fingerprints and Unix timestamps
+            replace: Overwrite existing rows instead of keeping them
+        """
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        conn.executemany(f"{verb} INTO {partition} (hash, basic_hash) VALUES (?, ?)", [row[:2] for row in rows])
+        conn.executemany(
+            f"{verb} INTO {meta_table(partition)} (hash, first_seen, last_seen, title, company, location) VALUES (?, ?, ?, ?, ?, ?)",
+            [(row[0],) + tuple(row[2:]) for row in rows]
+        )
+    
+    def _read_row(self, conn, name, hex_hash):
+        """Read a hash's row from any partition as a compact insert tuple, or None."""
+        key = self._key(name, hex_hash)
+        if self._is_compact(name):
+            return conn.execute(f'''
+                SELECT f.hash, f.basic_hash, m.first_seen, m.last_seen, m.title, m.company, m.location
+                FROM {name} f LEFT JOIN {meta_table(name)} m ON m.hash = f.hash WHERE f.hash = ?
+            ''', (key,)).fetchone()
+        row = conn.execute(
+            f"SELECT hash, basic_hash, first_seen, last_seen, title, company, location FROM {name} WHERE hash = ?", (key,)
+        ).fetchone()
+        return self._compact_row(row) if row else None
+    
+    def _compact_row(self, row):
+        """Convert an old-format row (TEXT digests and dates) to a compact insert tuple."""
+        full_hash, basic_hash, first_seen, last_seen = row[:4]
+        # Rows from before basic hashes existed only ever match by full hash
+        basic_fingerprint = fingerprint(basic_hash) if basic_hash else fingerprint(full_hash)
+        return (fingerprint(full_hash), basic_fingerprint, to_timestamp(first_seen), to_timestamp(last_seen)) + tuple(row[4:])
+    
+    def _delete_key(self, conn, name, hex_hash):
+        """Delete a hash from a partition (and its metadata)."""
+        key = self._key(name, hex_hash)
+        conn.execute(f"DELETE FROM {name} WHERE hash = ?", (key,))
+        if self._is_compact(name):
+            conn.execute(f"DELETE FROM {meta_table(name)} WHERE hash = ?", (key,))
+    
+    def migration_pending(self):
+        """Check whether old-format (TEXT digest) tables are left to migrate."""
+        return any(not self._is_compact(name) for name in self._partitions)
+    
+    def migrate_step(self, batch_size=2000):
+        """
+        Move up to `batch_size` rows from old-format tables into compact partitions, in one short
+        transaction. The store stays fully usable between steps (lookups read both formats),
+        so a migration can run in small steps next to a scraping run.
+        
+        Args:
+            batch_size: Maximum number of rows moved
+        
+        Returns:
+            int: Number of rows moved (0 when nothing is left)
+        """
+        if self.read_only:
+            return 0
+        
+        with self._connection() as conn:
+            self.flush()
+            moved = 0
+            for name in [name for name in reversed(self._partitions) if not self._is_compact(name)]:
+                rows = conn.execute(
+                    f"SELECT hash, basic_hash, first_seen, last_seen, title, company, location FROM {name} LIMIT ?",
+                    (batch_size - moved,)
+                ).fetchall()
+                
+                # Rows keep the month they were last seen in (the table's month for monthly tables)
+                by_partition = {}
+                for row in rows:
+                    month = partition_month(name)
+                    if month is None:
+                        try:
+                            last_seen = datetime.strptime(row[3][:7], "%Y-%m")
+                            month = (last_seen.year, last_seen.month)
+                        except (TypeError, ValueError):
+                            # Unparsable dates go to the current month so they expire last rather than first
+                            month = (datetime.now().year, datetime.now().month)
+                    target = partition_name(datetime(month[0], month[1], 1))
+                    by_partition.setdefault(target, []).append(self._compact_row(row))
+                
+                for target, target_rows in by_partition.items():
+                    self._ensure_partition(conn, target)
+                    # A compact copy is newer (a touched hash moves to the current partition), so keep it
+                    self._insert_rows(conn, target, target_rows)
+                
+                moved_hashes = [row[0] for row in rows]
+                for start in range(0, len(moved_hashes), MAX_IN_PARAMS):
+                    chunk = moved_hashes[start:start + MAX_IN_PARAMS]
+                    conn.execute(f"DELETE FROM {name} WHERE hash IN ({','.join('?' * len(chunk))})", chunk)
+                moved += len(rows)
+                
+                if len(rows) == 0 or not conn.execute(f"SELECT 1 FROM {name} LIMIT 1").fetchone():
+                    conn.execute(f"DROP TABLE {name}")
+                    logger.info(f"Old-format job hash table '{name}' fully migrated and dropped")
+                if moved >= batch_size:
+                    break
+            
             conn.commit()
-        finally:
-            conn.close()
+            self._load_partitions(conn)
+        
+        if moved:
+            self._bloom_dirty = self._bloom is not None
+            logger.info(f"Migrated {moved} job hashes to the compact schema")
+        return moved
     
     def _generate_basic_hash(self, job_data):
         """
@@ -77,9 +419,7 @@ class JobHashStore:
             str: A hash string that uniquely identifies the job
         """
         # Use all stable fields including description
-        desc_part = job_data.get('description', '')[:100] if job_data.get('description') else ''
-        hash_input = f"{job_data['title']}|{job_data['company']}|{job_data['location']}|{desc_part}"
-        return hashlib.md5(hash_input.encode()).hexdigest()
+        return full_job_hash(job_data)
     
     def is_basic_duplicate(self, job_data):
         """
@@ -93,95 +433,171 @@ class JobHashStore:
             bool: True if the job is likely a duplicate, False otherwise
         """
         basic_hash = self._generate_basic_hash(job_data)
+        if self._bloom_excludes('b', basic_hash):
+            return False
         
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM job_hashes WHERE basic_hash = ?", (basic_hash,))
-            count = cursor.fetchone()[0]
-            return count > 0
-        finally:
-            conn.close()
+        with self._connection() as conn:
+            for name in self._partitions:
+                if conn.execute(f"SELECT 1 FROM {name} WHERE basic_hash = ? LIMIT 1", (self._key(name, basic_hash),)).fetchone():
+                    return True
+        return False
+    
+    def find_basic_duplicates(self, jobs):
+        """
+        Check a whole batch of jobs against the basic hashes with one query per partition.
+        
+        Args:
+            jobs: List of dictionaries containing basic job information
+        
+        Returns:
+            List[bool]: For each job, True if it is likely a duplicate
+        """
+        basic_hashes = [self._generate_basic_hash(job_data) for job_data in jobs]
+        unknown = [basic_hash for basic_hash in set(basic_hashes) if not self._bloom_excludes('b', basic_hash)]
+        known = set()
+        
+        with self._connection() as conn:
+            for name in self._partitions:
+                keys = {self._key(name, basic_hash): basic_hash for basic_hash in unknown}
+                key_list = list(keys)
+                for start in range(0, len(key_list), MAX_IN_PARAMS):
+                    chunk = key_list[start:start + MAX_IN_PARAMS]
+                    placeholders = ','.join('?' * len(chunk))
+                    known.update(keys[row[0]] for row in conn.execute(f"SELECT DISTINCT basic_hash FROM {name} WHERE basic_hash IN ({placeholders})", chunk))
+                # Hashes found in a newer partition need no look in the older ones
+                unknown = [basic_hash for basic_hash in unknown if basic_hash not in known]
+                if not unknown:
+                    break
+        
+        return [basic_hash in known for basic_hash in basic_hashes]
     
-    def is_duplicate(self, job_data):
+    def is_duplicate(self, job_data, record=True):
         """
         Check if a job has been seen before using the full hash.
         Should be called after retrieving the full job details including description.
         
         Args:
             job_data: Dictionary containing complete job information
+            record: Store the hash of a new job right away. Pass False and call
+                add_job() after the job was saved so a crash in between never
+                leaves a job recorded as seen but not saved.
         
         Returns:
             bool: True if the job is a duplicate, False otherwise
         """
-        # Generate both hash types
         full_hash = self._generate_full_hash(job_data)
-        basic_hash = self._generate_basic_hash(job_data)
         
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT hash FROM job_hashes WHERE hash = ?", (full_hash,))
-            result = cursor.fetchone()
+        with self._connection() as conn:
+            found_in = None
+            if not self._bloom_excludes('f', full_hash):
+                for name in self._partitions:
+                    if conn.execute(f"SELECT 1 FROM {name} WHERE hash = ?", (self._key(name, full_hash),)).fetchone():
+                        found_in = name
+                        break
             
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            if result:
+            if found_in:
                 # Update the last_seen timestamp only if not in read-only mode
                 if not self.read_only:
-                    cursor.execute(
-                        "UPDATE job_hashes SET last_seen = ? WHERE hash = ?", 
-                        (now, full_hash)
-                    )
-                    conn.commit()
+                    self._touch(conn, found_in, full_hash)
+                    self._commit(conn)
                 return True
-            else:
-                # Insert new hash only if not in read-only mode
-                if not self.read_only:
-                    cursor.execute(
-                        "INSERT INTO job_hashes (hash, first_seen, last_seen, title, company, location, basic_hash) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                        (full_hash, now, now, job_data['title'], job_data['company'], job_data['location'], basic_hash)
-                    )
-                    conn.commit()
-                else:
-                    logger.debug(f"READ-ONLY mode: Would have stored new job hash for '{job_data['title']}' at '{job_data['company']}'")
-                return False
-        finally:
-            conn.close()
+        
+        if record:
+            self.add_job(job_data)
+        return False
     
-    def cleanup_expired(self):
-        """Remove job hashes that haven't been seen in the expiry period."""
-        cutoff_date = (datetime.now() - timedelta(days=self.expiry_days)).strftime("%Y-%m-%d %H:%M:%S")
+    def _touch(self, conn, partition, full_hash):
+        """
+        Set last_seen of a hash to now. A hash found in an older partition moves to this
+        month's, so partitions only ever hold hashes last seen during their month.
+        """
+        now = int(datetime.now().timestamp())
+        current = self._current_partition(conn)
+        if partition == current:
+            conn.execute(f"UPDATE {meta_table(current)} SET last_seen = ? WHERE hash = ?", (now, fingerprint(full_hash)))
+            return
+        row = self._read_row(conn, partition, full_hash)
+        first_seen = row[2] or now
+        self._insert_rows(conn, current, [row[:2] + (first_seen, now) + tuple(row[4:])], replace=True)
+        self._delete_key(conn, partition, full_hash)
+    
+    def add_job(self, job_data):
+        """
+        Record a job's hashes as seen.
         
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM job_hashes WHERE last_seen < ?", (cutoff_date,))
-            deleted_count = cursor.rowcount
+        Args:
+            job_data: Dictionary containing complete job information
+        """
+        if self.read_only:
+            logger.debug(f"READ-ONLY mode: Would have stored new job hash for '{job_data['title']}' at '{job_data['company']}'")
+            return
+        
+        full_hash = self._generate_full_hash(job_data)
+        basic_hash = self._generate_basic_hash(job_data)
+        now = int(datetime.now().timestamp())
+        
+        with self._connection() as conn:
+            current = self._current_partition(conn)
+            self._insert_rows(conn, current, [(
+                fingerprint(full_hash), fingerprint(basic_hash), now, now,
+                job_data['title'], job_data['company'], job_data['location']
+            )])
+            self._commit(conn)
+        
+        if self._bloom is not None:
+            self._bloom.add(f"f:{fingerprint(full_hash)}")
+            self._bloom.add(f"b:{fingerprint(basic_hash)}")
+            self._bloom_dirty = True
+            # Past its capacity the false-positive rate climbs, so rebuild it bigger
+            if self._bloom.is_full:
+                self._build_bloom()
+    
+    def cleanup_expired(self):
+        """
+        Drop the month partitions whose every hash was last seen before the expiry period.
+        Expiry is month-grained: a hash is kept for expiry_days and up to one month more.
+        """
+        if self.read_only:
+            return
+        with self._connection() as conn:
+            self.flush()
+            dropped = []
+            for name in list(self._partitions):
+                month = partition_month(name)
+                if month is None:
+                    continue
+                if month_expired(*month, self.expiry_days):
+                    conn.execute(f"DROP TABLE {name}")
+                    if self._is_compact(name):
+                        conn.execute(f"DROP TABLE IF EXISTS {meta_table(name)}")
+                    dropped.append(name)
             conn.commit()
+            self._load_partitions(conn)
             
-            if deleted_count > 0:
-                logger.info(f"Removed {deleted_count} expired job hashes older than {self.expiry_days} days")
-        finally:
-            conn.close()
+            if dropped:
+                # Dropped hashes stay set in the Bloom filter, which only costs a few extra SQLite lookups
+                self._bloom_dirty = self._bloom is not None
+                logger.info(f"Dropped {len(dropped)} expired job hash partitions older than {self.expiry_days} days: {', '.join(dropped)}")
     
     def get_stats(self):
         """Get statistics about the job hash store."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM job_hashes")
-            total = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT MIN(first_seen), MAX(last_seen) FROM job_hashes")
-            result = cursor.fetchone()
-            first = result[0] if result and result[0] is not None else "N/A"
-            last = result[1] if result and result[1] is not None else "N/A"
+        with self._connection() as conn:
+            total = 0
+            first_dates = []
+            last_dates = []
+            for name in self._partitions:
+                compact = self._is_compact(name)
+                dates_table = meta_table(name) if compact else name
+                total += conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+                first, last = conn.execute(f"SELECT MIN(first_seen), MAX(last_seen) FROM {dates_table}").fetchone()
+                if first is not None:
+                    first_dates.append(format_timestamp(first) if compact else first)
+                if last is not None:
+                    last_dates.append(format_timestamp(last) if compact else last)
             
             return {
                 "total_jobs_tracked": total,
-                "oldest_job_date": first,
-                "newest_job_date": last
+                "oldest_job_date": min(first_dates) if first_dates else "N/A",
+                "newest_job_date": max(last_dates) if last_dates else "N/A",
+                "partitions": len(self._partitions)
             }
-        finally:
-            conn.close()
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Append-only JSON Lines writer for scraper output.
+Replaces the read-modify-write JSON array saves, which cost O(n) per record.
+"""
+
+import glob
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional
+
+from config import JSONL_FSYNC_EVERY
+
+logger = logging.getLogger(__name__)
+
+
+class JsonlWriter:
+    """Streams records to a .jsonl file and produces the final JSON array on finalize."""
+
+    def __init__(self, json_path: str, fsync_every: int = JSONL_FSYNC_EVERY):
+        """
+        Initialize the writer.
+
+        Args:
+            json_path: Path of the final JSON array file (the .jsonl file lives next to it)
+            fsync_every: Number of appended records between fsync calls
+        """
+        self.json_path = json_path
+        self.jsonl_path = os.path.splitext(json_path)[0] + '.jsonl'
+        self.fsync_every = max(1, fsync_every)
+        self._file = None
+        self._unsynced = 0
+        self.count = 0
+
+        # Resume counting if a previous (crashed) run left records behind
+        if os.path.exists(self.jsonl_path):
+            self.count = len(read_jsonl(self.jsonl_path))
+
+    def _open(self):
+        """Open the .jsonl file for appending."""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.jsonl_path) or '.', exist_ok=True)
+            self._file = open(self.jsonl_path, 'a', encoding='utf-8')
+
+            # Terminate a line truncated by a crash so the next record starts cleanly
+            if self._file.tell() > 0:
+                with open(self.jsonl_path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        self._file.write('\n')
+
+    def append(self, record: Dict) -> int:
+        """
+        Append one record as a single line.
+        The line is flushed to the OS immediately so a crash loses at most the
+        record being written; fsync is batched every `fsync_every` records.
+
+        Args:
+            record: Dictionary to write
+
+        Returns:
+            int: Total number of records written to this file
+        """
+        self._open()
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+        self.count += 1
+        return self.count
+
+    def close(self):
+        """Flush, fsync and close the .jsonl file."""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+            self._unsynced = 0
+
+    def finalize(self) -> int:
+        """
+        Close the stream and write all records as a JSON array to `json_path`.
+        The .jsonl file is removed once the array has been written.
+
+        Returns:
+            int: Number of records in the final JSON file
+        """
+        self.close()
+
+        if not os.path.exists(self.jsonl_path):
+            logger.debug(f"No records written to {self.jsonl_path}, nothing to finalize")
+            return 0
+
+        records = read_jsonl(self.jsonl_path)
+
+        # Write atomically so the uploader never sees a half-written file
+        tmp_path = self.json_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.json_path)
+        os.remove(self.jsonl_path)
+
+        logger.info(f"Finalized {len(records)} records into {self.json_path}")
+        return len(records)
+
+
+def read_jsonl(path: str) -> List[Dict]:
+    """
+    Read all records from a .jsonl file, skipping a truncated last line.
+
+    Args:
+        path: Path to the .jsonl file
+
+    Returns:
+        List[Dict]: Records in write order
+    """
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping unreadable line {line_number} in {path}: {e}")
+    return records
+
+
+# Open writers keyed by final JSON path, shared by every save call of a run
+_writers: Dict[str, JsonlWriter] = {}
+
+
+def get_writer(json_path: str) -> JsonlWriter:
+    """
+    Get the shared writer for an output file, creating it on first use.
+
+    Args:
+        json_path: Path of the final JSON array file
+
+    Returns:
+        JsonlWriter: Writer for this output file
+    """
+    writer = _writers.get(json_path)
+    if writer is None:
+        writer = JsonlWriter(json_path)
+        _writers[json_path] = writer
+    return writer
+
+
+def finalize_output(json_path: str) -> Optional[int]:
+    """
+    Finalize an output file into a JSON array.
+    Also works for a .jsonl file left behind by a crashed run.
+
+    Args:
+        json_path: Path of the final JSON array file
+
+    Returns:
+        int or None: Number of records finalized, or None on error
+    """
+    writer = _writers.pop(json_path, None) or JsonlWriter(json_path)
+    try:
+        return writer.finalize()
+    except Exception as e:
+        logger.error(f"Error finalizing output file {json_path}: {e}")
+        return None
+
+
+def finalize_leftovers(directory: str, keep: Iterable[str] = ()) -> int:
+    """
+    Finalize the .jsonl files that interrupted or crashed runs left in an output directory.
+
+    Args:
+        directory: Output directory of a scraper
+        keep: JSON paths whose .jsonl file must stay as is (e.g. the output of a run being resumed)
+
+    Returns:
+        int: Number of leftover files finalized
+    """
+    kept = {os.path.normpath(path) for path in keep}
+    kept.update(os.path.normpath(path) for path in _writers)
+
+    finalized = 0
+    for jsonl_path in sorted(glob.glob(os.path.join(directory, '*.jsonl'))):
+        json_path = os.path.splitext(jsonl_path)[0] + '.json'
+        if os.path.normpath(json_path) in kept:
+            continue
+        logger.warning(f"Found {jsonl_path} left behind by an interrupted run, finalizing it")
+        if finalize_output(json_path) is not None:
+            finalized += 1
+    return finalized
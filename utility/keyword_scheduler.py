@@ -0,0 +1,213 @@
+import json
+import os
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config import (
+    KEYWORD_HISTORY_PATH,
+    GLOBAL_JOB_BUDGET,
+    GLOBAL_TIME_BUDGET_MINUTES,
+    MAX_JOBS_TO_SCRAPE,
+    MAX_SCROLL_ATTEMPTS,
+    KEYWORD_YIELD_PRIOR,
+    KEYWORD_YIELD_ALPHA,
+    KEYWORD_DEAD_MIN_RUNS,
+    KEYWORD_DEAD_THRESHOLD,
+    KEYWORD_PROBE_MAX_JOBS,
+    KEYWORD_PROBE_MAX_SCROLLS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordScheduler:
+    """Splits a global job and time budget across keywords in proportion to their historical yield of new jobs."""
+
+    def __init__(self, history_path: str = KEYWORD_HISTORY_PATH):
+        """
+        Initialize the scheduler.
+
+        Args:
+            history_path: Path of the JSON file holding per-keyword yield history
+        """
+        self.history_path = history_path
+        self.history = self._load_history()
+
+    def _load_history(self) -> Dict[str, Dict]:
+        """Load the per-keyword history, or start empty."""
+        if not os.path.exists(self.history_path):
+            return {}
+        try:
+            with open(self.history_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Could not read keyword history {self.history_path}: {e}")
+            return {}
+
+    def _save_history(self):
+        """Write the per-keyword history atomically."""
+        os.makedirs(os.path.dirname(self.history_path) or '.', exist_ok=True)
+        tmp_path = self.history_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.history, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.history_path)
+
+    def expected_new_jobs(self, keyword: str) -> float:
+        """Expected number of new jobs for a keyword (smoothed history, or the prior if never run)."""
+        entry = self.history.get(keyword)
+        return entry['new_ewma'] if entry else KEYWORD_YIELD_PRIOR
+
+    def is_dead(self, keyword: str) -> bool:
+        """Check whether a keyword has historically yielded (almost) no new jobs."""
+        entry = self.history.get(keyword)
+        return bool(entry) and entry['runs'] >= KEYWORD_DEAD_MIN_RUNS and entry['new_ewma'] < KEYWORD_DEAD_THRESHOLD
+
+    def allocate(self, keywords: List[str]) -> Dict[str, Dict]:
+        """
+        Build the scraping plan for a run.
+
+        Dead keywords get a cheap probe (KEYWORD_PROBE_MAX_JOBS jobs, KEYWORD_PROBE_MAX_SCROLLS scrolls).
+        The rest of GLOBAL_JOB_BUDGET and GLOBAL_TIME_BUDGET_MINUTES is split in proportion
+        to each keyword's expected new jobs. A budget of 0 means unlimited.
+
+        Every other keyword gets at least a probe's jobs, so a small share never rounds down
+        to nothing and its yield keeps being measured. Jobs above MAX_JOBS_TO_SCRAPE go to the
+        keywords still below it.
+
+        Args:
+            keywords: Keywords to schedule
+
+        Returns:
+            Dict: keyword -> {'max_jobs', 'max_scrolls', 'time_budget' (seconds or None), 'probe'},
+            ordered by expected yield, highest first
+        """
+        ordered = sorted(keywords, key=self.expected_new_jobs, reverse=True)
+        probes = [keyword for keyword in ordered if self.is_dead(keyword)]
+        active = [keyword for keyword in ordered if keyword not in probes]
+
+        per_keyword_limit = MAX_JOBS_TO_SCRAPE if MAX_JOBS_TO_SCRAPE > 0 else None
+        job_budget = GLOBAL_JOB_BUDGET if GLOBAL_JOB_BUDGET > 0 else None
+        time_budget = GLOBAL_TIME_BUDGET_MINUTES * 60 if GLOBAL_TIME_BUDGET_MINUTES > 0 else None
+
+        plan = {}
+        for keyword in probes:
+            plan[keyword] = {'max_jobs': KEYWORD_PROBE_MAX_JOBS, 'max_scrolls': KEYWORD_PROBE_MAX_SCROLLS, 'time_budget': None, 'probe': True}
+
+        # Probes are paid for first, the remaining budget goes to productive keywords
+        if job_budget is not None:
+            job_budget = max(0, job_budget - KEYWORD_PROBE_MAX_JOBS * len(probes))
+        job_shares = self._split(job_budget, active, floor=max(1, KEYWORD_PROBE_MAX_JOBS), cap=per_keyword_limit) if job_budget is not None else {}
+        # Probes are already bounded by their single scroll, so only productive keywords share the time budget
+        time_shares = self._split_float(time_budget, active) if time_budget is not None else {}
+
+        for keyword in active:
+            max_jobs = job_shares.get(keyword, per_keyword_limit)
+            if per_keyword_limit is not None and max_jobs is not None:
+                max_jobs = min(max_jobs, per_keyword_limit)
+            plan[keyword] = {'max_jobs': max_jobs, 'max_scrolls': MAX_SCROLL_ATTEMPTS, 'time_budget': None, 'probe': False}
+
+        for keyword, seconds in time_shares.items():
+            plan[keyword]['time_budget'] = seconds
+
+        # Keep the highest expected yield first so a cut-short run still covers the best keywords
+        return {keyword: plan[keyword] for keyword in ordered}
+
+    def _weights(self, keywords: List[str]) -> Dict[str, float]:
+        """Get each keyword's share of the expected new jobs (equal shares if nothing is expected)."""
+        expected = {keyword: max(self.expected_new_jobs(keyword), 0.0) for keyword in keywords}
+        total = sum(expected.values())
+        if total <= 0:
+            return {keyword: 1.0 / len(keywords) for keyword in keywords}
+        return {keyword: value / total for keyword, value in expected.items()}
+
+    def _split(self, budget: int, keywords: List[str], floor: int = 0, cap: Optional[int] = None) -> Dict[str, int]:
+        """
+        Split an integer budget proportionally, with a minimum and a maximum per keyword.
+
+        Every keyword first gets `floor` (even if that exceeds the budget), then the rest is split
+        proportionally. Shares that would pass `cap` are clipped and the excess is split again
+        among the keywords below it, until nothing is clipped or every keyword is at the cap.
+
+        Args:
+            budget: Jobs to hand out
+            keywords: Keywords sharing the budget
+            floor: Minimum jobs per keyword
+            cap: Maximum jobs per keyword (None: no maximum)
+
+        Returns:
+            Dict: keyword -> jobs
+        """
+        if cap is not None:
+            floor = min(floor, cap)
+        shares = {keyword: floor for keyword in keywords}
+        left = max(0, budget - floor * len(keywords))
+        open_keywords = list(keywords)
+        while open_keywords and left > 0:
+            extra = self._split_proportional(left, open_keywords)
+            clipped = [keyword for keyword in open_keywords if cap is not None and shares[keyword] + extra[keyword] >= cap]
+            if not clipped:
+                for keyword in open_keywords:
+                    shares[keyword] += extra[keyword]
+                break
+            # Fill the clipped keywords to the cap and split what's left again among the others
+            for keyword in clipped:
+                left -= cap - shares[keyword]
+                shares[keyword] = cap
+                open_keywords.remove(keyword)
+        return shares
+
+    def _split_proportional(self, budget: int, keywords: List[str]) -> Dict[str, int]:
+        """Split an integer budget proportionally, never handing out more than the budget."""
+        if not keywords:
+            return {}
+        weights = self._weights(keywords)
+        raw = {keyword: budget * weight for keyword, weight in weights.items()}
+        shares = {keyword: int(value) for keyword, value in raw.items()}
+
+        # Largest remainder: hand out the jobs lost to rounding down
+        leftover = budget - sum(shares.values())
+        for keyword in sorted(keywords, key=lambda k: raw[k] - shares[k], reverse=True)[:leftover]:
+            shares[keyword] += 1
+        return shares
+
+    def _split_float(self, budget: float, keywords: List[str]) -> Dict[str, float]:
+        """Split a time budget proportionally."""
+        if not keywords:
+            return {}
+        return {keyword: budget * weight for keyword, weight in self._weights(keywords).items()}
+
+    def record(self, keyword: str, new_jobs: int, duplicates: int):
+        """
+        Record the outcome of a keyword run and update its smoothed yield.
+
+        Args:
+            keyword: Search keyword
+            new_jobs: New jobs saved
+            duplicates: Duplicates skipped
+        """
+        entry = self.history.get(keyword)
+        if entry is None:
+            entry = {'runs': 0, 'new_ewma': float(new_jobs), 'duplicate_ewma': float(duplicates)}
+        else:
+            entry['new_ewma'] = KEYWORD_YIELD_ALPHA * new_jobs + (1 - KEYWORD_YIELD_ALPHA) * entry['new_ewma']
+            entry['duplicate_ewma'] = KEYWORD_YIELD_ALPHA * duplicates + (1 - KEYWORD_YIELD_ALPHA) * entry['duplicate_ewma']
+        entry['runs'] += 1
+        entry['last_new_jobs'] = new_jobs
+        entry['last_duplicates'] = duplicates
+        entry['last_run'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.history[keyword] = entry
+
+        try:
+            self._save_history()
+        except Exception as e:
+            logger.error(f"Could not save keyword history: {e}")
+
+    def log_plan(self, plan: Dict[str, Dict]):
+        """Log the allocation of a run."""
+        logger.info("Keyword budget allocation (by expected new jobs):")
+        for keyword, entry in plan.items():
+            max_jobs = entry['max_jobs'] if entry['max_jobs'] is not None else "unlimited"
+            time_budget = f"{entry['time_budget'] / 60:.1f} min" if entry['time_budget'] is not None else "no time limit"
+            kind = "probe" if entry['probe'] else "full"
+            logger.info(f"  - '{keyword}': expected {self.expected_new_jobs(keyword):.1f} new, {kind}, max {max_jobs} jobs, {time_budget}")
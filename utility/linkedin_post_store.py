@@ -7,7 +7,7 @@ import sqlite3
 import logging
 import os
 from datetime import datetime
-from typing import Set, Optional
+from typing import List, Set, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,13 @@ logger = logging.getLogger(__name__)
 DB_PATH = 'data/linkedin_posts.db'
 
 
+def activity_id(post_id: Optional[str]) -> Optional[int]:
+    """Get the numeric activity ID of a post ID, or None if it isn't one."""
+    if post_id and post_id.isdigit():
+        return int(post_id)
+    return None
+
+
 def init_database():
     """Initialize the SQLite database and create tables if they don't exist."""
     try:
@@ -54,14 +61,12 @@ def init_database():
 def load_scraped_ids() -> Set[str]:
     """
     Load all scraped post IDs from the database.
+    Call init_database() once before the first load or save.
     
     Returns:
         Set[str]: Set of all previously scraped post IDs
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
-        
         conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         
@@ -94,9 +99,6 @@ def save_scraped_id(post_id: str, person_name: Optional[str] = None,
         bool: True if saved successfully, False otherwise
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
-        
         conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         
@@ -198,3 +200,133 @@ def clear_old_posts(days_old: int = 90):
     except Exception as e:
         logger.error(f"Error clearing old posts: {e}")
         return 0
+
+
+class LinkedinPostStore:
+    """
+    Store of scraped LinkedIn post IDs over one long-lived connection.
+    
+    Unlike the module functions, which reconnect on every call, the store opens the
+    database once in WAL mode, creates the schema once, and keeps the total count in
+    memory. Writes are committed per call; add_many() writes a whole batch in one transaction.
+    """
+    
+    # Chunk size of IN (...) lookups, under SQLite's bound parameter limit
+    MAX_IN_PARAMS = 500
+    
+    def __init__(self, db_path: str = DB_PATH):
+        """
+        Open the store.
+        
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        # Statements are compiled once and reused from the connection's statement cache
+        self._conn = sqlite3.connect(self.db_path, cached_statements=64)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only syncs at checkpoints: a power loss can drop the last commits but never corrupts the file
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+        self._count = self._conn.execute('SELECT COUNT(*) FROM scraped_posts').fetchone()[0]
+        logger.info(f"LinkedIn post store opened at {self.db_path} ({self._count} post IDs)")
+    
+    def _init_db(self):
+        """Create the table and index if they don't exist (same schema as init_database())."""
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS scraped_posts (
+                post_id TEXT PRIMARY KEY,
+                scraped_date TEXT NOT NULL,
+                person_name TEXT,
+                post_link TEXT
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_scraped_date ON scraped_posts(scraped_date)')
+        self._conn.commit()
+    
+    def load_scraped_ids(self) -> Set[str]:
+        """
+        Load all scraped post IDs.
+        
+        Returns:
+            Set[str]: Set of all previously scraped post IDs
+        """
+        return {row[0] for row in self._conn.execute('SELECT post_id FROM scraped_posts')}
+    
+    def is_post_scraped(self, post_id: str) -> bool:
+        """
+        Check if a post ID has already been scraped.
+        
+        Args:
+            post_id: The LinkedIn post ID to check
+            
+        Returns:
+            bool: True if post was already scraped
+        """
+        return self._conn.execute('SELECT 1 FROM scraped_posts WHERE post_id = ?', (post_id,)).fetchone() is not None
+    
+    def contains_many(self, post_ids: List[str]) -> List[bool]:
+        """
+        Check a batch of post IDs with one query per 500 IDs.
+        
+        Args:
+            post_ids: The LinkedIn post IDs to check
+            
+        Returns:
+            List[bool]: For each post ID, True if the post was already scraped
+        """
+        unique_ids = list(set(post_ids))
+        scraped = set()
+        for start in range(0, len(unique_ids), self.MAX_IN_PARAMS):
+            chunk = unique_ids[start:start + self.MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            scraped.update(row[0] for row in self._conn.execute(
+                f'SELECT post_id FROM scraped_posts WHERE post_id IN ({placeholders})', chunk
+            ))
+        return [post_id in scraped for post_id in post_ids]
+    
+    def add(self, post_id: str, person_name: Optional[str] = None, post_link: Optional[str] = None) -> bool:
+        """
+        Save one scraped post ID.
+        
+        Returns:
+            bool: True if the post ID was new
+        """
+        return self.add_many([(post_id, person_name, post_link)]) == 1
+    
+    def add_many(self, posts: List[Tuple[str, Optional[str], Optional[str]]]) -> int:
+        """
+        Save a batch of scraped post IDs in one transaction.
+        Post IDs already stored get their date, name and link refreshed.
+        
+        Args:
+            posts: (post_id, person_name, post_link) tuples
+            
+        Returns:
+            int: Number of post IDs that were new
+        """
+        if not posts:
+            return 0
+        post_ids = list(dict.fromkeys(post_id for post_id, _, _ in posts))
+        new_ids = len(post_ids) - sum(self.contains_many(post_ids))
+        
+        scraped_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._conn:
+            self._conn.executemany('''
+                INSERT OR REPLACE INTO scraped_posts (post_id, scraped_date, person_name, post_link)
+                VALUES (?, ?, ?, ?)
+            ''', [(post_id, scraped_date, person_name, post_link) for post_id, person_name, post_link in posts])
+        self._count += new_ids
+        logger.debug(f"Saved {len(posts)} post IDs to database ({new_ids} new)")
+        return new_ids
+    
+    def count(self) -> int:
+        """Get the total number of scraped posts, without querying the database."""
+        return self._count
+    
+    def close(self):
+        """Close the connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,120 @@
+"""
+Online migration tool for data/job_hashes.db.
+
+Moves job hashes from the old formats (the single TEXT-keyed job_hashes table, or
+the TEXT-keyed job_hashes_YYYY_MM partitions) into the compact month partitions
+(job_fp_YYYY_MM + job_meta_YYYY_MM). Rows move in small transactions, and the store
+reads both formats in the meantime, so this can run while the scraper is running.
+JobHashStore also migrates one batch by itself on every non-testing open.
+
+Usage:
+    python -m utility.migrate_job_hashes [--db data/job_hashes.db] [--dry-run]
+                                         [--batch-size 2000] [--pause 0.05] [--no-vacuum]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import time
+
+# Add the parent directory (project root) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility.job_hash_store import JobHashStore, TEXT_PATTERN, LEGACY_TABLE
+
+logger = logging.getLogger(__name__)
+
+
+def count_old_format_rows(db_path):
+    """
+    Count the rows left in old-format tables.
+
+    Returns:
+        Dict: table -> rows, empty if there is nothing to migrate
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        old_tables = sorted(name for name in names if name == LEGACY_TABLE or TEXT_PATTERN.match(name))
+        return {name: conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0] for name in old_tables}
+    finally:
+        conn.close()
+
+
+def migrate(db_path, batch_size=2000, pause=0.05, backup=True, vacuum=True):
+    """
+    Migrate a job hash database to the compact schema.
+
+    Args:
+        db_path: Path to the SQLite database file
+        batch_size: Rows moved per transaction
+        pause: Seconds to wait between transactions, leaving room for a running scraper
+        backup: Copy the database to <db_path>.bak before migrating
+        vacuum: Rebuild the file afterwards so the freed pages are returned to the disk
+
+    Returns:
+        int: Number of rows migrated
+    """
+    tables = count_old_format_rows(db_path)
+    if not tables:
+        logger.info(f"{db_path} already uses the compact schema - nothing to migrate")
+        return 0
+
+    if backup:
+        shutil.copy2(db_path, db_path + '.bak')
+        logger.info(f"Backed up {db_path} to {db_path}.bak")
+
+    remaining = sum(tables.values())
+    size_before = os.path.getsize(db_path)
+    store = JobHashStore(db_path=db_path, persistent=True)
+    # Opening a writable store already moved the first batch
+    migrated = remaining - sum(count_old_format_rows(db_path).values())
+    while True:
+        moved = store.migrate_step(batch_size)
+        if not moved and not store.migration_pending():
+            break
+        migrated += moved
+        logger.info(f"Migrated {migrated}/{remaining} job hashes")
+        time.sleep(pause)
+    store.close()
+
+    if vacuum:
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+
+    size_after = os.path.getsize(db_path)
+    logger.info(f"Migration complete: {migrated} job hashes, file size {size_before / 1024:.0f} KB -> {size_after / 1024:.0f} KB")
+    return migrated
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description="Migrate data/job_hashes.db to compact month partitions")
+    parser.add_argument('--db', default='data/job_hashes.db', help="Job hash database to migrate")
+    parser.add_argument('--dry-run', action='store_true', help="Only show the rows left in old-format tables")
+    parser.add_argument('--batch-size', type=int, default=2000, help="Rows moved per transaction")
+    parser.add_argument('--pause', type=float, default=0.05, help="Seconds between transactions")
+    parser.add_argument('--no-backup', action='store_true', help="Don't copy the database before migrating")
+    parser.add_argument('--no-vacuum', action='store_true', help="Don't rebuild the file after migrating")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        logger.error(f"Database not found: {args.db}")
+        sys.exit(1)
+
+    if args.dry_run:
+        tables = count_old_format_rows(args.db)
+        if not tables:
+            logger.info("Nothing to migrate")
+        for name, count in tables.items():
+            logger.info(f"  - {name}: {count} job hashes")
+    else:
+        migrate(args.db, batch_size=args.batch_size, pause=args.pause,
+                backup=not args.no_backup, vacuum=not args.no_vacuum)
@@ -0,0 +1,311 @@
+import sqlite3
+import hashlib
+import os
+import re
+import logging
+from array import array
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
+
+from utility.job_hash_store import full_job_hash, month_expired
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+EMPTY_BIN = 0xFFFFFFFF
+
+# Signatures live in one pair of tables per month they were saved, expired like the job hash partitions:
+# job_minhashes_YYYY_MM holds the signatures, job_minhash_bands_YYYY_MM their LSH band keys
+PARTITION_PATTERN = re.compile(r'^job_minhashes_(\d{4})_(\d{2})$')
+
+
+def minhash_partition(when: datetime) -> str:
+    """Get the name of the month partition holding signatures saved at `when`."""
+    return f"job_minhashes_{when.year:04d}_{when.month:02d}"
+
+
+def bands_table(partition: str) -> str:
+    """Get the name of the band key table paired with a signature partition."""
+    return partition.replace('job_minhashes_', 'job_minhash_bands_', 1)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of a text."""
+    return WORD_PATTERN.findall(text.casefold())
+
+
+def normalize_location(location: Optional[str]) -> str:
+    """Location key of a job: its lowercase words, so spacing and punctuation differences still match."""
+    return ' '.join(tokenize(location or ''))
+
+
+def shingles(tokens: List[str], shingle_size: int = 2) -> Set[str]:
+    """Set of word n-grams of a token list."""
+    if len(tokens) <= shingle_size:
+        return {' '.join(tokens)}
+    return {' '.join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)}
+
+
+def minhash(shingle_set: Set[str], num_bins: int = 64) -> array:
+    """
+    Compute a MinHash signature with one-permutation hashing.
+
+    Each shingle is hashed once; its hash picks a bin and the bin keeps the smallest
+    value it sees. Empty bins borrow from the next non-empty bin (densification) so
+    that two signatures agree on a bin with probability equal to the Jaccard similarity.
+
+    Args:
+        shingle_set: Shingles of the text
+        num_bins: Signature length
+
+    Returns:
+        array: Signature of `num_bins` unsigned 32-bit values
+    """
+    signature = array('I', [EMPTY_BIN]) * num_bins
+    for shingle in shingle_set:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+        bin_index = value % num_bins
+        low = (value >> 32) & 0x7FFFFFFF
+        if low < signature[bin_index]:
+            signature[bin_index] = low
+
+    # Densify by rotation: the distance to the lender keeps borrowed values distinct
+    if EMPTY_BIN in signature:
+        original = signature[:]
+        for i in range(num_bins):
+            if original[i] != EMPTY_BIN:
+                continue
+            distance = 1
+            while original[(i + distance) % num_bins] == EMPTY_BIN:
+                distance += 1
+            borrowed = original[(i + distance) % num_bins]
+            signature[i] = ((borrowed + distance * 0x9E3779B1) & 0x7FFFFFFF) | 0x80000000
+    return signature
+
+
+def estimate_similarity(a: array, b: array) -> float:
+    """Estimated Jaccard similarity of two signatures (share of equal bins)."""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def choose_bands(num_bins: int, threshold: float) -> Tuple[int, int]:
+    """
+    Pick the LSH banding for a threshold.
+
+    A pair with similarity s becomes a candidate with probability 1 - (1 - s^rows)^bands,
+    which rises steeply around (1 / bands)^(1 / rows). The banding whose rise sits closest
+    below the threshold is used, so near duplicates are rarely missed and the exact
+    signature comparison weeds out the extra candidates.
+
+    Returns:
+        Tuple: (bands, rows per band)
+    """
+    options = [(num_bins // rows, rows) for rows in range(1, num_bins + 1) if num_bins % rows == 0]
+    below = [(bands, rows) for bands, rows in options if (1 / bands) ** (1 / rows) <= threshold]
+    return max(below or options[:1], key=lambda option: (1 / option[0]) ** (1 / option[1]))
+
+
+class NearDuplicateIndex:
+    """
+    Near-duplicate detector for jobs over MinHash signatures of title, company and description.
+
+    Signatures live in monthly `job_minhashes_YYYY_MM` tables and their LSH band keys in
+    `job_minhash_bands_YYYY_MM`, so a lookup is two indexed queries per month and nothing
+    has to be loaded at startup. Only jobs at the same location are compared: postings of one
+    role in several cities share nearly all their text but are distinct jobs.
+
+    The tables are kept in their own database file: the job
+    hash store may hold a write transaction open between group commits, and a second
+    writer on its file would fail with "database is locked".
+    """
+
+    def __init__(self, db_path='data/job_minhashes.db', expiry_days=30, threshold=0.7, min_tokens=30, num_bins=64,
+                 shingle_size=2, read_only=False):
+        """
+        Initialize the index.
+
+        Args:
+            db_path: Path to the SQLite database file (not the job hash store's)
+            expiry_days: Number of days after which signatures are dropped, month-grained
+                like the job hash partitions
+            threshold: Minimum estimated Jaccard similarity of word shingles for a near duplicate
+            min_tokens: Jobs with fewer description tokens are neither checked nor stored,
+                since a signature of a title alone matches too many unrelated jobs
+            num_bins: MinHash signature length
+            shingle_size: Words per shingle
+            read_only: Never store new signatures (testing mode)
+        """
+        self.db_path = db_path
+        self.expiry_days = expiry_days
+        self.threshold = threshold
+        self.min_tokens = min_tokens
+        self.num_bins = num_bins
+        self.shingle_size = shingle_size
+        self.read_only = read_only
+        self.bands, self.rows = choose_bands(num_bins, threshold)
+        self.checks = 0
+        self.matches = 0
+        self._partitions = []
+
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._load_partitions()
+        logger.info(f"Near-duplicate index ready (threshold {threshold}, {self.bands} bands of {self.rows} rows)")
+
+    def _load_partitions(self):
+        """Refresh the partition list, newest month first, adding columns missing from older partitions."""
+        names = [row[0] for row in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        self._partitions = sorted((name for name in names if PARTITION_PATTERN.match(name)), reverse=True)
+        for name in self._partitions:
+            columns = {row[1] for row in self._conn.execute(f"PRAGMA table_info({name})")}
+            # Rows without a location never match, so older signatures can't merge jobs across cities
+            for column in ('location', 'job_hash'):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE {name} ADD COLUMN {column} TEXT")
+        self._conn.commit()
+
+    def _ensure_partition(self, name):
+        """Create a signature partition and its band key table if they don't exist yet."""
+        if name in self._partitions:
+            return
+        self._conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {name} (
+                id INTEGER PRIMARY KEY,
+                signature BLOB NOT NULL,
+                first_seen TEXT NOT NULL,
+                title TEXT,
+                company TEXT,
+                location TEXT,
+                job_hash TEXT
+            )
+        ''')
+        self._conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {bands_table(name)} (
+                band_key INTEGER NOT NULL,
+                job_id INTEGER NOT NULL,
+                PRIMARY KEY (band_key, job_id)
+            ) WITHOUT ROWID
+        ''')
+        self._conn.commit()
+        self._load_partitions()
+
+    def signature(self, job_data) -> Optional[array]:
+        """
+        Get the MinHash signature of a job.
+
+        Args:
+            job_data: Dictionary containing complete job information
+
+        Returns:
+            array or None: Signature, or None if the description is too short to compare
+        """
+        description_tokens = tokenize(job_data.get('description') or '')
+        if len(description_tokens) < self.min_tokens:
+            return None
+        tokens = tokenize(f"{job_data.get('title', '')} {job_data.get('company', '')}") + description_tokens
+        return minhash(shingles(tokens, self.shingle_size), self.num_bins)
+
+    def _band_keys(self, signature: array) -> List[int]:
+        """Get the LSH bucket key of every band as a signed 64-bit integer."""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(band.to_bytes(2, 'little') + chunk, digest_size=8).digest()
+            keys.append(int.from_bytes(digest, 'little', signed=True))
+        return keys
+
+    def find_similar(self, job_data) -> Optional[Tuple[float, str, str, str]]:
+        """
+        Look for a stored job at the same location at least `threshold` similar to this one.
+
+        Args:
+            job_data: Dictionary containing complete job information
+
+        Returns:
+            Tuple or None: (similarity, title, company, job hash) of the most similar stored job, or None
+        """
+        signature = self.signature(job_data)
+        if signature is None:
+            return None
+        self.checks += 1
+
+        band_keys = self._band_keys(signature)
+        placeholders = ','.join('?' * len(band_keys))
+        location = normalize_location(job_data.get('location'))
+        rows = []
+        for name in self._partitions:
+            rows.extend(self._conn.execute(f'''
+                SELECT signature, title, company, job_hash FROM {name}
+                WHERE location = ? AND id IN (SELECT job_id FROM {bands_table(name)} WHERE band_key IN ({placeholders}))
+            ''', [location] + band_keys).fetchall())
+
+        best = None
+        for blob, title, company, job_hash in rows:
+            candidate = array('I')
+            candidate.frombytes(blob)
+            similarity = estimate_similarity(signature, candidate)
+            if similarity >= self.threshold and (best is None or similarity > best[0]):
+                best = (similarity, title, company, job_hash)
+
+        if best is not None:
+            self.matches += 1
+        return best
+
+    def add(self, job_data):
+        """
+        Store the signature of a saved job.
+
+        Args:
+            job_data: Dictionary containing complete job information
+        """
+        if self.read_only:
+            return
+        signature = self.signature(job_data)
+        if signature is None:
+            return
+
+        now = datetime.now()
+        partition = minhash_partition(now)
+        self._ensure_partition(partition)
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"INSERT INTO {partition} (signature, first_seen, title, company, location, job_hash) VALUES (?, ?, ?, ?, ?, ?)",
+            (signature.tobytes(), now.strftime("%Y-%m-%d %H:%M:%S"), job_data.get('title'), job_data.get('company'),
+             normalize_location(job_data.get('location')), full_job_hash(job_data))
+        )
+        job_id = cursor.lastrowid
+        cursor.executemany(
+            f"INSERT OR IGNORE INTO {bands_table(partition)} (band_key, job_id) VALUES (?, ?)",
+            [(band_key, job_id) for band_key in self._band_keys(signature)]
+        )
+        self._conn.commit()
+
+    def cleanup_expired(self):
+        """
+        Drop the month partitions whose every signature was saved before the expiry period,
+        by the same rule as JobHashStore.cleanup_expired().
+        """
+        if self.read_only:
+            return
+        dropped = []
+        for name in list(self._partitions):
+            match = PARTITION_PATTERN.match(name)
+            if month_expired(int(match.group(1)), int(match.group(2)), self.expiry_days):
+                self._conn.execute(f"DROP TABLE {name}")
+                self._conn.execute(f"DROP TABLE IF EXISTS {bands_table(name)}")
+                dropped.append(name)
+        self._conn.commit()
+        self._load_partitions()
+
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} expired near-duplicate partitions older than {self.expiry_days} days: {', '.join(dropped)}")
+
+    def close(self):
+        """Log the match rate and close the connection."""
+        if self.checks:
+            logger.info(f"Near-duplicate index: {self.matches}/{self.checks} jobs matched an earlier job")
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,175 @@
+"""
+Adaptive pacing of the scrapers' human-like delays.
+
+Every SLEEP_* range goes through the run's PacingController, which scales it with an
+AIMD rule: the scale shrinks by a fixed step after each healthy signal (a page or panel
+that loaded quickly) and is multiplied after each sign of throttling (slow loads, empty
+result panels, CAPTCHA pages, HTTP 429). The "fixed" profile keeps the configured ranges.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Iterable, Optional, Tuple
+
+from config import (PACING_PROFILE, PACING_MIN_SCALE, PACING_MAX_SCALE, PACING_DECREASE_STEP,
+                    PACING_BACKOFF_FACTOR, PACING_BACKOFF_COOLDOWN, PACING_SLOW_LOAD_SECONDS,
+                    PACING_CAPTCHA_URL_PATTERNS)
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ('adaptive', 'fixed')
+
+
+class PacingController:
+    """AIMD controller of the delay scale, shared by every page of a run."""
+
+    def __init__(self, profile: str = PACING_PROFILE, min_scale: float = PACING_MIN_SCALE,
+                 max_scale: float = PACING_MAX_SCALE, decrease_step: float = PACING_DECREASE_STEP,
+                 backoff_factor: float = PACING_BACKOFF_FACTOR, backoff_cooldown: float = PACING_BACKOFF_COOLDOWN,
+                 slow_load_seconds: float = PACING_SLOW_LOAD_SECONDS,
+                 captcha_url_patterns: Optional[Iterable[str]] = None):
+        """
+        Initialize the controller.
+
+        Args:
+            profile: 'adaptive' (AIMD) or 'fixed' (always the configured SLEEP_* ranges)
+            min_scale: Lowest delay scale reached while the site is healthy
+            max_scale: Highest delay scale reached while backing off
+            decrease_step: Subtracted from the scale after each healthy signal
+            backoff_factor: Multiplies the scale after each throttling signal
+            backoff_cooldown: Seconds after a backoff during which further throttling signals
+                don't back off again (one burst of 429s is one event)
+            slow_load_seconds: Loads slower than this count as throttling
+            captcha_url_patterns: URL substrings of CAPTCHA/challenge pages (defaults to config)
+        """
+        if profile not in PROFILES:
+            logger.warning(f"Unknown pacing profile '{profile}', using 'fixed'")
+            profile = 'fixed'
+        self.profile = profile
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.decrease_step = decrease_step
+        self.backoff_factor = backoff_factor
+        self.backoff_cooldown = backoff_cooldown
+        self.slow_load_seconds = slow_load_seconds
+        self.captcha_url_patterns = list(captcha_url_patterns if captcha_url_patterns is not None else PACING_CAPTCHA_URL_PATTERNS)
+
+        self.scale = 1.0
+        self.peak_scale = 1.0
+        self.healthy_signals = 0
+        self.throttle_signals = 0
+        self.backoffs = 0
+        self.slept = 0.0
+        self._last_backoff = None
+        self._pages = set()
+
+    @property
+    def adaptive(self) -> bool:
+        return self.profile == 'adaptive'
+
+    def delay(self, range_tuple: Tuple[float, float]) -> float:
+        """Get a random delay within a SLEEP_* range, scaled by the current pace."""
+        return random.uniform(range_tuple[0], range_tuple[1]) * self.scale
+
+    async def sleep(self, range_tuple: Tuple[float, float]) -> float:
+        """
+        Sleep for a random, paced duration within a SLEEP_* range.
+
+        Returns:
+            float: Seconds slept
+        """
+        duration = self.delay(range_tuple)
+        logger.debug(f"Human-like sleep for {duration:.2f} seconds (pace x{self.scale:.2f})")
+        self.slept += duration
+        await asyncio.sleep(duration)
+        return duration
+
+    def record_healthy(self, load_seconds: Optional[float] = None):
+        """
+        Record a healthy response: shrink the delays by one step.
+        A load slower than slow_load_seconds counts as throttling instead.
+
+        Args:
+            load_seconds: How long the page/panel took to load, if measured
+        """
+        if load_seconds is not None and load_seconds > self.slow_load_seconds:
+            self.record_throttling(f"slow load ({load_seconds:.1f}s)")
+            return
+        self.healthy_signals += 1
+        if not self.adaptive:
+            return
+        scale = max(self.min_scale, self.scale - self.decrease_step)
+        if scale < self.scale:
+            self.scale = scale
+            logger.debug(f"Pacing: healthy response, delays x{self.scale:.2f}")
+
+    def record_throttling(self, reason: str):
+        """
+        Record a sign of throttling: multiply the delays, at most once per cooldown.
+
+        Args:
+            reason: What was observed, for the log
+        """
+        self.throttle_signals += 1
+        now = time.monotonic()
+        if not self.adaptive:
+            logger.warning(f"Pacing: {reason} (fixed profile, delays unchanged)")
+            return
+        if self._last_backoff is not None and now - self._last_backoff < self.backoff_cooldown:
+            logger.debug(f"Pacing: {reason} during backoff cooldown, delays stay x{self.scale:.2f}")
+            return
+        self._last_backoff = now
+        self.backoffs += 1
+        previous = self.scale
+        self.scale = min(self.max_scale, self.scale * self.backoff_factor)
+        self.peak_scale = max(self.peak_scale, self.scale)
+        logger.warning(f"Pacing: {reason}, backing off - delays x{previous:.2f} -> x{self.scale:.2f}")
+
+    def attach(self, page):
+        """Watch a page's responses for HTTP 429 and CAPTCHA pages."""
+        if page not in self._pages:
+            page.on("response", self._on_response)
+            self._pages.add(page)
+
+    def detach(self, page):
+        """Stop watching a page."""
+        if page in self._pages:
+            page.remove_listener("response", self._on_response)
+            self._pages.discard(page)
+
+    def _on_response(self, response):
+        """Classify a response (called by Playwright for every response of an attached page)."""
+        try:
+            if response.status == 429:
+                self.record_throttling(f"HTTP 429 from {response.url[:80]}")
+            elif response.request.resource_type == 'document' and any(pattern in response.url for pattern in self.captcha_url_patterns):
+                self.record_throttling(f"CAPTCHA page {response.url[:80]}")
+        except Exception as e:
+            logger.debug(f"Pacing: could not classify response: {e}")
+
+    def log_summary(self):
+        """Log the controller's state at the end of a run."""
+        logger.info(f"Pacing ({self.profile}): delays x{self.scale:.2f} at the end (peak x{self.peak_scale:.2f}), "
+                    f"{self.healthy_signals} healthy / {self.throttle_signals} throttling signals, "
+                    f"{self.backoffs} backoffs, {self.slept:.0f}s slept")
+
+
+_pacer: Optional[PacingController] = None
+
+
+def get_pacer() -> PacingController:
+    """Get the current run's pacing controller (created on first use)."""
+    global _pacer
+    if _pacer is None:
+        _pacer = PacingController()
+    return _pacer
+
+
+def start_run(profile: str = PACING_PROFILE) -> PacingController:
+    """Start a new run's pacing controller, shared by all of its pages."""
+    global _pacer
+    _pacer = PacingController(profile=profile)
+    logger.info(f"Pacing profile: {_pacer.profile}")
+    return _pacer
@@ -0,0 +1,108 @@
+import logging
+from collections import Counter
+from typing import Iterable, Optional
+
+from config import BLOCKED_RESOURCE_TYPES, BLOCKED_URL_PATTERNS, ALLOWED_URL_PATTERNS
+
+logger = logging.getLogger(__name__)
+
+# Typical transfer size per resource type, used to estimate the bytes saved by aborted requests
+# (aborted requests have no size, so the summary is an estimate, not a measurement)
+ESTIMATED_BYTES_BY_RESOURCE_TYPE = {
+    'image': 25_000,
+    'media': 500_000,
+    'font': 40_000,
+    'stylesheet': 30_000,
+    'script': 60_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+    'other': 5_000,
+}
+
+
+class ResourceBlocker:
+    """Aborts browser requests the scrapers don't need (images, fonts, media, trackers)."""
+
+    def __init__(self, blocked_resource_types: Optional[Iterable[str]] = None,
+                 blocked_url_patterns: Optional[Iterable[str]] = None,
+                 allowed_url_patterns: Optional[Iterable[str]] = None):
+        """
+        Initialize the blocker.
+
+        Args:
+            blocked_resource_types: Playwright resource types to abort (defaults to config)
+            blocked_url_patterns: URL substrings to abort (defaults to config)
+            allowed_url_patterns: URL substrings that are never aborted, e.g. CAPTCHA and
+                anti-bot challenge resources (defaults to config)
+        """
+        self.blocked_resource_types = set(blocked_resource_types if blocked_resource_types is not None else BLOCKED_RESOURCE_TYPES)
+        self.blocked_url_patterns = list(blocked_url_patterns if blocked_url_patterns is not None else BLOCKED_URL_PATTERNS)
+        self.allowed_url_patterns = list(allowed_url_patterns if allowed_url_patterns is not None else ALLOWED_URL_PATTERNS)
+
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset the counters, e.g. when a long-lived context starts a new run."""
+        self.allowed_requests = 0
+        self.blocked_requests = 0
+        self.blocked_by_type = Counter()
+        self.estimated_bytes_saved = 0
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        Decide whether a request should be aborted.
+
+        Args:
+            resource_type: Playwright resource type of the request
+            url: Request URL
+
+        Returns:
+            bool: True if the request should be aborted
+        """
+        if any(pattern in url for pattern in self.allowed_url_patterns):
+            return False
+        if resource_type in self.blocked_resource_types:
+            return True
+        return any(pattern in url for pattern in self.blocked_url_patterns)
+
+    async def attach(self, context):
+        """
+        Install the route filter on a browser context (applies to all its pages).
+        
+        Resource types are only known per request, so every URL is routed. Playwright disables
+        the HTTP cache of a context as soon as it has any route (a narrower pattern would not
+        keep it), so allowed requests are not served from the profile's cache either.
+        """
+        await context.route("**/*", self._handle_route)
+        logger.info(f"Resource blocking enabled - types: {sorted(self.blocked_resource_types)}, "
+                    f"{len(self.blocked_url_patterns)} URL patterns, {len(self.allowed_url_patterns)} allow-listed patterns "
+                    f"(HTTP cache disabled for this context)")
+
+    async def _handle_route(self, route):
+        """Abort or continue a single request."""
+        request = route.request
+        resource_type = request.resource_type
+
+        try:
+            if self.should_block(resource_type, request.url):
+                self.blocked_requests += 1
+                self.blocked_by_type[resource_type] += 1
+                self.estimated_bytes_saved += ESTIMATED_BYTES_BY_RESOURCE_TYPE.get(resource_type, ESTIMATED_BYTES_BY_RESOURCE_TYPE['other'])
+                await route.abort()
+            else:
+                self.allowed_requests += 1
+                await route.continue_()
+        except Exception as e:
+            # The page may have navigated away or closed while the request was pending
+            logger.debug(f"Error routing request {request.url}: {e}")
+
+    def log_summary(self):
+        """Log how many requests were blocked during the run and the estimated bytes they would have cost."""
+        total = self.allowed_requests + self.blocked_requests
+        blocked_pct = (self.blocked_requests / total * 100) if total else 0.0
+        logger.info("Resource blocking summary:")
+        logger.info(f"  - Requests blocked: {self.blocked_requests}/{total} ({blocked_pct:.1f}%)")
+        logger.info(f"  - Estimated bytes not downloaded: ~{self.estimated_bytes_saved / (1024 * 1024):.1f} MB (per-type averages, not measured)")
+        if self.blocked_by_type:
+            by_type = ", ".join(f"{resource_type}: {count}" for resource_type, count in self.blocked_by_type.most_common())
+            logger.info(f"  - Blocked by type: {by_type}")
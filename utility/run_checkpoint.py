@@ -0,0 +1,136 @@
+import json
+import os
+import logging
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from config import CHECKPOINT_PATH
+
+logger = logging.getLogger(__name__)
+
+# Per-keyword counters tracked in the checkpoint
+COUNTER_FIELDS = ('jobs', 'duplicates', 'failed')
+
+
+class RunCheckpoint:
+    """Crash-safe progress record of a multi-keyword Google Jobs run."""
+
+    def __init__(self, output_file: str, path: str = CHECKPOINT_PATH, state: Optional[Dict] = None):
+        """
+        Initialize a checkpoint.
+
+        Args:
+            output_file: Output file of the run being tracked
+            path: Path of the checkpoint JSON file
+            state: Previously saved state (when resuming)
+        """
+        self.path = path
+        self.state = state or {
+            'output_file': output_file,
+            'started_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'updated_at': None,
+            'completed_keywords': [],
+            'keywords': {}
+        }
+
+    @property
+    def output_file(self) -> str:
+        return self.state['output_file']
+
+    @classmethod
+    def load(cls, path: str = CHECKPOINT_PATH) -> Optional['RunCheckpoint']:
+        """
+        Load the checkpoint of an interrupted run.
+
+        Args:
+            path: Path of the checkpoint JSON file
+
+        Returns:
+            RunCheckpoint or None: The saved checkpoint, or None if there is nothing to resume
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return cls(state['output_file'], path=path, state=state)
+        except Exception as e:
+            logger.error(f"Could not read checkpoint {path}: {e}")
+            return None
+
+    def save(self):
+        """Write the checkpoint atomically so a crash never leaves a half-written file."""
+        self.state['updated_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def is_completed(self, keyword: str) -> bool:
+        """Check whether a keyword was fully scraped."""
+        return keyword in self.state['completed_keywords']
+
+    def begin_keyword(self, keyword: str) -> Tuple[int, Dict[str, int]]:
+        """
+        Mark a keyword as started, carrying over the progress of an interrupted attempt.
+
+        Args:
+            keyword: Search keyword
+
+        Returns:
+            Tuple: (scroll position (number of job cards already visited) to resume from,
+                counters of the interrupted attempt, which the new attempt continues from)
+        """
+        entry = self.state['keywords'].get(keyword)
+        if entry is None:
+            entry = {'scroll_position': 0}
+            entry.update({name: 0 for name in COUNTER_FIELDS})
+            self.state['keywords'][keyword] = entry
+        else:
+            logger.info(f"Resuming keyword '{keyword}' from card {entry['scroll_position']} ({entry.get('jobs', 0)} jobs saved before the interruption)")
+
+        self.save()
+        return entry['scroll_position'], {name: entry.get(name, 0) for name in COUNTER_FIELDS}
+
+    def update_keyword(self, keyword: str, scroll_position: int, jobs: int, duplicates: int, failed: int):
+        """
+        Record the progress of the keyword being scraped.
+        Called after every saved job, so keep it to one small JSON rewrite.
+
+        Args:
+            keyword: Search keyword
+            scroll_position: Number of job cards visited so far
+            jobs, duplicates, failed: Counters of the keyword, including the interrupted attempts'
+        """
+        entry = self.state['keywords'].setdefault(keyword, {})
+        entry.pop('carried', None)  # Left by checkpoints of older versions
+        entry['scroll_position'] = scroll_position
+        for name, value in zip(COUNTER_FIELDS, (jobs, duplicates, failed)):
+            entry[name] = value
+        self.save()
+
+    def complete_keyword(self, keyword: str):
+        """Mark a keyword as fully scraped."""
+        if keyword not in self.state['completed_keywords']:
+            self.state['completed_keywords'].append(keyword)
+        self.save()
+
+    def get_totals(self) -> Dict[str, int]:
+        """Get the counters summed over all keywords of the run."""
+        return {
+            name: sum(entry.get(name, 0) for entry in self.state['keywords'].values())
+            for name in COUNTER_FIELDS
+        }
+
+    def finish(self):
+        """Remove the checkpoint once the run completed."""
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            logger.info("Run completed - checkpoint removed")
+        except Exception as e:
+            logger.error(f"Could not remove checkpoint {self.path}: {e}")
@@ -0,0 +1,91 @@
+import hashlib
+import logging
+from collections import Counter, OrderedDict
+from typing import Dict
+
+from config import SESSION_DEDUP_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+
+class SessionDedupIndex:
+    """
+    Run-scoped index of job postings already seen, shared by all keywords and workers.
+
+    Keys are 8-byte digests of the normalized title, company and location, kept in
+    an LRU-ordered dict capped at `max_entries` so memory stays bounded on long runs.
+    """
+
+    def __init__(self, max_entries: int = SESSION_DEDUP_MAX_ENTRIES):
+        """
+        Initialize the index.
+
+        Args:
+            max_entries: Maximum number of postings remembered (oldest are evicted first)
+        """
+        self.max_entries = max_entries
+        self._seen: OrderedDict = OrderedDict()
+        self.lookups = Counter()
+        self.hits = Counter()
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(basic_info: Dict) -> bytes:
+        """
+        Build the normalized identity of a posting.
+
+        Args:
+            basic_info: Basic job information (title, company, location)
+
+        Returns:
+            bytes: Digest of the normalized identity
+        """
+        parts = [' '.join(str(basic_info.get(field, '')).split()).casefold() for field in ('title', 'company', 'location')]
+        return hashlib.blake2b('|'.join(parts).encode('utf-8'), digest_size=8).digest()
+
+    def check_and_add(self, basic_info: Dict, keyword: str = '') -> bool:
+        """
+        Check whether a posting was already seen in this run, and remember it if not.
+
+        Args:
+            basic_info: Basic job information (title, company, location)
+            keyword: Keyword being scraped, for per-keyword hit rates
+
+        Returns:
+            bool: True if the posting was already seen in this run
+        """
+        key = self.make_key(basic_info)
+        self.lookups[keyword] += 1
+
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            self.hits[keyword] += 1
+            return True
+
+        self._seen[key] = None
+        if len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+            self.evictions += 1
+        return False
+
+    def add(self, basic_info: Dict):
+        """Remember a posting without counting a lookup (e.g. jobs saved before a resume)."""
+        key = self.make_key(basic_info)
+        self._seen[key] = None
+        self._seen.move_to_end(key)
+        if len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def log_summary(self):
+        """Log the per-keyword hit rates of the run."""
+        total_lookups = sum(self.lookups.values())
+        total_hits = sum(self.hits.values())
+        rate = (total_hits / total_lookups * 100) if total_lookups else 0.0
+        logger.info(f"Session dedup index: {len(self._seen)} postings, {total_hits}/{total_lookups} hits ({rate:.1f}%), {self.evictions} evictions")
+        for keyword, lookups in self.lookups.items():
+            hits = self.hits[keyword]
+            logger.info(f"  - '{keyword}': {hits}/{lookups} already seen this run ({hits / lookups * 100:.1f}%)")